@@ -1,4 +1,5 @@
-from .monitor_row_upsert_event import MonitorRowUpsertEvent
+from .monitor_rows_upsert_event import MonitorRowsUpsertEvent
+from .monitor_rows_removed_event import MonitorRowsRemovedEvent
 from .monitor_summary_update_event import MonitorSummaryUpdateEvent
 from .rule_sets_loaded_event import RuleSetsLoadedEvent
 from .rules_loaded_event import RulesLoadedEvent
@@ -9,6 +10,8 @@ from .rule_runner_state_event import RuleRunnerStateEvent
 from .monitor_snapshot import MonitorSnapShotEvent
 from .queue_runner_state_event import QueueRunnerStateEvent
 from .progress_status import ProgressStatus
+from .step_timings_update_event import StepTimingsUpdateEvent
+from .validation_progress_event import ValidationProgressEvent
 
 __all__ = [
     "UIEvent",
@@ -16,10 +19,13 @@ __all__ = [
     "SchemaErrorDialogEvent",
     "RulesLoadedEvent",
     "RuleSetsLoadedEvent",
-    "MonitorRowUpsertEvent",
+    "MonitorRowsUpsertEvent",
+    "MonitorRowsRemovedEvent",
     "MonitorSummaryUpdateEvent",
     "RuleRunnerStateEvent",
     "MonitorSnapShotEvent",
     "QueueRunnerStateEvent",
     "ProgressStatus",
+    "StepTimingsUpdateEvent",
+    "ValidationProgressEvent",
 ]
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class MonitorRowsRemovedEvent:
+    guids: list[str]
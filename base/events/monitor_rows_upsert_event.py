@@ -7,5 +7,5 @@ P = TypeVar("P")
 
 
 @dataclass
-class MonitorRowUpsertEvent(Generic[P]):
-    row: P
+class MonitorRowsUpsertEvent(Generic[P]):
+    rows: list[P]
@@ -5,9 +5,19 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from services.rules.models import Rule
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
 class RulesLoadedEvent:
-    rules: list[Rule]
+    """
+    Changes to the rules registry. `order` is the full guid order after the
+    change. With `reset` the page drops its forms and loads `added` as the
+    whole rule list.
+    """
+
+    added: list[Rule] = field(default_factory=list)
+    updated: list[Rule] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    order: list[str] = field(default_factory=list)
+    reset: bool = False
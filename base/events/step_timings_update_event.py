@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from services.monitor.models import TaskTimingSummary
+from dataclasses import dataclass
+
+
+@dataclass
+class StepTimingsUpdateEvent:
+    summaries: list[TaskTimingSummary]
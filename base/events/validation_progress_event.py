@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ValidationProgressEvent:
+    validated: int
+    total: int
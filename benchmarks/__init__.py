@@ -0,0 +1,3 @@
+# base and views import each other; load views first, the same way main.py
+# does, so the services the benchmarks use can be imported on their own.
+import views  # noqa: F401
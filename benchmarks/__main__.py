@@ -0,0 +1,119 @@
+"""
+Offline executor benchmark.
+
+    python -m benchmarks --rules 20 --queues 50 --latency-ms 50 --spinner-ms 400
+
+Serves the fake Intra site locally, runs the real rule and queue executors
+against it in a headless browser and prints rules/min and queues/min.
+"""
+
+import argparse
+
+from services.logger.adapters import LogAdapter
+from services.queue_runner import QueueGridIndex
+from services.queues.enums import QUEUEACTION
+
+from .console_log_sink import ConsoleLogSink
+from .executor_benchmark import ExecutorBenchmark
+from .fake_intra import FakeIntraConfig, FakeIntraServer
+from .models import BenchmarkResult
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the rule and queue executors against a fake Intra site.",
+    )
+    parser.add_argument("--rules", type=int, default=10, help="Rules to create.")
+    parser.add_argument("--queues", type=int, default=25, help="Queues to add.")
+    parser.add_argument(
+        "--latency-ms", type=int, default=50, help="Delay added to every request."
+    )
+    parser.add_argument(
+        "--spinner-ms",
+        type=int,
+        default=400,
+        help="How long the queue grid loading panel stays up.",
+    )
+    parser.add_argument(
+        "--no-delete",
+        action="store_true",
+        help="Skip deleting the added queues afterwards.",
+    )
+    parser.add_argument(
+        "--queue-index",
+        action="store_true",
+        help="Answer queue existence checks from a scraped queue grid index.",
+    )
+    parser.add_argument("--headed", action="store_true", help="Show the browser.")
+    parser.add_argument("--slow-mo", type=int, default=0, help="Playwright slow_mo.")
+    parser.add_argument(
+        "--export-dir", help="Write the step timelines to this directory."
+    )
+    parser.add_argument("--verbose", action="store_true", help="Print executor logs.")
+    return parser.parse_args()
+
+
+def print_result(result: BenchmarkResult) -> None:
+    print(
+        f"{result.name:<20} {result.succeeded:>4}/{result.attempted:<4} "
+        f"in {result.elapsed_seconds:7.1f}s  -> {result.per_minute:6.1f}/min"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    logger = LogAdapter(ConsoleLogSink(verbose=args.verbose))
+    config = FakeIntraConfig(latency_ms=args.latency_ms, spinner_ms=args.spinner_ms)
+
+    results: list[BenchmarkResult] = []
+    with FakeIntraServer(config) as server:
+        print(
+            f"Fake Intra at {server.base_url} "
+            f"(latency {config.latency_ms}ms, spinner {config.spinner_ms}ms)"
+        )
+        with ExecutorBenchmark(
+            server, logger, headless=not args.headed, slow_mo=args.slow_mo
+        ) as benchmark:
+            if args.rules > 0:
+                results.append(benchmark.run_rules(args.rules))
+            if args.queues > 0:
+                queue_index = QueueGridIndex() if args.queue_index else None
+                for action_type in (QUEUEACTION.ADD, QUEUEACTION.VERIFY_EXISTS):
+                    results.append(
+                        benchmark.run_queues(args.queues, action_type, queue_index)
+                    )
+                if not args.no_delete:
+                    results.append(
+                        benchmark.run_queues(
+                            args.queues, QUEUEACTION.DELETE, queue_index
+                        )
+                    )
+            cache_metrics = benchmark.browser_port.locator_cache_metrics()
+
+    print()
+    for result in results:
+        print_result(result)
+    print(
+        f"Locator cache: {cache_metrics.hits} hits, {cache_metrics.misses} misses "
+        f"({cache_metrics.hit_rate:.0%}), {cache_metrics.invalidations} resets"
+    )
+
+    for timer in (benchmark.rule_timer, benchmark.queue_timer):
+        slowest = timer.slowest_steps(5)
+        if not slowest:
+            continue
+        print(f"\nSlowest steps ({timer.run_name}):")
+        for summary in slowest:
+            print(
+                f"  {summary.task_key:<45} p50 {summary.p50_ms:7.0f}ms  "
+                f"p95 {summary.p95_ms:7.0f}ms  n={summary.count}"
+            )
+        if args.export_dir:
+            paths = timer.export(args.export_dir)
+            if paths:
+                print(f"  timeline: {paths[0]}")
+
+
+if __name__ == "__main__":
+    main()
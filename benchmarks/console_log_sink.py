@@ -0,0 +1,17 @@
+from base.enums import LOGLEVEL
+
+
+class ConsoleLogSink:
+    """
+    Minimal logger for LogAdapter that prints to stdout instead of the log
+    worker thread. Only warnings and errors are printed unless verbose is set.
+    """
+
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+
+    def insert(self, msg: str, level: LOGLEVEL, print_msg: bool = True) -> None:
+        if not print_msg:
+            return
+        if self.verbose or level in (LOGLEVEL.WARN, LOGLEVEL.ERROR):
+            print(f"{level}: {msg}")
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Route
+
+    from services.logger.adapters import LogAdapter
+    from .fake_intra import FakeIntraServer
+
+import os
+import re
+import time
+from urllib.parse import urlsplit
+
+from playwright.sync_api import sync_playwright
+
+from base.enums import INTRAVERSION
+from services.browser.adapters import PlaywrightBrowserAdapter
+from services.monitor.timing import StepTimingRecorder
+from services.profiles import ProfileRegistry
+from services.queue_runner import QueueGridIndex
+from services.queue_runner.executors import QueueExecutor
+from services.queue_runner.models import QueueExecutionContext, QueueRunnerState
+from services.queues.enums import QUEUEACTION
+from services.rule_runner.executors import RuleExecutor
+from services.rule_runner.models import RuleExecutionContext
+from services.rules import RuleBuilder
+from utils.files import PathManager
+
+from .fixtures import (
+    BENCHMARK_PROVIDER_INSTANCE,
+    BENCHMARK_PROVIDER_NAME,
+    benchmark_queue,
+    benchmark_rule_data,
+)
+from .models import BenchmarkResult
+
+INTRA_URL_PATTERN = re.compile(r"^https://[^/]+\.intradiem\.com/")
+
+
+class ExecutorBenchmark:
+    """
+    Runs the real RuleExecutor and QueueExecutor in one browser page against
+    the fake Intra site. Requests to https://<tenant>.intradiem.com are routed
+    to the local server, so the executors build their URLs unchanged and no
+    login is needed.
+    """
+
+    TENANT = "benchmark"
+
+    def __init__(
+        self,
+        server: FakeIntraServer,
+        logger: LogAdapter,
+        headless: bool = True,
+        slow_mo: int = 0,
+    ):
+        self.server = server
+        self.logger = logger
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.profile = ProfileRegistry().get_profile(INTRAVERSION.V10)
+        self.rule_builder = RuleBuilder(logger)
+        self.rule_timer = StepTimingRecorder("benchmark_rule_run")
+        self.queue_timer = StepTimingRecorder("benchmark_queue_run")
+
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._page = None
+        self._browser_port: PlaywrightBrowserAdapter | None = None
+
+    def logging(self, msg, level="INFO", print_msg=True) -> None:
+        msg = f"{self.__class__.__name__}: {msg}"
+        self.logger(msg, level, print_msg)
+
+    def start(self) -> None:
+        os.environ["PLAYWRIGHT_BROWSERS_PATH"] = PathManager.create_folder_in_app_data(
+            "playwright"
+        )
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(
+            headless=self.headless, slow_mo=self.slow_mo
+        )
+        self._context = self._browser.new_context()
+        self._context.route(INTRA_URL_PATTERN, self._forward_to_fake_intra)
+        self._page = self._context.new_page()
+        self._browser_port = PlaywrightBrowserAdapter(self._page)
+
+    def close(self) -> None:
+        if self._context:
+            self._context.close()
+        if self._browser:
+            self._browser.close()
+        if self._playwright:
+            self._playwright.stop()
+        self._context = self._browser = self._playwright = None
+
+    def __enter__(self) -> ExecutorBenchmark:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _forward_to_fake_intra(self, route: Route) -> None:
+        url = urlsplit(route.request.url)
+        local_url = f"{self.server.base_url}{url.path}"
+        if url.query:
+            local_url = f"{local_url}?{url.query}"
+        route.fulfill(response=route.fetch(url=local_url))
+
+    @property
+    def browser_port(self) -> PlaywrightBrowserAdapter:
+        if self._browser_port is None:
+            raise RuntimeError("Benchmark browser has not been started.")
+        return self._browser_port
+
+    def run_rules(self, count: int) -> BenchmarkResult:
+        succeeded = 0
+        start = time.perf_counter()
+        for index in range(count):
+            rule = self.rule_builder.build_rule(benchmark_rule_data(index))
+            context = RuleExecutionContext(
+                tenant=self.TENANT,
+                browser_port=self.browser_port,
+                rule=rule,
+                logger=self.logger,
+                should_stop=lambda: False,
+                profile=self.profile,
+                progress_cb=lambda event: None,
+                step_timer=self.rule_timer,
+            )
+            result = RuleExecutor(context).execute()
+            if result.success:
+                succeeded += 1
+            else:
+                self.logging(f"{rule.rule_name} failed: {result.message}", "WARN")
+
+        return BenchmarkResult(
+            name="Rules",
+            attempted=count,
+            succeeded=succeeded,
+            elapsed_seconds=time.perf_counter() - start,
+        )
+
+    def run_queues(
+        self,
+        count: int,
+        action_type: QUEUEACTION,
+        queue_index: QueueGridIndex | None = None,
+    ) -> BenchmarkResult:
+        """
+        Runs every queue through one QueueExecutor per row with a shared
+        QueueRunnerState, like a queue worker does, so the provider modal is
+        only opened once. Passing a queue_index answers existence checks
+        from the scraped grid like the runner does.
+        """
+        state = QueueRunnerState()
+        succeeded = 0
+        start = time.perf_counter()
+        for index in range(count):
+            queue = benchmark_queue(index, action_type)
+            context = QueueExecutionContext(
+                tenant=self.TENANT,
+                provider_name=BENCHMARK_PROVIDER_NAME,
+                provider_instance=BENCHMARK_PROVIDER_INSTANCE,
+                browser_port=self.browser_port,
+                state=state,
+                queue=queue,
+                action_type=action_type,
+                logger=self.logger,
+                should_stop=lambda: False,
+                profile=self.profile,
+                progress_cb=lambda event: None,
+                step_timer=self.queue_timer,
+                queue_index=queue_index,
+            )
+            result = QueueExecutor(context).execute()
+            if result.success:
+                succeeded += 1
+            else:
+                self.logging(f"{queue.queue_name} failed: {result.message}", "WARN")
+
+        return BenchmarkResult(
+            name=f"Queues {action_type}",
+            attempted=count,
+            succeeded=succeeded,
+            elapsed_seconds=time.perf_counter() - start,
+        )
@@ -0,0 +1,5 @@
+from .fake_intra_server import FakeIntraServer
+from .fake_intra_state import FakeIntraState
+from .models import FakeIntraConfig
+
+__all__ = ["FakeIntraServer", "FakeIntraState", "FakeIntraConfig"]
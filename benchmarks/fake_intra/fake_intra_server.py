@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import mimetypes
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import parse_qs, urlsplit
+
+from .fake_intra_state import FakeIntraState
+from .models import FakeIntraConfig
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "site")
+
+PAGES = {
+    "/": "home.html",
+    "/ManagerConsole/Delivery/Rules.aspx": "rules.html",
+    "/ManagerConsole/Delivery/Providers.aspx": "providers.html",
+}
+
+
+class _FakeIntraHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config: FakeIntraConfig, state: FakeIntraState):
+        super().__init__(address, _FakeIntraRequestHandler)
+        self.config = config
+        self.state = state
+
+
+class _FakeIntraRequestHandler(BaseHTTPRequestHandler):
+    server: _FakeIntraHTTPServer
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _delay(self) -> None:
+        if self.server.config.latency_ms > 0:
+            time.sleep(self.server.config.latency_ms / 1000)
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length == 0:
+            return {}
+        return json.loads(self.rfile.read(length).decode("utf-8"))
+
+    def do_GET(self) -> None:
+        self._delay()
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        if url.path in PAGES:
+            return self._send_file(PAGES[url.path])
+        if url.path == "/fake/config.js":
+            config = {"spinnerMs": self.server.config.spinner_ms}
+            body = f"window.FAKE_INTRA = {json.dumps(config)};".encode("utf-8")
+            return self._send(200, body, "application/javascript")
+        if url.path == "/fake/api/queues":
+            instance = query.get("instance", [""])[0]
+            return self._send_json(200, self.server.state.list_queues(instance))
+        if url.path.startswith("/fake/"):
+            return self._send_file(url.path.removeprefix("/fake/"))
+        self._send(404, b"Not Found", "text/plain")
+
+    def do_POST(self) -> None:
+        self._delay()
+        path = urlsplit(self.path).path
+        payload = self._read_json()
+        state = self.server.state
+
+        if path == "/fake/api/postback":
+            return self._send_json(200, {})
+        if path == "/fake/api/rules":
+            created = state.add_rule(
+                payload.get("name", ""), payload.get("category", "")
+            )
+            return self._send_json(201 if created else 409, {})
+        if path == "/fake/api/queues":
+            instance = payload.get("instance", "")
+            created = state.add_queue(
+                instance, payload.get("name", ""), payload.get("number", "")
+            )
+            return self._send_json(201 if created else 409, state.list_queues(instance))
+        if path == "/fake/api/queues/delete":
+            instance = payload.get("instance", "")
+            deleted = state.delete_queue(instance, payload.get("name", ""))
+            return self._send_json(200 if deleted else 404, state.list_queues(instance))
+        self._send(404, b"Not Found", "text/plain")
+
+    def _send_file(self, name: str) -> None:
+        path = os.path.normpath(os.path.join(SITE_DIR, name))
+        if not path.startswith(SITE_DIR) or not os.path.isfile(path):
+            return self._send(404, b"Not Found", "text/plain")
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        with open(path, "rb") as file:
+            self._send(200, file.read(), content_type)
+
+
+class FakeIntraServer:
+    """
+    Local HTTP replica of the Intradiem pages the rule and queue executors
+    drive. Every request waits latency_ms before it is answered, and the queue
+    grid shows its loading panel for spinner_ms after each add or delete.
+    """
+
+    def __init__(self, config: FakeIntraConfig | None = None):
+        self.config = config or FakeIntraConfig()
+        self.state = FakeIntraState()
+        self._httpd: _FakeIntraHTTPServer | None = None
+        self._thread: Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("Fake Intra server has not been started.")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        if self._httpd is None:
+            self._httpd = _FakeIntraHTTPServer(
+                (self.config.host, self.config.port), self.config, self.state
+            )
+            self._thread = Thread(
+                target=self._httpd.serve_forever,
+                name="FakeIntraServer",
+                daemon=True,
+            )
+            self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._httpd = None
+        self._thread = None
+
+    def __enter__(self) -> FakeIntraServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from threading import Lock
+
+
+class FakeIntraState:
+    """
+    In-memory data behind the fake site: submitted rules and the ACD queues of
+    each provider instance. Requests arrive on server threads, so every access
+    is lock protected.
+    """
+
+    def __init__(self):
+        self._rules: dict[str, str] = {}
+        self._queues: dict[str, dict[str, str]] = {}
+        self._lock = Lock()
+
+    def add_rule(self, name: str, category: str) -> bool:
+        with self._lock:
+            if name in self._rules:
+                return False
+            self._rules[name] = category
+            return True
+
+    def rule_count(self) -> int:
+        with self._lock:
+            return len(self._rules)
+
+    def list_queues(self, instance: str) -> list[dict[str, str]]:
+        with self._lock:
+            queues = self._queues.get(instance, {})
+            return [{"name": name, "number": number} for name, number in queues.items()]
+
+    def add_queue(self, instance: str, name: str, number: str) -> bool:
+        with self._lock:
+            queues = self._queues.setdefault(instance, {})
+            if name in queues or number in queues.values():
+                return False
+            queues[name] = number
+            return True
+
+    def delete_queue(self, instance: str, name: str) -> bool:
+        with self._lock:
+            queues = self._queues.get(instance, {})
+            return queues.pop(name, None) is not None
+
+    def queue_count(self) -> int:
+        with self._lock:
+            return sum(len(queues) for queues in self._queues.values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rules.clear()
+            self._queues.clear()
@@ -0,0 +1,3 @@
+from .fake_intra_config import FakeIntraConfig
+
+__all__ = ["FakeIntraConfig"]
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class FakeIntraConfig:
+    host: str = "127.0.0.1"
+    port: int = 0
+    latency_ms: int = 50
+    spinner_ms: int = 400
@@ -0,0 +1,103 @@
+// Shared behaviour for the fake Intradiem pages. Only the widgets the
+// executors touch are modelled: Telerik style combo boxes, cascading provider
+// menus, postbacks and loading panels.
+(function () {
+  const config = window.FAKE_INTRA || { spinnerMs: 0 };
+
+  function sleep(ms) {
+    return new Promise((resolve) => setTimeout(resolve, ms));
+  }
+
+  async function request(method, url, body) {
+    const options = { method, headers: { "Content-Type": "application/json" } };
+    if (body !== undefined) {
+      options.body = JSON.stringify(body);
+    }
+    const response = await fetch(url, options);
+    const text = await response.text();
+    return { status: response.status, data: text ? JSON.parse(text) : null };
+  }
+
+  function postback() {
+    return request("POST", "/fake/api/postback", {});
+  }
+
+  function show(element) {
+    if (element) {
+      element.style.display = "";
+    }
+  }
+
+  function hide(element) {
+    if (element) {
+      element.style.display = "none";
+    }
+  }
+
+  async function withLoadingPanel(panel, work) {
+    show(panel);
+    try {
+      const result = await work();
+      await sleep(config.spinnerMs);
+      return result;
+    } finally {
+      hide(panel);
+    }
+  }
+
+  // Combo boxes: "<id>_Arrow" opens "<id>_DropDown", which holds div > ul > li.
+  // Picking an item writes "<id>_Input" and closes the list unless the list
+  // allows several checked items.
+  document.addEventListener("click", (event) => {
+    const arrow = event.target.closest('[id$="_Arrow"]');
+    if (arrow) {
+      const list = document.getElementById(
+        arrow.id.replace(/_Arrow$/, "_DropDown")
+      );
+      if (list) {
+        list.classList.toggle("open");
+      }
+      return;
+    }
+
+    const item = event.target.closest(".rcbSlide li");
+    if (item) {
+      const list = item.closest(".rcbSlide");
+      const value = item.textContent.trim();
+      if (list.dataset.multiple !== undefined) {
+        item.classList.toggle("rcbChecked");
+      } else {
+        const input = document.getElementById(
+          list.id.replace(/_DropDown$/, "_Input")
+        );
+        if (input) {
+          input.value = value;
+        }
+        list.classList.remove("open");
+      }
+      list.dispatchEvent(
+        new CustomEvent("fake:select", { detail: value, bubbles: true })
+      );
+      return;
+    }
+
+    // Provider menus reveal the next menu (or panel) named in data-next.
+    const menuItem = event.target.closest(".RadMenu li");
+    if (menuItem) {
+      const menu = menuItem.closest(".RadMenu");
+      menu.querySelectorAll("li").forEach((li) => li.classList.remove("rmSelected"));
+      menuItem.classList.add("rmSelected");
+      show(document.getElementById(menu.dataset.next));
+    }
+  });
+
+  window.FakeIntra = {
+    config,
+    sleep,
+    request,
+    postback,
+    show,
+    hide,
+    withLoadingPanel,
+  };
+})();
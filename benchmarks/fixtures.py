@@ -0,0 +1,57 @@
+from uuid import uuid4
+
+from services.queues.enums import QUEUEACTION
+from services.queues.models import Queue
+
+# Names the fake site lists. Rules and queues built here only pick from them.
+BENCHMARK_PROVIDER_NAME = "Benchmark ACD"
+BENCHMARK_PROVIDER_INSTANCE = "Benchmark ACD Instance"
+
+
+def benchmark_rule_data(index: int) -> dict:
+    """
+    A frequency based rule with one stats condition and one email action, the
+    shape of the rule sets shipped with the app.
+    """
+    return {
+        "rule_name": f"Benchmark Rule {index:04d}",
+        "guid": str(uuid4()),
+        "rule_category": "Other - Admin",
+        "frequency_based": {"time_interval": 5},
+        "conditions": [
+            {
+                "provider_category": "ACD",
+                "provider_instance": BENCHMARK_PROVIDER_INSTANCE,
+                "provider_condition": "Calls in Queue - By Queue",
+                "details": {
+                    "condition_type": "stats",
+                    "equality_operator": "Greater Than or Equal To",
+                    "equality_threshold": 5,
+                    "queues_source": "queues",
+                },
+            }
+        ],
+        "actions": [
+            {
+                "provider_category": "Communications",
+                "provider_instance": "Email Provider Instance",
+                "provider_condition": "Send Email",
+                "details": {
+                    "action_type": "email",
+                    "email_subject": f"Benchmark Rule {index:04d}",
+                    "email_body": "Calls are waiting in queue.",
+                    "email_address": "benchmark@example.com",
+                },
+            }
+        ],
+    }
+
+
+def benchmark_queue(index: int, action_type: QUEUEACTION) -> Queue:
+    return Queue(
+        guid=str(uuid4()),
+        queue_name=f"Benchmark Queue {index:04d}",
+        queue_number=str(90000 + index),
+        row_number=index + 1,
+        action_type=action_type,
+    )
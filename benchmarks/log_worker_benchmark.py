@@ -0,0 +1,77 @@
+"""
+Log worker throughput benchmark.
+
+    python -m benchmarks.log_worker_benchmark --lines 100000
+
+Starts a LogWorker at DEBUG writing to a temporary log file, queues every
+line up front the way a chatty executor run does, then stops the worker
+and waits for it to drain. Prints the lines written per second and how
+many log_signal emits it took.
+"""
+
+import argparse
+import tempfile
+import time
+
+from PySide6.QtCore import Qt
+
+from base.enums import LOGLEVEL
+from services.logger.log_worker import LogWorker
+
+
+def run(lines: int) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        worker = LogWorker(
+            log_file_path=f"{folder}/",
+            log_file_name="benchmark.log",
+            log_file_max_mbs=5,
+            log_backup_count=2,
+            log_keep_files_days=1,
+            log_print_logs=False,
+            log_level=LOGLEVEL.DEBUG,
+        )
+        emitted = {"signals": 0, "lines": 0}
+
+        def on_logs(logs) -> None:
+            emitted["signals"] += 1
+            emitted["lines"] += len(logs) if isinstance(logs, list) else 1
+
+        # Counted on the worker thread, no event loop is needed.
+        worker.log_signal.connect(on_logs, Qt.ConnectionType.DirectConnection)
+
+        levels = [LOGLEVEL.DEBUG, LOGLEVEL.INFO, LOGLEVEL.WARN, LOGLEVEL.ERROR]
+        for index in range(lines):
+            worker.insert_log(
+                (
+                    levels[index % len(levels)],
+                    f"RuleExecutor: clicking selector #field-{index}",
+                    False,
+                )
+            )
+
+        start = time.perf_counter()
+        worker.start()
+        worker.stop()
+        worker.wait()
+        elapsed = time.perf_counter() - start
+        worker.cleanup()
+
+    print(
+        f"{emitted['lines']} lines in {elapsed:6.3f}s -> "
+        f"{emitted['lines'] / elapsed:10.0f} lines/s  "
+        f"({emitted['signals']} log_signal emits)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.log_worker_benchmark",
+        description="Measure LogWorker file write throughput.",
+    )
+    parser.add_argument("--lines", type=int, default=100_000)
+    args = parser.parse_args()
+    run(args.lines)
+
+
+if __name__ == "__main__":
+    main()
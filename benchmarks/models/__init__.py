@@ -0,0 +1,3 @@
+from .benchmark_result import BenchmarkResult
+
+__all__ = ["BenchmarkResult"]
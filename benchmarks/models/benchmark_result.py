@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    attempted: int
+    succeeded: int
+    elapsed_seconds: float
+
+    @property
+    def failed(self) -> int:
+        return self.attempted - self.succeeded
+
+    @property
+    def per_minute(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.succeeded / self.elapsed_seconds * 60
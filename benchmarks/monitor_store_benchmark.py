@@ -0,0 +1,101 @@
+"""
+Monitor store micro-benchmark.
+
+    python -m benchmarks.monitor_store_benchmark --rows 500 1000 5000 --events 20
+
+Replays a queue run through QueueMonitorStore: every row goes pending,
+then through a number of running steps, then to success or failure. Prints
+the average cost per upsert for each row count next to a full rescan of
+the rows (how the summary used to be recalculated) and checks that both
+produce the same RunSummary.
+"""
+
+import argparse
+import time
+from uuid import uuid4
+
+from services.monitor.queue_monitor import QueueMonitorStore
+from services.monitor.queue_monitor.queue_monitor_store import QUEUE_SUMMARY_BUCKETS
+from services.monitor.queue_monitor.models import QueueRunRow
+from services.monitor.models import RunSummary
+from services.monitor.summary import RunSummaryCounter
+from services.queue_runner.enums import QEXECUTORTASK, QUEUEEXECSTATUS, QUEUERUNSTATUS
+
+
+def rescan_summary(store: QueueMonitorStore) -> RunSummary:
+    counter = RunSummaryCounter(QUEUE_SUMMARY_BUCKETS)
+    for row in store.rows.values():
+        counter.add(row.status)
+    return counter.summary()
+
+
+def run_events(row_count: int, events_per_row: int) -> list[QueueRunRow]:
+    guids = [str(uuid4()) for _ in range(row_count)]
+    emitted_at = 0
+    events = []
+
+    def event(index: int, guid: str, status) -> QueueRunRow:
+        nonlocal emitted_at
+        emitted_at += 1
+        return QueueRunRow(
+            queue_guid=guid,
+            queue_row=f"Row {index + 2}",
+            queue_name=f"Queue {index:05d}",
+            status=status,
+            task=QEXECUTORTASK.START,
+            emitted_at=emitted_at,
+        )
+
+    for index, guid in enumerate(guids):
+        events.append(event(index, guid, QUEUERUNSTATUS.PENDING))
+    for index, guid in enumerate(guids):
+        for _ in range(events_per_row):
+            events.append(event(index, guid, QUEUEEXECSTATUS.RUNNING))
+        final = QUEUERUNSTATUS.FAILED if index % 10 == 0 else QUEUERUNSTATUS.SUCCESS
+        events.append(event(index, guid, final))
+    return events
+
+
+def replay(events: list[QueueRunRow], rescan: bool) -> tuple[float, RunSummary]:
+    store = QueueMonitorStore()
+    start = time.perf_counter()
+    for row in events:
+        store.upsert_row(row)
+        summary = rescan_summary(store) if rescan else store.get_summary()
+    elapsed = time.perf_counter() - start
+    return elapsed / len(events), summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.monitor_store_benchmark",
+        description="Measure the per-event cost of monitor store upserts.",
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[500, 1000, 5000])
+    parser.add_argument("--events", type=int, default=20, help="Events per row.")
+    parser.add_argument(
+        "--rescan-max-rows",
+        type=int,
+        default=1000,
+        help="Skip the full rescan above this many rows.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'rows':>6} {'events':>8} {'incremental':>14} {'full rescan':>14}")
+    for row_count in args.rows:
+        events = run_events(row_count, args.events)
+        per_event, summary = replay(events, rescan=False)
+        rescan_text = "skipped"
+        if row_count <= args.rescan_max_rows:
+            rescan_per_event, rescan_result = replay(events, rescan=True)
+            if rescan_result != summary:
+                raise SystemExit(f"Summary mismatch: {summary} != {rescan_result}")
+            rescan_text = f"{rescan_per_event * 1e6:10.2f} us"
+        print(
+            f"{row_count:>6} {len(events):>8} {per_event * 1e6:10.2f} us "
+            f"{rescan_text:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
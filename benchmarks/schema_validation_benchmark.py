@@ -0,0 +1,80 @@
+"""
+Schema validation micro-benchmark.
+
+    python -m benchmarks.schema_validation_benchmark --rows 10000
+
+Validates generated queue rows with a validator built per row (how
+SchemaRegistry.get_validator used to work) and with the cached validator,
+and prints rows/sec for both.
+"""
+
+import argparse
+import time
+import warnings
+from uuid import uuid4
+
+from jsonschema import Draft202012Validator
+
+from schemas.enums import SCHEMATYPE
+from schemas.registry import SchemaRegistry
+
+
+def queue_rows(count: int, invalid_every: int = 10) -> list[dict]:
+    rows = []
+    for index in range(count):
+        row = {
+            "guid": str(uuid4()),
+            "row_name": f"Row {index + 2}",
+            "queue_name": f"Queue {index:05d}",
+            "queue_number": str(10000 + index),
+            "action_type": "ADD",
+        }
+        if invalid_every and index % invalid_every == 0:
+            row["queue_number"] = ""
+        rows.append(row)
+    return rows
+
+
+def per_row_validator(registry: SchemaRegistry, schema_type: SCHEMATYPE):
+    schema = registry.get_schema(schema_type)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        from jsonschema.validators import RefResolver
+
+        resolver = RefResolver.from_schema(schema, store=registry.schema_store)
+        return Draft202012Validator(schema, resolver=resolver)
+
+
+def run(label: str, rows: list[dict], get_validator) -> None:
+    errors = 0
+    start = time.perf_counter()
+    for row in rows:
+        validator = get_validator(SCHEMATYPE.QUEUES)
+        errors += sum(1 for _ in validator.iter_errors(row))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<20} {len(rows)} rows in {elapsed:6.3f}s "
+        f"-> {len(rows) / elapsed:10.0f} rows/s ({errors} errors)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.schema_validation_benchmark",
+        description="Measure queue row schema validation throughput.",
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    registry = SchemaRegistry()
+    rows = queue_rows(args.rows)
+    run(
+        "validator per row",
+        rows,
+        lambda schema_type: per_row_validator(registry, schema_type),
+    )
+    run("cached validator", rows, registry.get_validator)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Queue sheet import benchmark.
+
+    python -m benchmarks.spreadsheet_import_benchmark --rows 50000
+
+Writes the same generated queue rows as .xlsx, .csv and .tsv files and
+reads each through SpreadsheetFileService, the way QueuesController does.
+Prints the time to the first row, the time to read every row and rows/sec
+for each format.
+"""
+
+import argparse
+import csv
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from services.logger.adapters import LogAdapter
+from services.files import SpreadsheetFileService
+
+from .console_log_sink import ConsoleLogSink
+
+HEADERS = ["queue_name", "queue_number", "action_type"]
+REQUIRED_HEADERS = {"queue_name", "queue_number"}
+
+
+def queue_rows(count: int) -> list[list[str]]:
+    return [
+        [f"Queue {index:06d}", str(100000 + index), "ADD"] for index in range(count)
+    ]
+
+
+def write_xlsx(path: Path, rows: list[list[str]]) -> None:
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(HEADERS)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def write_delimited(path: Path, rows: list[list[str]], delimiter: str) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as text_file:
+        writer = csv.writer(text_file, delimiter=delimiter)
+        writer.writerow(HEADERS)
+        writer.writerows(rows)
+
+
+def run(service: SpreadsheetFileService, path: Path) -> None:
+    start = time.perf_counter()
+    stream = service.open_stream(path, required_headers=REQUIRED_HEADERS)
+    if not stream.ok:
+        print(f"{path.suffix:<6} failed: {stream.message}")
+        return
+    count = 1 if next(stream.rows, None) else 0
+    first_row = time.perf_counter() - start
+    count += sum(1 for _ in stream.rows)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{path.suffix:<6} {count} rows  first row {first_row * 1000:8.1f}ms  "
+        f"all rows {elapsed:6.3f}s -> {count / elapsed:10.0f} rows/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.spreadsheet_import_benchmark",
+        description="Compare queue sheet import speed for xlsx, csv and tsv.",
+    )
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    service = SpreadsheetFileService(LogAdapter(ConsoleLogSink()))
+    rows = queue_rows(args.rows)
+    with tempfile.TemporaryDirectory() as folder:
+        paths = [
+            Path(folder, f"queues{suffix}") for suffix in (".xlsx", ".csv", ".tsv")
+        ]
+        write_xlsx(paths[0], rows)
+        write_delimited(paths[1], rows, ",")
+        write_delimited(paths[2], rows, "\t")
+        for path in paths:
+            run(service, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,7 @@ from services.profiles import ProfileRegistry
 from services.monitor.rule_monitor import RunMonitorStore
 from services.monitor.queue_monitor import QueueMonitorStore
 from services.rule_runner import RuleRunnerService
+from services.run_journal import RunJournalStore
 from services.rule_sets import (
     RuleSetBuilder,
     RuleSetRegistry,
@@ -123,12 +124,14 @@ class AppContext(QObject, metaclass=QSingleton):
             settings_service=self.settings_manager
         )
 
+        self.run_journal_store = RunJournalStore(self.log_adapter)
         self.rule_runner_service = RuleRunnerService(
             session=self.session_registry.for_provider(PROVIDERS.INTRA),
             auth_service=self.auth_service,
             browser_session_factory=self.browser_session_factory,
             logger=self.log_adapter,
             profile_registry=self.prolife_registry,
+            journal_store=self.run_journal_store,
         )
 
         self.queue_runner_service = QueueRunnerService(
@@ -137,6 +140,7 @@ class AppContext(QObject, metaclass=QSingleton):
             browser_session_factory=self.browser_session_factory,
             logger=self.log_adapter,
             profile_registry=self.prolife_registry,
+            journal_store=self.run_journal_store,
         )
 
         self.run_monitor_store = RunMonitorStore()
@@ -206,19 +210,22 @@ class AppContext(QObject, metaclass=QSingleton):
         # CONNECTIONS
         ## Rule Runner
         self.rule_runner_service.task_progress.connect(
-            self.rules_monitor_controller.handle_task_progress_event
+            self.rules_monitor_controller.handle_task_progress_events
         )
 
         self.rule_runner_service.runner_life_cyle.connect(
             self.rules_monitor_controller.handle_runner_lifecyle
         )
+        self.rule_runner_service.step_timings.connect(
+            self.rules_monitor_controller.handle_step_timings
+        )
 
         self.rules_monitor_controller.request_remove.connect(
             self.rules_controller.remove_rules_by_guids
         )
 
         self.queue_runner_service.task_progress.connect(
-            self.queues_monitor_controller.handle_task_progress_event
+            self.queues_monitor_controller.handle_task_progress_events
         )
 
         self.queue_runner_service.runner_life_cyle.connect(
@@ -281,5 +288,6 @@ class AppContext(QObject, metaclass=QSingleton):
         self.session_registry.save_all()
 
     def _finalize_app_shut_down(self):
+        self.browser_session_factory.shutdown()
         self.logger.request_stop()
         self.app_shut_down_confirmed.emit()
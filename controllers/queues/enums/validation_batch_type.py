@@ -3,3 +3,4 @@ from enum import StrEnum
 
 class VALIDATIONBATCHTYPE(StrEnum):
     QUEUE_RUNNER = "queue_runner"
+    QUEUE_STREAM = "queue_stream"
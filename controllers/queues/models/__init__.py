@@ -1,5 +1,11 @@
+from .queue_stream_import import QueueStreamImport
 from .spread_sheet_import import SpreadSheetImport
 from .validation_queue_batch import ValidationQueueBatch
 from .validate_queues import ValidationQueues
 
-__all__ = ["SpreadSheetImport", "ValidationQueueBatch", "ValidationQueues"]
+__all__ = [
+    "QueueStreamImport",
+    "SpreadSheetImport",
+    "ValidationQueueBatch",
+    "ValidationQueues",
+]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import QThread
+
+    from services.files import SpreadsheetStreamWorker
+    from services.validation.models import SchemaError
+    from .spread_sheet_import import SpreadSheetImport
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class QueueStreamImport:
+    action: SpreadSheetImport
+    file_path: Path
+    reader: SpreadsheetStreamWorker
+    thread: QThread
+    row_estimate: int | None = None
+    rows_read: int = 0
+    rows_validated: int = 0
+    rows_invalid: int = 0
+    total_errors: int = 0
+    errors: list[SchemaError] = field(default_factory=list)
+    pending_batches: set[str] = field(default_factory=set)
+    chunk_requested: bool = False
+    reader_done: bool = False
+    runner_started: bool = False
@@ -5,19 +5,28 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from services.logger.adapters import LogAdapter
     from services.files import SpreadsheetFileService
+    from services.files.models import SheetsStreamResult
     from .models import SpreadSheetImport
     from .queues_validation_coordinator import QueuesValidationCoordinator
     from services.queues import QueueBuilder
     from services.settings.providers import SettingsQueueRunnerConfigProvider
     from services.queue_runner import QueueRunnerService
-from PySide6.QtCore import Signal, Slot
+from PySide6.QtCore import QMetaObject, Qt, QThread, Signal, Slot
 from base.enums import UIEVENTTYPE
-from base.events import UIEvent, SchemaErrorDialogEvent, QueueRunnerStateEvent
+from base.events import (
+    UIEvent,
+    SchemaErrorDialogEvent,
+    QueueRunnerStateEvent,
+    ValidationProgressEvent,
+)
 from services.queue_runner.models import QueueRunItem, QueueRunnerRequestPayload
 from services.queue_runner.enums import QUEUERUNNERLIFECYCLE
+from services.queues.enums import QUEUEACTION
+from services.queues.models import Queue
 from services.files.spreadsheet_file_service import SpreadsheetFileService
+from services.files import SpreadsheetStreamWorker
 from base import ControllerBase
-from .models import ValidationQueueBatch, ValidationQueues
+from .models import QueueStreamImport, ValidationQueueBatch, ValidationQueues
 from .enums import VALIDATIONBATCHTYPE
 from uuid import uuid4
 from services.base.models import JobRequest
@@ -27,6 +36,15 @@ from dataclasses import fields
 class QueuesController(ControllerBase):
     stop_runner_service = Signal()
 
+    REQUIRED_HEADERS = {"queue_name", "queue_number"}
+    # Sheets with more rows than this are streamed into the runner in chunks
+    # instead of being read and validated as a whole first.
+    STREAM_ROW_THRESHOLD = 5_000
+    STREAM_CHUNK_SIZE = 500
+    # How many queued rows the runner may have waiting before the next chunk
+    # is read.
+    STREAM_MAX_PENDING = STREAM_CHUNK_SIZE * 2
+
     def __init__(
         self,
         logger: LogAdapter,
@@ -43,15 +61,21 @@ class QueuesController(ControllerBase):
         self._settings_provider = settings_provider
         self._queue_runner_service = queue_runner_service
         self._validation_coordinator.batch_complete.connect(self.on_validation_complete)
+        self._validation_coordinator.batch_progress.connect(self.on_validation_progress)
         self._active_runners: dict[str, QueueRunnerRequestPayload] = {}
+        self._stream: QueueStreamImport | None = None
 
         # TODO convert to ui_event
         self._queue_runner_service.runner_life_cyle.connect(
             self.handle_runner_lifecycle
         )
+        self._queue_runner_service.run_refused.connect(self.handle_run_refused)
         self.stop_runner_service.connect(self._queue_runner_service.stop_current_run)
+        self._queue_runner_service.progress_status.connect(self._request_stream_chunk)
 
     def handle_runner_lifecycle(self, status: QUEUERUNNERLIFECYCLE):
+        if status == QUEUERUNNERLIFECYCLE.FINISHED and self._stream:
+            self._cancel_stream_import("Queue Runner finished before the import did.")
         self.ui_event.emit(
             UIEvent(
                 event_type=UIEVENTTYPE.DISPLAY,
@@ -59,6 +83,10 @@ class QueuesController(ControllerBase):
             )
         )
 
+    def handle_run_refused(self, message: str):
+        self._cancel_stream_import("Queue Runner did not start.")
+        self.send_toast_failure("Queue Runner Not Started", message)
+
     def import_file(self, action: SpreadSheetImport):
         if any(not getattr(action, field.name) for field in fields(action)):
             self.send_toast_failure(
@@ -66,10 +94,26 @@ class QueuesController(ControllerBase):
                 "All fields need to be populated in the queues form before starting the Queue Runner.",
             )
             return
-        import_res = self._spread_sheet_service.load(
-            action.file_location,
-            required_headers={"queue_name", "queue_number"},
+        if self._stream:
+            self.send_toast_failure(
+                "Queues Import Failed",
+                "A queue sheet is still being imported. Stop the runner or wait for it to finish.",
+            )
+            return
+
+        stream = self._spread_sheet_service.open_stream(
+            action.file_location, required_headers=self.REQUIRED_HEADERS
         )
+        # Sheets that do not record their size are streamed too, since they
+        # could be any length.
+        if stream.ok and (
+            stream.row_estimate is None
+            or stream.row_estimate > self.STREAM_ROW_THRESHOLD
+        ):
+            self._start_stream_import(action, stream)
+            return
+
+        import_res = self._spread_sheet_service.read_stream(stream)
         if import_res.ok:
             self.send_toast_success("Queues Import Succeeded", import_res.message)
             validate_payload = ValidationQueues(
@@ -84,7 +128,212 @@ class QueuesController(ControllerBase):
         else:
             self.send_toast_failure("Queues Import Failed", import_res.message)
 
+    def _start_stream_import(
+        self, action: SpreadSheetImport, stream: SheetsStreamResult
+    ):
+        login_config = self._settings_provider.get_queue_run_config()
+        if not login_config.login_valid or self._queue_runner_service.is_running():
+            stream.close()
+            if not login_config.login_valid:
+                self.send_toast_failure(
+                    "Login Settings Not Valid",
+                    "Please validate all of the login settings on the Settings Page.",
+                )
+            else:
+                self.send_toast_failure(
+                    "Queues Import Failed", "The Queue Runner is already running."
+                )
+            return
+
+        thread = QThread()
+        reader = SpreadsheetStreamWorker(stream, self.STREAM_CHUNK_SIZE, self.logger)
+        reader.moveToThread(thread)
+        reader.chunk_read.connect(self._on_stream_chunk)
+        reader.finished.connect(self._on_stream_read_done)
+        reader.failed.connect(self._on_stream_read_failed)
+        reader.closed.connect(thread.quit)
+        thread.finished.connect(reader.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self._stream = QueueStreamImport(
+            action=action,
+            file_path=stream.file_path,
+            reader=reader,
+            thread=thread,
+            row_estimate=stream.row_estimate,
+        )
+        thread.start()
+        row_count = (
+            f"about {stream.row_estimate}"
+            if stream.row_estimate
+            else "an unknown number of"
+        )
+        self._logging(
+            f"Streaming {row_count} rows from {stream.file_path} "
+            f"in chunks of {self.STREAM_CHUNK_SIZE}."
+        )
+        self.send_toast_success(
+            "Queues Import Started",
+            f"Importing {row_count} rows. Queues are run as they pass validation and invalid rows are skipped.",
+        )
+        self._request_stream_chunk()
+
+    @Slot()
+    def _request_stream_chunk(self):
+        """
+        Asks the reader for the next chunk once the last one has been
+        validated and the runner has worked through enough of its rows.
+        """
+        stream = self._stream
+        if (
+            not stream
+            or stream.reader_done
+            or stream.chunk_requested
+            or stream.pending_batches
+        ):
+            return
+        if (
+            stream.runner_started
+            and self._queue_runner_service.pending_count() >= self.STREAM_MAX_PENDING
+        ):
+            return
+        stream.chunk_requested = True
+        QMetaObject.invokeMethod(
+            stream.reader, "read_chunk", Qt.ConnectionType.QueuedConnection
+        )
+
+    @Slot(list)
+    def _on_stream_chunk(self, rows: list):
+        stream = self._stream
+        if not stream:
+            return
+        stream.chunk_requested = False
+        stream.rows_read += len(rows)
+        batch_id = self._validation_coordinator.validate_queues(
+            data=ValidationQueues(
+                provider_name=stream.action.provider_name,
+                provider_instance=stream.action.provider_instance,
+                file_path=stream.file_path,
+                rows=rows,
+            ),
+            batch_type=VALIDATIONBATCHTYPE.QUEUE_STREAM,
+        )
+        stream.pending_batches.add(batch_id)
+
+    @Slot(int)
+    def _on_stream_read_done(self, rows_read: int):
+        stream = self._stream
+        if not stream:
+            return
+        stream.reader_done = True
+        stream.chunk_requested = False
+        self._logging(f"Finished reading {rows_read} rows from {stream.file_path}.")
+        self._finish_stream_if_done()
+
+    @Slot(str)
+    def _on_stream_read_failed(self, message: str):
+        stream = self._stream
+        if not stream:
+            return
+        stream.reader_done = True
+        stream.chunk_requested = False
+        self.send_toast_failure(
+            "Queues Import Failed",
+            f"Stopped reading {stream.file_path} after {stream.rows_read} rows: {message}",
+        )
+        self._finish_stream_if_done()
+
+    def _on_stream_batch_validated(self, batch: ValidationQueueBatch):
+        stream = self._stream
+        if not stream or batch.batch_id not in stream.pending_batches:
+            return
+        stream.pending_batches.discard(batch.batch_id)
+        stream.rows_validated += batch.validation_total
+        stream.rows_invalid += len(batch.invalid_queues)
+        stream.total_errors += batch.total_errors
+        stream.errors.extend(batch.errors)
+
+        queues = self._queue_builder.build_queues(batch.valid_queues)
+        queue_items = [
+            QueueRunItem(queue.guid, queue, action_type=queue.action_type)
+            for queue in queues
+        ]
+        if queue_items and not stream.runner_started:
+            stream.runner_started = True
+            payload = QueueRunnerRequestPayload(
+                config=self._settings_provider.get_queue_run_config(),
+                queues=queue_items,
+                provider_instance=batch.provider_instance,
+                provider_name=batch.provider_name,
+            )
+            job_ref_id = str(uuid4())
+            self._active_runners[job_ref_id] = payload
+            self._queue_runner_service.start_run(
+                JobRequest(job_ref_id, None, payload), open_ended=True
+            )
+        elif queue_items and not self._queue_runner_service.add_queues(queue_items):
+            self._cancel_stream_import("Queue Runner stopped before the import did.")
+            return
+
+        self._request_stream_chunk()
+        self._finish_stream_if_done()
+
+    def _finish_stream_if_done(self):
+        stream = self._stream
+        if not stream or not stream.reader_done or stream.pending_batches:
+            return
+        self._stream = None
+        if stream.runner_started:
+            self._queue_runner_service.close_run()
+
+        type_name = "Queue Import"
+        if stream.errors:
+            message = (
+                f"{type_name} Finished. {stream.rows_invalid} of {stream.rows_validated} rows "
+                f"were skipped with {stream.total_errors} errors. View Errors Dialog for more details"
+            )
+            self.send_toast_failure(f"{type_name} Skipped Rows", message)
+            self.ui_event.emit(
+                UIEvent(
+                    UIEVENTTYPE.DISPLAY,
+                    payload=SchemaErrorDialogEvent(errors=stream.errors),
+                )
+            )
+        else:
+            self.send_toast_success(
+                f"{type_name} Suceeded",
+                f"{type_name} Suceeded. 0 errors found in {stream.rows_validated} rows.",
+            )
+
+    def _cancel_stream_import(self, reason: str):
+        stream = self._stream
+        if not stream:
+            return
+        self._stream = None
+        self._logging(
+            f"Stream import of {stream.file_path} cancelled after {stream.rows_read} rows. {reason}",
+            "WARN",
+        )
+        QMetaObject.invokeMethod(
+            stream.reader, "close", Qt.ConnectionType.QueuedConnection
+        )
+
+    def on_validation_progress(self, batch: ValidationQueueBatch):
+        if batch.batch_type == VALIDATIONBATCHTYPE.QUEUE_STREAM:
+            return
+        self.ui_event.emit(
+            UIEvent(
+                event_type=UIEVENTTYPE.DISPLAY,
+                payload=ValidationProgressEvent(
+                    batch.validation_total, batch.batch_total
+                ),
+            )
+        )
+
     def on_validation_complete(self, batch: ValidationQueueBatch):
+        if batch.batch_type == VALIDATIONBATCHTYPE.QUEUE_STREAM:
+            self._on_stream_batch_validated(batch)
+            return
         self._display_validation(batch, "Queue Import")
         if batch.errors:
             return
@@ -129,5 +378,54 @@ class QueuesController(ControllerBase):
         self.send_toast_failure(title=title, message=message)
         self.ui_event.emit(error_event)
 
+    def resume_last_run(self):
+        """
+        Runs the queues from the last queue run's journal that never
+        succeeded, skipping the ones that were already done.
+        """
+        if self._stream or self._queue_runner_service.is_running():
+            self.send_toast_failure(
+                "Resume Run Failed", "The Queue Runner is already running."
+            )
+            return
+        journal = self._queue_runner_service.last_run_journal()
+        remaining = journal.remaining_items if journal else []
+        if not remaining:
+            self.send_toast_failure(
+                "Nothing to Resume", "The last queue run has no unfinished queues."
+            )
+            return
+
+        login_config = self._settings_provider.get_queue_run_config()
+        if not login_config.login_valid:
+            self.send_toast_failure(
+                "Login Settings Not Valid",
+                "Please validate all of the login settings on the Settings Page.",
+            )
+            return
+
+        queues = [
+            Queue(**{**item.data, "action_type": QUEUEACTION(item.data["action_type"])})
+            for item in remaining
+        ]
+        payload = QueueRunnerRequestPayload(
+            config=login_config,
+            queues=[
+                QueueRunItem(queue.guid, queue, action_type=queue.action_type)
+                for queue in queues
+            ],
+            provider_instance=journal.meta.get("provider_instance", ""),
+            provider_name=journal.meta.get("provider_name", ""),
+            resumed_from=journal.run_id,
+        )
+        self.send_toast_success(
+            "Resuming Queue Run",
+            f"Skipping {journal.completed_count} completed queues and running {len(queues)}.",
+        )
+        job_ref_id = str(uuid4())
+        self._active_runners[job_ref_id] = payload
+        self._queue_runner_service.start_run(JobRequest(job_ref_id, None, payload))
+
     def handle_stop_runner(self):
+        self._cancel_stream_import("Queue Runner stopped.")
         self.stop_runner_service.emit()
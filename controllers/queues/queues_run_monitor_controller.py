@@ -12,7 +12,8 @@ from PySide6.QtCore import Signal, Slot
 
 from base.enums import UIEVENTTYPE
 from base.events import (
-    MonitorRowUpsertEvent,
+    MonitorRowsUpsertEvent,
+    MonitorRowsRemovedEvent,
     MonitorSummaryUpdateEvent,
     MonitorSnapShotEvent,
     ProgressStatus,
@@ -36,29 +37,34 @@ class QueuesRunMonitorController(ControllerBase):
     def handle_runner_lifecyle(self, status: QUEUERUNNERLIFECYCLE):
         pass
 
-    @Slot(object)
-    def handle_task_progress_event(self, event: QueueProgressEvent):
-        row = QueueRunRow(
-            queue_guid=event.queue_guid,
-            queue_row=event.queue_row,
-            queue_name=event.queue_name,
-            status=event.status,
-            task=event.task,
-            emitted_at=event.emitted_at,
-            retry_count=event.retry_count,
-            message=event.message,
-            started_at=event.started_at,
-            finished_at=event.finished_at,
-        )
-        self.run_store.upsert_row(row)
-        self._emit_row_updated(row)
+    @Slot(list)
+    def handle_task_progress_events(self, events: list[QueueProgressEvent]):
+        rows: list[QueueRunRow] = []
+        for event in events:
+            row = QueueRunRow(
+                queue_guid=event.queue_guid,
+                queue_row=event.queue_row,
+                queue_name=event.queue_name,
+                status=event.status,
+                task=event.task,
+                emitted_at=event.emitted_at,
+                retry_count=event.retry_count,
+                message=event.message,
+                started_at=event.started_at,
+                finished_at=event.finished_at,
+            )
+            if self.run_store.upsert_row(row) is row:
+                rows.append(row)
+
+        if rows:
+            self._emit_rows_updated(rows)
         self._emit_summary_updated(self.run_store.get_summary())
 
-    def _emit_row_updated(self, row: QueueRunRow):
+    def _emit_rows_updated(self, rows: list[QueueRunRow]):
         self.ui_event.emit(
             UIEvent(
                 event_type=UIEVENTTYPE.DISPLAY,
-                payload=MonitorRowUpsertEvent[QueueRunRow](row=row),
+                payload=MonitorRowsUpsertEvent[QueueRunRow](rows=rows),
             )
         )
 
@@ -91,6 +97,11 @@ class QueuesRunMonitorController(ControllerBase):
 
     def remove_succeed(self):
         succeed_guids = self.run_store.remove_succeeded()
-        snap_shot = self.run_store.get_rows_snapshot()
         self.request_remove.emit(succeed_guids)
-        self._emit_snap_shot(self.run_store.get_summary(), snap_shot)
+        self.ui_event.emit(
+            UIEvent(
+                event_type=UIEVENTTYPE.DISPLAY,
+                payload=MonitorRowsRemovedEvent(guids=succeed_guids),
+            )
+        )
+        self._emit_summary_updated(self.run_store.get_summary())
@@ -5,7 +5,10 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from services.validation import ValidationService
     from services.base.models import JobResponse
-    from services.validation.models import ValidationResponse, SchemaValidateResponse
+    from services.validation.models import (
+        ValidationBatchResponse,
+        SchemaValidateResponse,
+    )
     from services.logger.adapters import LogAdapter
     from services.files.models import ImportedSheetsRow
 
@@ -13,12 +16,13 @@ from uuid import uuid4
 from PySide6.QtCore import Signal, Slot
 from base.enums import LOGLEVEL
 from schemas.enums import SCHEMATYPE
+from services.base.enums import JOBSTATUS
 from services.base.models import JobRequest
 from services.validation.enums import VALIDATEJOBTYPE
 from services.validation.models import (
     SchemaValidatePayload,
-    ValidationRequest,
-    ValidationResponse,
+    ValidationBatchRequest,
+    ValidationBatchResponse,
 )
 
 
@@ -30,17 +34,20 @@ from pathlib import Path
 
 class QueuesValidationCoordinator(ControllerBase):
     batch_complete = Signal(object)
+    batch_progress = Signal(object)
 
     def __init__(self, logger: LogAdapter, validation_service: ValidationService):
         super().__init__(logger)
         self.validation_service = validation_service
 
-        self._active_jobs: dict[str, ImportedSheetsRow] = {}
+        self._active_jobs: dict[str, dict[str, ImportedSheetsRow]] = {}
         self._active_batches: dict[str, ValidationQueueBatch] = {}
         # CONNECTIONS
         self.validation_service.task_complete.connect(self.on_validation_complete)
 
-    def validate_queues(self, data: ValidationQueues, batch_type: VALIDATIONBATCHTYPE):
+    def validate_queues(
+        self, data: ValidationQueues, batch_type: VALIDATIONBATCHTYPE
+    ) -> str:
         file_name = Path(data.file_path).name
         batch_id = str(uuid4())
         batch = ValidationQueueBatch(
@@ -54,6 +61,8 @@ class QueuesValidationCoordinator(ControllerBase):
         )
         self._active_batches[batch_id] = batch
 
+        payloads = []
+        batch_jobs = self._active_jobs.setdefault(batch_id, {})
         for queue in data.rows:
             queue_guid = str(uuid4())
 
@@ -62,54 +71,79 @@ class QueuesValidationCoordinator(ControllerBase):
                 "row_name": f"Row {queue.row_number}",
                 **queue.values,
             }
-            payload = SchemaValidatePayload(
-                schema_type=SCHEMATYPE.QUEUES, data=queue_row
+            payloads.append(
+                SchemaValidatePayload(schema_type=SCHEMATYPE.QUEUES, data=queue_row)
             )
-            job = JobRequest(
-                id=batch_id,
-                task=None,
-                payload=ValidationRequest(kind=VALIDATEJOBTYPE.SCHEMA, data=payload),
-            )
-            self._active_jobs[queue_guid] = queue
-            self.validation_service.validate(job)
+            batch_jobs[queue_guid] = queue
+
+        job = JobRequest(
+            id=batch_id,
+            task=None,
+            payload=ValidationBatchRequest(kind=VALIDATEJOBTYPE.SCHEMA, data=payloads),
+        )
+        self.validation_service.validate_batch(job)
+        return batch_id
 
     @Slot(object)
     def on_validation_complete(
-        self, job_res: JobResponse[ValidationResponse[SchemaValidateResponse]]
+        self, job_res: JobResponse[ValidationBatchResponse[SchemaValidateResponse]]
     ):
         job_id = job_res.job_ref.id
         if job_id not in self._active_batches:
             return
-
-        payload = job_res.payload.data
-        total_errors = payload.total_errors
-        errors = payload.errors
-        is_valid = payload.valid
-        queue_guid = payload.guid
+        if not isinstance(job_res.payload, ValidationBatchResponse):
+            return
 
         batch = self._active_batches.get(job_id)
-        data = self._active_jobs.get(queue_guid)
-        if not data:
+        status = job_res.job_ref.status
+        if status == JOBSTATUS.IN_PROGRESS:
+            self._apply_results(batch, job_res.payload.data)
+            self.batch_progress.emit(batch)
             return
 
-        if is_valid:
-            batch.valid_queues.append(data)
+        batch_jobs = self._active_jobs.pop(job_id, {})
+        if status == JOBSTATUS.ERROR:
+            self._logging(
+                f"{batch.batch_name}: validation failed - {job_res.job_ref.error}",
+                LOGLEVEL.ERROR,
+            )
+            batch.invalid_queues.extend(batch_jobs.values())
+            batch.validation_total = batch.batch_total
+            self._finalize_batch(job_id)
+            return
+
+        self._logging(
+            f"{batch.batch_name}: {len(batch.valid_queues)} of "
+            f"{batch.validation_total} rows passed validation.",
+            LOGLEVEL.INFO,
+        )
+        self._finalize_batch(job_id)
+
+    def _apply_results(
+        self, batch: ValidationQueueBatch, results: list[SchemaValidateResponse]
+    ):
+        batch_jobs = self._active_jobs.get(batch.batch_id, {})
+        for result in results:
+            data = batch_jobs.pop(result.guid, None)
+            if not data:
+                continue
+
             batch.validation_total += 1
-            self._logging(f"Row {data.row_number}: 0 errors found.", LOGLEVEL.INFO)
-        else:
+            if result.valid:
+                batch.valid_queues.append(data)
+                continue
+
             batch.invalid_queues.append(data)
-            batch.validation_total += 1
             batch.total_errors += 1
-            batch.errors.extend(errors)
+            batch.errors.extend(result.errors)
             self._logging(
-                f"Row {data.row_number}: {total_errors} errors found in queue.",
+                f"Row {data.row_number}: {result.total_errors} errors found in queue.",
                 LOGLEVEL.ERROR,
             )
 
-        self._active_jobs.pop(queue_guid)
-        if batch.batch_total == batch.validation_total:
-            self._finalize_batch(job_id)
-
     def _finalize_batch(self, batch_id: str):
         batch = self._active_batches.pop(batch_id)
+        # Shards finish in any order, so put the rows back in file order.
+        batch.valid_queues.sort(key=lambda row: row.row_number)
+        batch.invalid_queues.sort(key=lambda row: row.row_number)
         self.batch_complete.emit(batch)
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from services.rule_runner import RuleRunnerService
     from services.rule_runner.interfaces import RuleRunnerConfigProvider
     from services.rule_sets.models import RuleSet
+    from services.rules.models import Rule
     from services.files import JSONFileService
     from services.logger.adapters import LogAdapter
 from datetime import datetime
@@ -23,6 +24,7 @@ from base.events import (
     SchemaErrorDialogEvent,
     RulesLoadedEvent,
     RuleRunnerStateEvent,
+    ValidationProgressEvent,
 )
 from views.components.toasts.qtoast.enums import QTOASTSTATUS
 from services.base.models import JobRequest
@@ -70,10 +72,12 @@ class RulesController(ControllerBase):
         # TODO convert to ui_event
         self.rule_runner_service.progress.connect(self.runner_progress)
         self.rule_runner_service.runner_life_cyle.connect(self.handle_runner_lifecycle)
+        self.rule_runner_service.run_refused.connect(self.handle_run_refused)
         self.stop_runner_service.connect(self.rule_runner_service.stop_current_run)
 
         ## RULES
         self.validation_coordinator.batch_complete.connect(self.on_validation_complete)
+        self.validation_coordinator.batch_progress.connect(self.on_validation_progress)
         self.batch_dispatchers = {
             VALIDATIONBATCHTYPE.IMPORT: self._handle_import_batch,
             VALIDATIONBATCHTYPE.RUNTIME: self._handle_run_time,
@@ -90,8 +94,7 @@ class RulesController(ControllerBase):
         for rule in rules:
             rule.guid = str(uuid4())
             new_rules.append(rule)
-        self.rules_registry.add_rules(new_rules)
-        self._emit_rules_updated()
+        self._add_rules(new_rules)
 
     # **********************************
     # TOP NAV ACTIONS
@@ -115,9 +118,8 @@ class RulesController(ControllerBase):
     # MONITOR ACTIONS
     @Slot(list)
     def remove_rules_by_guids(self, guids: list[str]) -> None:
-        for guid in guids:
-            self.rules_registry.delete(guid)
-        self._emit_rules_updated()
+        removed = [guid for guid in guids if self.rules_registry.delete(guid)]
+        self._emit_rules_changed(removed=removed)
 
     # **********************************
     # RULE RUNNER
@@ -130,6 +132,9 @@ class RulesController(ControllerBase):
             )
         )
 
+    def handle_run_refused(self, message: str):
+        self.send_toast_failure("Rule Runner Not Started", message)
+
     # **********************************
     # RULE PAGE ACTIONS
 
@@ -152,8 +157,8 @@ class RulesController(ControllerBase):
         self.rules_registry.add_rules(import_rules)
 
     def delete_rule(self, rule_guid: str):
-        self.rules_registry.delete(rule_guid)
-        self._emit_rules_updated()
+        if self.rules_registry.delete(rule_guid):
+            self._emit_rules_changed(removed=[rule_guid])
 
     def delete_all_rules(self):
         self.rules_registry.delete_all()
@@ -168,7 +173,7 @@ class RulesController(ControllerBase):
         new_rule.guid = str(uuid4())
 
         self.rules_registry.upsert(new_rule)
-        self._emit_rules_updated()
+        self._emit_rules_changed(added=[new_rule])
 
     def validate_rules(
         self, data, batch_type: VALIDATIONBATCHTYPE, file_path: str = ""
@@ -195,6 +200,57 @@ class RulesController(ControllerBase):
     def handle_stop_runner(self):
         self.stop_runner_service.emit()
 
+    def resume_last_run(self):
+        """
+        Runs the rules from the last rule run's journal that never succeeded,
+        skipping the ones that were already created.
+        """
+        if self.rule_runner_service.is_running():
+            self.send_toast_failure(
+                "Resume Run Failed", "The Rule Runner is already running."
+            )
+            return
+        journal = self.rule_runner_service.last_run_journal()
+        remaining = journal.remaining_items if journal else []
+        if not remaining:
+            self.send_toast_failure(
+                "Nothing to Resume", "The last rule run has no unfinished rules."
+            )
+            return
+
+        login_config = self._settings_provider.get_rule_run_config()
+        if not login_config.login_valid:
+            self.send_toast_failure(
+                "Login Settings Not Valid",
+                "Please validate all of the login settings on the Settings Page.",
+            )
+            return
+
+        rules = self.rule_builder.build_rules([item.data for item in remaining])
+        rule_items = [RuleRunItem(rule.guid, rule) for rule in rules]
+        payload = RuleRunnerRequestPayload(
+            login_config, rule_items, resumed_from=journal.run_id
+        )
+        self.send_toast_success(
+            "Resuming Rule Run",
+            f"Skipping {journal.completed_count} completed rules and running {len(rule_items)}.",
+        )
+        job_ref_id = str(uuid4())
+        self._active_runners[job_ref_id] = payload
+        self.rule_runner_service.start_run(JobRequest(job_ref_id, None, payload))
+
+    def on_validation_progress(self, batch: ValidationBatch):
+        if batch.batch_type == VALIDATIONBATCHTYPE.SYS_SAVE:
+            return
+        self.ui_event.emit(
+            UIEvent(
+                event_type=UIEVENTTYPE.DISPLAY,
+                payload=ValidationProgressEvent(
+                    batch.validation_total, batch.batch_total
+                ),
+            )
+        )
+
     def on_validation_complete(self, batch: ValidationBatch):
         dispatcher = self.batch_dispatchers.get(batch.batch_type)
 
@@ -228,8 +284,7 @@ class RulesController(ControllerBase):
         if batch.rule_errors:
             return
         rules = self.rule_builder.build_rules(batch.valid_rules)
-        self.rules_registry.add_rules(rules)
-        self._emit_rules_updated()
+        self._add_rules(rules)
 
     def _handle_user_save(self, batch: ValidationBatch):
         self._display_validation(batch, "Saved")
@@ -318,14 +373,45 @@ class RulesController(ControllerBase):
         self.send_toast_failure(title=title, message=message)
         self.ui_event.emit(error_event)
 
+    def _add_rules(self, rules: list[Rule]):
+        added: list[Rule] = []
+        updated: list[Rule] = []
+        for rule in rules:
+            existing = self.rules_registry.get(rule.guid)
+            (updated if existing else added).append(rule)
+        self.rules_registry.add_rules(rules)
+        self._emit_rules_changed(added=added, updated=updated)
+
     def _emit_rules_updated(self):
-        self.ui_event.emit(
-            UIEvent(
-                event_type=UIEVENTTYPE.DISPLAY,
-                payload=RulesLoadedEvent(rules=self.rules_registry.get_all()),
+        rules = self.rules_registry.get_all()
+        self._emit_rules_event(
+            RulesLoadedEvent(
+                added=rules, order=[rule.guid for rule in rules], reset=True
             )
         )
 
+    def _emit_rules_changed(
+        self,
+        added: list[Rule] | None = None,
+        updated: list[Rule] | None = None,
+        removed: list[str] | None = None,
+    ):
+        """
+        Sends only what changed so the rules page can patch its forms instead
+        of rebuilding them.
+        """
+        self._emit_rules_event(
+            RulesLoadedEvent(
+                added=added or [],
+                updated=updated or [],
+                removed=removed or [],
+                order=self.rules_registry.get_order(),
+            )
+        )
+
+    def _emit_rules_event(self, event: RulesLoadedEvent):
+        self.ui_event.emit(UIEvent(event_type=UIEVENTTYPE.DISPLAY, payload=event))
+
     def _group_batch_errors(
         self, batch: ValidationBatch
     ) -> dict[str, list[SchemaError]]:
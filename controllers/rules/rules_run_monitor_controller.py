@@ -7,14 +7,17 @@ if TYPE_CHECKING:
     from services.rule_runner.models import RuleProgressEvent
     from services.monitor.rule_monitor import RunMonitorStore
     from services.logger.adapters import LogAdapter
+    from services.monitor.models import TaskTimingSummary
 
 from PySide6.QtCore import Signal, Slot
 
 from base.enums import UIEVENTTYPE
 from base.events import (
-    MonitorRowUpsertEvent,
+    MonitorRowsUpsertEvent,
+    MonitorRowsRemovedEvent,
     MonitorSummaryUpdateEvent,
     MonitorSnapShotEvent,
+    StepTimingsUpdateEvent,
     UIEvent,
 )
 from services.monitor.rule_monitor.models import RuleRunRow
@@ -35,29 +38,44 @@ class RulesRunMonitorController(ControllerBase):
     def handle_runner_lifecyle(self, status: RULERUNNERLIFECYCLE):
         pass
 
-    @Slot(object)
-    def handle_task_progress_event(self, event: RuleProgressEvent):
-        row = RuleRunRow(
-            rule_guid=event.rule_guid,
-            rule_name=event.rule_name,
-            status=event.status,
-            scope=event.task_ref.scope if event.task_ref else "",
-            task=event.task_ref.task if event.task_ref else "",
-            index=event.task_ref.index if event.task_ref else 0,
-            detail_type=event.task_ref.detail_type if event.task_ref else "",
-            message=event.message,
-            started_at=event.started_at,
-            finished_at=event.finished_at,
-        )
-        self.run_store.upsert_row(row)
-        self._emit_row_updated(row)
+    @Slot(list)
+    def handle_task_progress_events(self, events: list[RuleProgressEvent]):
+        rows: list[RuleRunRow] = []
+        for event in events:
+            row = RuleRunRow(
+                rule_guid=event.rule_guid,
+                rule_name=event.rule_name,
+                status=event.status,
+                scope=event.task_ref.scope if event.task_ref else "",
+                task=event.task_ref.task if event.task_ref else "",
+                index=event.task_ref.index if event.task_ref else 0,
+                detail_type=event.task_ref.detail_type if event.task_ref else "",
+                message=event.message,
+                started_at=event.started_at,
+                finished_at=event.finished_at,
+                emitted_at=event.emitted_at,
+            )
+            if self.run_store.upsert_row(row) is row:
+                rows.append(row)
+
+        if rows:
+            self._emit_rows_updated(rows)
         self._emit_summary_updated(self.run_store.get_summary())
 
-    def _emit_row_updated(self, row: RuleRunRow):
+    @Slot(list)
+    def handle_step_timings(self, summaries: list[TaskTimingSummary]):
         self.ui_event.emit(
             UIEvent(
                 event_type=UIEVENTTYPE.DISPLAY,
-                payload=MonitorRowUpsertEvent[RuleRunRow](row=row),
+                payload=StepTimingsUpdateEvent(summaries=summaries),
+            )
+        )
+
+    def _emit_rows_updated(self, rows: list[RuleRunRow]):
+        self.ui_event.emit(
+            UIEvent(
+                event_type=UIEVENTTYPE.DISPLAY,
+                payload=MonitorRowsUpsertEvent[RuleRunRow](rows=rows),
             )
         )
 
@@ -83,6 +101,11 @@ class RulesRunMonitorController(ControllerBase):
 
     def remove_succeed(self):
         succeed_guids = self.run_store.remove_succeeded()
-        snap_shot = self.run_store.get_rows_snapshot()
         self.request_remove.emit(succeed_guids)
-        self._emit_snap_shot(self.run_store.get_summary(), snap_shot)
+        self.ui_event.emit(
+            UIEvent(
+                event_type=UIEVENTTYPE.DISPLAY,
+                payload=MonitorRowsRemovedEvent(guids=succeed_guids),
+            )
+        )
+        self._emit_summary_updated(self.run_store.get_summary())
@@ -5,19 +5,23 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from services.validation import ValidationService
     from services.base.models import JobResponse
-    from services.validation.models import ValidationResponse, SchemaValidateResponse
+    from services.validation.models import (
+        ValidationBatchResponse,
+        SchemaValidateResponse,
+    )
     from services.logger.adapters import LogAdapter
 
 from uuid import uuid4
 from PySide6.QtCore import Signal, Slot
 from base.enums import LOGLEVEL
 from schemas.enums import SCHEMATYPE
+from services.base.enums import JOBSTATUS
 from services.base.models import JobRequest
 from services.validation.enums import VALIDATEJOBTYPE
 from services.validation.models import (
     SchemaValidatePayload,
-    ValidationRequest,
-    ValidationResponse,
+    ValidationBatchRequest,
+    ValidationBatchResponse,
 )
 
 
@@ -31,12 +35,16 @@ from base import ControllerBase
 
 class RulesValidationCoordinator(ControllerBase):
     batch_complete = Signal(object)
+    batch_progress = Signal(object)
 
     def __init__(self, logger: LogAdapter, validation_service: ValidationService):
         super().__init__(logger)
         self.validation_service = validation_service
 
-        self._active_jobs: dict[str, SchemaValidatePayload] = {}
+        self._active_jobs: dict[str, dict[str, dict]] = {}
+        # Input position of every rule guid, per batch. Shards finish in any
+        # order, so the results are put back in file order when finalized.
+        self._input_order: dict[str, dict[str, int]] = {}
         self._active_batches: dict[str, ValidationBatch] = {}
         self._active_runners: dict[str, RuleRunnerRequestPayload] = {}
         # CONNECTIONS
@@ -62,60 +70,88 @@ class RulesValidationCoordinator(ControllerBase):
             self._finalize_batch(batch.batch_id)
             return
 
+        payloads = []
+        batch_jobs = self._active_jobs.setdefault(batch_id, {})
+        input_order = self._input_order.setdefault(batch_id, {})
         for rule in rules:
             rule_guid = rule.get("guid", None)
             if not rule_guid:
                 rule_guid = str(uuid4())
                 rule["guid"] = rule_guid
-            payload = SchemaValidatePayload(schema_type=SCHEMATYPE.RULES, data=rule)
-            job = JobRequest(
-                id=batch_id,
-                task=None,
-                payload=ValidationRequest(kind=VALIDATEJOBTYPE.SCHEMA, data=payload),
+            payloads.append(
+                SchemaValidatePayload(schema_type=SCHEMATYPE.RULES, data=rule)
             )
-            self._active_jobs[rule_guid] = rule
-            self.validation_service.validate(job)
+            batch_jobs[rule_guid] = rule
+            input_order.setdefault(rule_guid, len(input_order))
+
+        job = JobRequest(
+            id=batch_id,
+            task=None,
+            payload=ValidationBatchRequest(kind=VALIDATEJOBTYPE.SCHEMA, data=payloads),
+        )
+        self.validation_service.validate_batch(job)
 
     @Slot(object)
     def on_validation_complete(
-        self, job_res: JobResponse[ValidationResponse[SchemaValidateResponse]]
+        self, job_res: JobResponse[ValidationBatchResponse[SchemaValidateResponse]]
     ):
         job_id = job_res.job_ref.id
         if job_id not in self._active_batches:
             return
-
-        payload = job_res.payload.data
-        total_errors = payload.total_errors
-        errors = payload.errors
-        is_valid = payload.valid
-        rule_guid = payload.guid
+        if not isinstance(job_res.payload, ValidationBatchResponse):
+            return
 
         batch = self._active_batches.get(job_id)
-        data = self._active_jobs.get(rule_guid)
-        if not data:
+        status = job_res.job_ref.status
+        if status == JOBSTATUS.IN_PROGRESS:
+            self._apply_results(batch, job_res.payload.data)
+            self.batch_progress.emit(batch)
+            return
+
+        batch_jobs = self._active_jobs.pop(job_id, {})
+        if status == JOBSTATUS.ERROR:
+            self._logging(
+                f"{batch.rule_batch_name}: validation failed - {job_res.job_ref.error}",
+                LOGLEVEL.ERROR,
+            )
+            batch.invalid_rules.extend(batch_jobs.values())
+            batch.validation_total = batch.batch_total
+            self._finalize_batch(job_id)
             return
 
-        rule_name = data.get("rule_name")
-        if not rule_name:
-            rule_name = "Rule Has No Name"
+        self._logging(
+            f"{batch.rule_batch_name}: {len(batch.valid_rules)} of "
+            f"{batch.validation_total} rules passed validation.",
+            LOGLEVEL.INFO,
+        )
+        self._finalize_batch(job_id)
+
+    def _apply_results(
+        self, batch: ValidationBatch, results: list[SchemaValidateResponse]
+    ):
+        batch_jobs = self._active_jobs.get(batch.batch_id, {})
+        for result in results:
+            data = batch_jobs.pop(result.guid, None)
+            if not data:
+                continue
 
-        if is_valid:
-            batch.valid_rules.append(data)
             batch.validation_total += 1
-            self._logging(f"{rule_name}: 0 errors found.", LOGLEVEL.INFO)
-        else:
+            if result.valid:
+                batch.valid_rules.append(data)
+                continue
+
+            rule_name = data.get("rule_name") or "Rule Has No Name"
             batch.invalid_rules.append(data)
-            batch.validation_total += 1
             batch.total_errors += 1
-            batch.rule_errors.extend(errors)
+            batch.rule_errors.extend(result.errors)
             self._logging(
-                f"{rule_name}: {total_errors} errors found in rule.", LOGLEVEL.ERROR
+                f"{rule_name}: {result.total_errors} errors found in rule.",
+                LOGLEVEL.ERROR,
             )
 
-        self._active_jobs.pop(rule_guid)
-        if batch.batch_total == batch.validation_total:
-            self._finalize_batch(job_id)
-
     def _finalize_batch(self, batch_id: str):
         batch = self._active_batches.pop(batch_id)
+        input_order = self._input_order.pop(batch_id, {})
+        batch.valid_rules.sort(key=lambda rule: input_order.get(rule["guid"], 0))
+        batch.invalid_rules.sort(key=lambda rule: input_order.get(rule["guid"], 0))
         self.batch_complete.emit(batch)
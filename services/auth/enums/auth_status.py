@@ -10,3 +10,4 @@ class AUTHSTATUS(StrEnum):
     UNKNOWN_ERROR = "unknown_error"
     STOPPED_REQUESTED = "stopped_requested"
     DUPLICATE_SESSION = "duplicate_session"
+    SESSION_EXPIRED = "session_expired"
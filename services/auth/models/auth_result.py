@@ -7,3 +7,5 @@ class AuthResult:
     success: bool
     status: AUTHSTATUS
     message: str = ""
+    probe_seconds: float | None = None
+    login_seconds: float | None = None
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from enum import StrEnum
+
+    from ..auth.auth_service import AuthService
+    from ..intra.intra_provider_session import IntraProviderSession
+    from ..logger.adapters import LogAdapter
+    from ..browser import BrowserSessionFactory
+    from ..profiles import ProfileRegistry
+    from ..run_journal import RunJournal, RunJournalStore
+    from .models import JobRequest
+
+from operator import attrgetter
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+from ..logger.run_log import RunLogSink
+from ..monitor.progress import ProgressCoalescer, keep_started_at
+from ..monitor.timing import StepTimingRecorder
+
+
+class RunnerServiceBase(QObject):
+    """
+    Thread, journal and run log bookkeeping shared by the rule and queue
+    runner services.
+
+    A run is spread over one QThread per worker. The workers' life cycle
+    signals are folded into one STARTED and one FINISHED for the run, and
+    once the last thread has finished the step timings are exported and the
+    run's journal and structured run log are closed.
+
+    Subclasses set:
+        LIFECYCLE: The runner's life cycle enum, with STARTED and FINISHED.
+        RUN_NAME: Names the run in logs and timeline files, e.g. "rule_run".
+        RUNNER_NAME: Sent with shutdown_ready, e.g. "rule_runner".
+        PROGRESS_GUID_FIELD: The progress event field the coalescer keys on.
+    """
+
+    LIFECYCLE: type[StrEnum]
+    RUN_NAME: str
+    RUNNER_NAME: str
+    PROGRESS_GUID_FIELD: str
+
+    stop_run = Signal()
+    task_progress = Signal(list)
+    runner_life_cyle = Signal(object)
+    shutdown_ready = Signal(str)
+    step_timings = Signal(list)
+    run_refused = Signal(str)
+
+    def __init__(
+        self,
+        session: IntraProviderSession,
+        auth_service: AuthService,
+        browser_session_factory: BrowserSessionFactory,
+        logger: LogAdapter,
+        profile_registry: ProfileRegistry,
+        journal_store: RunJournalStore | None = None,
+    ):
+        super().__init__()
+        self._threads: list[QThread] = []
+        self._workers: list[QObject] = []
+        self._running_workers = 0
+        self._reserved_workers: tuple[str, int] | None = None
+        self._run_started = False
+        self._step_timer: StepTimingRecorder | None = None
+        self._journal: RunJournal | None = None
+        self._journal_store = journal_store
+        self._run_log: RunLogSink | None = None
+        self._session = session
+        self._auth_service = auth_service
+        self._logger = logger
+        self._browser_session_factory = browser_session_factory
+        self._profile_registry = profile_registry
+        self._shut_down_in_requested = False
+        self._progress_coalescer = ProgressCoalescer(
+            key=attrgetter(self.PROGRESS_GUID_FIELD),
+            merge=keep_started_at,
+            parent=self,
+        )
+        self._progress_coalescer.flushed.connect(self.task_progress)
+
+    def is_running(self) -> bool:
+        return any(thread.isRunning() for thread in self._threads)
+
+    def _reserve_workers(self, job: JobRequest, wanted: int) -> int:
+        """
+        Reserves the run's browser contexts against the tenant's cap. They
+        are released once the run's last thread has finished. Returns 0 and
+        emits run_refused when the tenant's contexts are all in use.
+        """
+        tenant = job.payload.config.tenant
+        count = self._browser_session_factory.reserve_workers(tenant, max(1, wanted))
+        if not count:
+            message = (
+                f"{tenant} is at its limit of {self._browser_session_factory.max_workers} "
+                "browser contexts. Try again once the other run has finished."
+            )
+            self._logger(
+                f"{self.__class__.__name__}: Not starting {self._run_label}. {message}",
+                "WARN",
+            )
+            self.run_refused.emit(message)
+            return 0
+        self._reserved_workers = (tenant, count)
+        return count
+
+    def _release_workers(self):
+        if self._reserved_workers is not None:
+            self._browser_session_factory.release_workers(*self._reserved_workers)
+            self._reserved_workers = None
+
+    @property
+    def _run_label(self) -> str:
+        return self.RUN_NAME.replace("_", " ")
+
+    def _on_worker_life_cycle(self, status: StrEnum):
+        if status == self.LIFECYCLE.STARTED:
+            if not self._run_started:
+                self._run_started = True
+                self.runner_life_cyle.emit(status)
+            return
+
+        if status == self.LIFECYCLE.FINISHED:
+            self._running_workers -= 1
+            if self._running_workers <= 0:
+                self._progress_coalescer.stop()
+                self.runner_life_cyle.emit(status)
+            return
+
+        self.runner_life_cyle.emit(status)
+
+    def _clean_up_thread(self, thread: QThread):
+        if thread in self._threads:
+            runner_label = self.RUNNER_NAME.replace("_", " ").title()
+            self._logger(
+                f"{self.__class__.__name__}: {runner_label} Thread finished. Cleaning up.",
+                "INFO",
+            )
+            index = self._threads.index(thread)
+            self._threads.pop(index)
+            self._workers.pop(index)
+            thread.deleteLater()
+
+        if self._threads:
+            return
+
+        self._progress_coalescer.stop()
+        self._export_step_timings()
+        self._close_journal()
+        self._close_run_log()
+        self._release_workers()
+        self._clean_up_refs()
+        if self._shut_down_in_requested:
+            self._shut_down_in_requested = False
+            self.shutdown_ready.emit(self.RUNNER_NAME)
+
+    def _export_step_timings(self):
+        timer = self._step_timer
+        self._step_timer = None
+        if timer is None or not len(timer):
+            return
+
+        slowest = timer.slowest_steps()
+        for summary in slowest[:5]:
+            self._logger(
+                f"{self.__class__.__name__}: Slow step {summary.task_key} - "
+                f"p50 {summary.p50_ms:.0f}ms, p95 {summary.p95_ms:.0f}ms, "
+                f"max {summary.max_ms:.0f}ms ({summary.count} runs)",
+                "INFO",
+            )
+        self.step_timings.emit(slowest)
+
+        if not self._logger.log_dir:
+            return
+        try:
+            paths = timer.export(self._logger.log_dir)
+        except OSError as e:
+            self._logger(
+                f"{self.__class__.__name__}: Could not write {self._run_label} timeline: {e}",
+                "ERROR",
+            )
+            return
+        if paths:
+            self._logger(
+                f"{self.__class__.__name__}: {self._run_label.capitalize()} timeline saved to {paths[0]}",
+                "INFO",
+            )
+
+    def _start_run_log(self, job: JobRequest) -> LogAdapter:
+        """
+        Opens the structured run log when it is turned on in the log settings
+        and returns the adapter the workers log through.
+        """
+        if not self._logger.structured_run_logs or not self._logger.log_dir:
+            return self._logger
+        try:
+            self._run_log = RunLogSink.create(
+                self._logger.log_dir, self.RUN_NAME, job.id
+            )
+        except OSError as e:
+            self._logger(
+                f"{self.__class__.__name__}: Could not create {self._run_label} log: {e}",
+                "ERROR",
+            )
+            return self._logger
+        self._logger(
+            f"{self.__class__.__name__}: Structured run log at {self._run_log.path}",
+            "INFO",
+        )
+        return self._logger.with_run_log(self._run_log)
+
+    def _close_run_log(self):
+        if self._run_log is not None:
+            self._run_log.close()
+            self._run_log = None
+
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _clean_up_refs(self):
+        self._workers = []
+        self._threads = []
+        self._running_workers = 0
+
+    def request_app_shutdown(self) -> bool:
+        if not self.is_running():
+            return True
+        self._logger(
+            f"{self.__class__.__name__}: Runner still active. Deferring app shutdown.",
+            "WARN",
+        )
+        self._shut_down_in_requested = True
+        self.stop_current_run()
+        return False
+
+    def stop_current_run(self):
+        for worker in self._workers:
+            worker.stop()
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..auth.auth_service import AuthService
+    from ..browser import BrowserSessionFactory, PlaywrightSessionManager
+    from ..browser.models import PlaywrightSession
+    from ..intra.intra_provider_session import IntraProviderSession
+    from ..monitor.timing import StepTimingRecorder
+    from .shared_session_gate import SharedSessionGate
+
+import time
+
+from PySide6.QtCore import QObject
+
+from ..auth.enums import AUTHSTATUS
+from ..auth.models.auth_result import AuthResult
+from ..monitor.models import StepTiming
+
+
+class RunnerWorkerBase(QObject):
+    """
+    Browser and authentication handling shared by the rule and queue runner
+    workers.
+
+    When a run is spread across several workers only the lead logs in. It
+    publishes the session through the run's `session_gate` and the other
+    workers load its cookies instead of logging in themselves. When the
+    shared session goes stale it is refreshed once and published again, see
+    SharedSessionGate. Subclasses set the attributes below and provide
+    `is_lead`, `shares_session`, `should_stop` and `logging`.
+    """
+
+    browser_session_factory: BrowserSessionFactory
+    session: IntraProviderSession
+    auth_service: AuthService
+    session_gate: SharedSessionGate
+    step_timer: StepTimingRecorder | None
+    # The session generation this worker's cookies came from.
+    _session_generation: int = 0
+    playwright_session_manager: PlaywrightSessionManager | None
+    playwright_session: PlaywrightSession | None
+
+    def _init_browser(self, load_session_cookies=False) -> None:
+        """
+        Initializes the Playwright session in a fresh context on the factory's
+        warm Chromium host.
+        """
+        self.playwright_session_manager = self.browser_session_factory.create_session(
+            self.session.provider_name
+        )
+        self.playwright_session = self.playwright_session_manager.start()
+        if load_session_cookies:
+            self.playwright_session_manager.load_cookies()
+
+    def _close_down_browser(self):
+        if not self.playwright_session_manager:
+            return
+        if self.playwright_session is not None:
+            metrics = self.playwright_session.browser_adapter.locator_cache_metrics()
+            self.logging(
+                "Locator cache: %d hits, %d misses (%.0f%% hit rate), %d resets",
+                "DEBUG",
+                args=(
+                    metrics.hits,
+                    metrics.misses,
+                    metrics.hit_rate * 100,
+                    metrics.invalidations,
+                ),
+            )
+        self.playwright_session_manager.close()
+        self.playwright_session_manager = None
+        self.playwright_session = None
+
+    def _rebuild_browser(self):
+        self._close_down_browser()
+        self._init_browser(load_session_cookies=False)
+
+    def _attach_shared_session(self, after_generation: int = 0) -> AuthResult:
+        """
+        Waits for a session newer than `after_generation` and loads the
+        shared provider session cookies into this worker's context.
+        """
+        if not self.session_gate.wait_for_session(self.should_stop, after_generation):
+            if self.should_stop():
+                return AuthResult(success=False, status=AUTHSTATUS.STOPPED_REQUESTED)
+            return AuthResult(
+                success=False,
+                status=AUTHSTATUS.UNKNOWN_ERROR,
+                message="Shared session is not available.",
+            )
+        self._session_generation = self.session_gate.generation
+        self.playwright_session_manager.load_cookies()
+        self.logging("Attached shared authenticated session.")
+        return AuthResult(
+            success=True,
+            status=AUTHSTATUS.ALREADY_AUTHENTICATED,
+            message="Attached shared session.",
+        )
+
+    def _start_session(self) -> AuthResult:
+        if self.shares_session and not self.is_lead:
+            return self._attach_shared_session()
+        if self.shares_session:
+            return self._publish_new_session()
+        return self._authenticate()
+
+    def _publish_new_session(self) -> AuthResult:
+        """Logs in and publishes the session to the other workers."""
+        auth_result = self._authenticate()
+        if auth_result.success:
+            self.playwright_session_manager.save_cookies()
+        self._session_generation = self.session_gate.publish(auth_result.success)
+        return auth_result
+
+    def _refresh_shared_session(self) -> AuthResult:
+        """
+        Logs in again for every worker, unless another worker has already
+        published a newer session, which is attached instead.
+        """
+        seen = self._session_generation
+        if not self.session_gate.claim_refresh(seen):
+            return self._attach_shared_session(seen)
+        self.logging("Refreshing the shared session.")
+        return self._publish_new_session()
+
+    def _refresh_session_if_requested(self) -> AuthResult | None:
+        """
+        Called by the lead between items. Refreshes the shared session when
+        another worker has asked for it.
+        """
+        if not (self.shares_session and self.is_lead):
+            return None
+        if not self.session_gate.refresh_requested:
+            return None
+        return self._refresh_shared_session()
+
+    def _reauthenticate(self) -> AuthResult:
+        if not self.shares_session:
+            return self._authenticate()
+        if self.is_lead:
+            return self._refresh_shared_session()
+
+        # Reloading the same cookies would not help a stale session. Ask the
+        # lead for a new one, or log in for everyone once the lead is gone.
+        seen = self._session_generation
+        self.session_gate.request_refresh(seen)
+        while not self.should_stop():
+            new_session = self.session_gate.wait_for_session(self.should_stop, seen)
+            if new_session or self.session_gate.generation > seen:
+                return self._attach_shared_session(seen)
+            if self.session_gate.claim_refresh(seen):
+                self.logging("Refreshing the shared session.")
+                return self._publish_new_session()
+        return AuthResult(success=False, status=AUTHSTATUS.STOPPED_REQUESTED)
+
+    def _session_outlives_worker(self) -> bool:
+        """
+        True when an auth failure only has to stop this worker: the shared
+        session is still good and the other workers can keep going.
+        """
+        return self.shares_session and self.session_gate.is_valid
+
+    def _record_auth_timing(self, result: AuthResult) -> None:
+        """
+        Logs the session probe and login times and records them as `auth`
+        steps in the run timeline.
+        """
+        steps = []
+        if result.probe_seconds is not None:
+            probe_status = (
+                str(result.status) if result.login_seconds is None else "login_required"
+            )
+            steps.append(("probe", probe_status, result.probe_seconds))
+        if result.login_seconds is not None:
+            steps.append(("login", str(result.status), result.login_seconds))
+        if not steps:
+            return
+        self.logging(
+            f"Authentication ({result.status}): "
+            + ", ".join(f"{task} {seconds:.2f}s" for task, _, seconds in steps)
+        )
+        if self.step_timer is None:
+            return
+        started_at = time.time() - sum(seconds for _, _, seconds in steps)
+        for task, status, seconds in steps:
+            self.step_timer.record(
+                StepTiming(
+                    item_guid=self.session.provider_name,
+                    item_name=self.creds.tenant,
+                    scope="auth",
+                    task=task,
+                    status=status,
+                    started_at=started_at,
+                    duration_ms=seconds * 1000,
+                )
+            )
+            started_at += seconds
+
+    def _authenticate(self) -> AuthResult:
+        auth_attempts = 0
+        max_attempts = 2
+
+        while auth_attempts < max_attempts:
+            if self.should_stop():
+                return AuthResult(success=False, status=AUTHSTATUS.STOPPED_REQUESTED)
+            self.logging(
+                f"Attempting to authenticate: {auth_attempts} / {max_attempts-1}"
+            )
+            result = self.auth_service.ensure_auth(
+                self.session.provider_name,
+                self.creds,
+                self.playwright_session.browser_adapter,
+                force_login=auth_attempts > 0,
+                should_stop_cb=self.should_stop,
+            )
+            self._record_auth_timing(result)
+
+            if result.success:
+                self.logging("Received Successful Authentication.")
+                return result
+            self.logging("Received Failure Authentication.", "WARN")
+            if result.status == AUTHSTATUS.BROWSER_ERROR:
+                self._rebuild_browser()
+            auth_attempts += 1
+        self.logging(
+            "Attempted to log in 2 times. Login Failed due to an error.", "ERROR"
+        )
+        return result
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from threading import Condition
+from typing import Callable
+
+
+class SharedSessionGate:
+    """
+    Hands the lead worker's authenticated session to the other workers of a
+    run.
+
+    Every publish starts a new generation. A worker that finds the session
+    it attached has gone stale asks for a refresh and waits for a newer
+    generation instead of reloading the same cookies. The lead picks the
+    request up between items, logs in again and publishes the new cookies.
+    Once the lead has finished, the first worker to claim the refresh logs
+    in on behalf of the others.
+    """
+
+    def __init__(self):
+        self._cond = Condition()
+        self.generation = 0
+        self._valid = False
+        self._refresh_requested = False
+        self._refreshing = False
+        self._lead_active = True
+
+    @property
+    def is_valid(self) -> bool:
+        with self._cond:
+            return self._valid
+
+    @property
+    def refresh_requested(self) -> bool:
+        with self._cond:
+            return self._refresh_requested and not self._refreshing
+
+    def publish(self, is_valid: bool) -> int:
+        """Publishes a new session generation and returns its number."""
+        with self._cond:
+            self.generation += 1
+            self._valid = is_valid
+            self._refresh_requested = False
+            self._refreshing = False
+            self._cond.notify_all()
+            return self.generation
+
+    def lead_finished(self) -> None:
+        """
+        Marks the lead worker as gone. Workers still waiting for the first
+        session are released with an invalid one.
+        """
+        with self._cond:
+            self._lead_active = False
+            if self.generation == 0:
+                self.generation = 1
+                self._valid = False
+            self._cond.notify_all()
+
+    def wait_for_session(
+        self, should_stop: Callable[[], bool], after_generation: int = 0
+    ) -> bool:
+        """
+        Waits for a generation newer than `after_generation`. Returns False
+        when stopped, when the published session is invalid, or when the lead
+        has finished and nobody is refreshing the session.
+        """
+        with self._cond:
+            while self.generation <= after_generation:
+                if should_stop():
+                    return False
+                if not self._lead_active and not self._refreshing:
+                    return False
+                self._cond.wait(timeout=0.5)
+            return self._valid
+
+    def request_refresh(self, seen_generation: int) -> None:
+        with self._cond:
+            if self.generation == seen_generation:
+                self._refresh_requested = True
+                self._cond.notify_all()
+
+    def claim_refresh(self, seen_generation: int) -> bool:
+        """
+        Claims the refresh of generation `seen_generation`. Returns False when
+        a newer generation is out or another worker is already logging in.
+        """
+        with self._cond:
+            if self.generation != seen_generation or self._refreshing:
+                return False
+            self._refreshing = True
+            return True
@@ -1,4 +1,5 @@
 from .play_wright_session_manager import PlaywrightSessionManager
 from .browser_session_factory import BrowserSessionFactory
+from .chromium_host import ChromiumHost
 
-__all__ = ["PlaywrightSessionManager", "BrowserSessionFactory"]
+__all__ = ["PlaywrightSessionManager", "BrowserSessionFactory", "ChromiumHost"]
@@ -1,21 +1,28 @@
+import time
+from typing import Callable, Literal
+
 from playwright.sync_api import (
     Dialog,
     FrameLocator,
     Locator,
     Page,
 )
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
+from services.browser.models import LocatorCacheMetrics
 from services.browser.ports.browser_port import BrowserPort
 
 from .playwright_interaction_adapter import PlaywrightInteractionAdapter
+from .playwright_locator_cache import PlaywrightLocatorCache
+
+SuccessState = Literal["visible", "hidden", "loaded"]
 
 
 class PlaywrightBrowserAdapter(BrowserPort):
 
     def __init__(self, page: Page):
         self._page = page
-        self.interactions = PlaywrightInteractionAdapter(page)
+        self.locator_cache = PlaywrightLocatorCache(page)
+        self.interactions = PlaywrightInteractionAdapter(page, self.locator_cache)
 
     def goto(self, url: str) -> None:
         self._page.goto(url)
@@ -38,11 +45,10 @@ class PlaywrightBrowserAdapter(BrowserPort):
         return url_part in current_url
 
     def frame_locator(self, selector: str) -> PlaywrightInteractionAdapter:
-        frame = self._page.frame_locator(selector)
-        if frame is None:
-            raise ValueError(f"Frame not found: {selector}")
+        return self.interactions.frame_locator(selector)
 
-        return PlaywrightInteractionAdapter(frame)
+    def locator_cache_metrics(self) -> LocatorCacheMetrics:
+        return self.locator_cache.metrics
 
     def click(
         self,
@@ -96,6 +102,7 @@ class PlaywrightBrowserAdapter(BrowserPort):
     def _handle_dialog(
         self, dialog: Dialog, check_alert_text: str, result: dict[str, bool]
     ):
+        result["appeared"] = True
         message = dialog.message
         if check_alert_text and check_alert_text not in message:
             dialog.dismiss()
@@ -105,14 +112,62 @@ class PlaywrightBrowserAdapter(BrowserPort):
         dialog.accept()
         result["result"] = True
 
+    def _success_check(
+        self, success_locator: Locator | None, success_state: SuccessState
+    ) -> Callable[[], bool] | None:
+        if success_locator is None:
+            return None
+        target = success_locator.first
+
+        if success_state == "visible":
+            return target.is_visible
+        if success_state == "hidden":
+            return lambda: not target.is_visible()
+
+        seen = {"visible": False}
+
+        def loaded() -> bool:
+            if target.is_visible():
+                seen["visible"] = True
+                return False
+            return seen["visible"]
+
+        return loaded
+
+    def _wait_for_dialog_or_success(
+        self,
+        dialog_appeared: Callable[[], bool],
+        success_locator: Locator | None,
+        success_state: SuccessState,
+        timeout: int,
+        poll_interval: int = 100,
+    ) -> None:
+        """
+        Waits until a dialog fires, the success locator reaches success_state or
+        the timeout runs out, whichever happens first. Short page waits keep the
+        dialog events flowing while the locator is polled.
+        """
+        success = self._success_check(success_locator, success_state)
+        deadline = time.monotonic() + timeout / 1000
+
+        while not dialog_appeared():
+            if success is not None and success():
+                return
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                return
+            self._page.wait_for_timeout(min(poll_interval, remaining_ms))
+
     def click_and_accept_alert_if_appears(
         self,
         selector: str,
         check_alert_text: str | None = None,
         timeout: int = 3000,
         click_timeout: int = 60000,
+        success_locator: Locator | None = None,
+        success_state: SuccessState = "visible",
     ) -> bool:
-        result = {"result": False}
+        result = {"result": False, "appeared": False}
 
         def handler(dialog: Dialog) -> None:
             self._handle_dialog(dialog, check_alert_text, result)
@@ -121,7 +176,9 @@ class PlaywrightBrowserAdapter(BrowserPort):
 
         try:
             self._page.locator(selector).click(timeout=click_timeout)
-            self._page.wait_for_timeout(timeout)
+            self._wait_for_dialog_or_success(
+                lambda: result["appeared"], success_locator, success_state, timeout
+            )
             return result["result"]
         finally:
             self._page.remove_listener("dialog", handler)
@@ -133,6 +190,8 @@ class PlaywrightBrowserAdapter(BrowserPort):
         text_to_select: str,
         check_alert_text: str | None = None,
         timeout: int = 3000,
+        success_locator: Locator | None = None,
+        success_state: SuccessState = "visible",
     ) -> bool:
         result = {
             "appeared": False,
@@ -154,14 +213,20 @@ class PlaywrightBrowserAdapter(BrowserPort):
         self._page.on("dialog", handle_dialog)
 
         try:
-            adapter = PlaywrightInteractionAdapter(frame_locator)
+            # Frame ports from frame_locator already share the locator cache.
+            if isinstance(frame_locator, PlaywrightInteractionAdapter):
+                adapter = frame_locator
+            else:
+                adapter = PlaywrightInteractionAdapter(frame_locator)
             adapter.select_exact_item_from_list(
                 list_selector,
                 text_to_select,
             )
 
-            if not result["appeared"] and timeout > 0:
-                self._page.wait_for_timeout(timeout)
+            if timeout > 0:
+                self._wait_for_dialog_or_success(
+                    lambda: result["appeared"], success_locator, success_state, timeout
+                )
 
             return result["accepted"]
 
@@ -174,8 +239,10 @@ class PlaywrightBrowserAdapter(BrowserPort):
         click_selector: str,
         check_alert_text: str | None = None,
         timeout: int = 3000,
+        success_locator: Locator | None = None,
+        success_state: SuccessState = "visible",
     ) -> bool:
-        result = {"result": False}
+        result = {"result": False, "appeared": False}
 
         def handler(dialog: Dialog) -> None:
             self._handle_dialog(dialog, check_alert_text, result)
@@ -184,7 +251,9 @@ class PlaywrightBrowserAdapter(BrowserPort):
 
         try:
             frame_locator.locator(click_selector).click()
-            self._page.wait_for_timeout(timeout)
+            self._wait_for_dialog_or_success(
+                lambda: result["appeared"], success_locator, success_state, timeout
+            )
             return result["result"]
         finally:
             self._page.remove_listener("dialog", handler)
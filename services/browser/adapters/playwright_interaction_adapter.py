@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .playwright_locator_cache import FrameChain, PlaywrightLocatorCache
+
 import re
 
 from playwright.sync_api import (
@@ -16,24 +21,40 @@ class PlaywrightInteractionAdapter:
     Shared Playwright interaction adapter.
 
     This can wrap either a Page or Frame because both expose locator().
+
+    Adapters built from a PlaywrightBrowserAdapter share its page's
+    PlaywrightLocatorCache, so a selector is turned into a Locator once per
+    frame chain instead of on every call.
     """
 
-    def __init__(self, container: Page | FrameLocator):
+    def __init__(
+        self,
+        container: Page | FrameLocator,
+        locator_cache: PlaywrightLocatorCache | None = None,
+        frame_chain: FrameChain = (),
+    ):
         self.container = container
+        self.locator_cache = locator_cache
+        self.frame_chain = frame_chain
+
+    def _locator(self, selector: str) -> Locator:
+        if self.locator_cache is None:
+            return self.container.locator(selector)
+        return self.locator_cache.locator(self.container, self.frame_chain, selector)
 
     def click(
         self,
         selector: str,
         timeout: int = 30000,
     ) -> None:
-        self.container.locator(selector).click(timeout=timeout)
+        self._locator(selector).click(timeout=timeout)
 
     def click_first_child(
         self,
         selector: str,
         timeout: int = 30000,
     ) -> None:
-        first = self.container.locator(selector).first
+        first = self._locator(selector).first
         first.wait_for(state="visible", timeout=timeout)
         first.click(timeout=timeout)
 
@@ -43,14 +64,14 @@ class PlaywrightInteractionAdapter:
         text: str,
         timeout: int = 30000,
     ) -> None:
-        self.container.locator(selector).fill(str(text), timeout=timeout)
+        self._locator(selector).fill(str(text), timeout=timeout)
 
     def text_content(
         self,
         selector: str,
         timeout: int = 30000,
     ) -> str:
-        value = self.container.locator(selector).text_content(timeout=timeout)
+        value = self._locator(selector).text_content(timeout=timeout)
         return value or ""
 
     def has_text_content(
@@ -60,7 +81,7 @@ class PlaywrightInteractionAdapter:
         timeout: int = 30000,
     ) -> bool:
         try:
-            value = self.container.locator(selector).inner_text(timeout=timeout)
+            value = self._locator(selector).inner_text(timeout=timeout)
             return value.strip() == text_to_check.strip()
 
         except PlaywrightTimeoutError:
@@ -72,7 +93,7 @@ class PlaywrightInteractionAdapter:
         timeout: int = 30000,
     ) -> bool:
         try:
-            self.container.locator(selector).wait_for(
+            self._locator(selector).wait_for(
                 state="attached",
                 timeout=timeout,
             )
@@ -86,7 +107,7 @@ class PlaywrightInteractionAdapter:
         timeout: int = 30000,
     ) -> bool:
         try:
-            self.container.locator(selector).wait_for(
+            self._locator(selector).wait_for(
                 state="visible",
                 timeout=timeout,
             )
@@ -99,13 +120,13 @@ class PlaywrightInteractionAdapter:
         selector: str,
         timeout: int = 30000,
     ) -> None:
-        self.container.locator(selector).wait_for(
+        self._locator(selector).wait_for(
             state="visible",
             timeout=timeout,
         )
 
     def locator(self, selector: str) -> Locator:
-        return self.container.locator(selector)
+        return self._locator(selector)
 
     def select_item_from_list(
         self,
@@ -115,7 +136,7 @@ class PlaywrightInteractionAdapter:
     ) -> None:
         text = str(text_to_select).strip()
 
-        items = self.container.locator(selector)
+        items = self._locator(selector)
         items.wait_for(
             state="visible",
             timeout=timeout,
@@ -132,7 +153,7 @@ class PlaywrightInteractionAdapter:
     ) -> None:
         expected = str(text_to_select).strip()
 
-        items = self.container.locator(selector)
+        items = self._locator(selector)
         items.first.wait_for(state="visible", timeout=timeout)
 
         count = items.count()
@@ -152,7 +173,7 @@ class PlaywrightInteractionAdapter:
         selector: str,
         timeout: int = 30000,
     ) -> None:
-        items = self.container.locator(selector)
+        items = self._locator(selector)
         items.first.wait_for(state="visible", timeout=timeout)
 
         count = items.count()
@@ -168,7 +189,7 @@ class PlaywrightInteractionAdapter:
         strict_exact: bool = False,
     ) -> Locator:
         has_text = re.compile(rf"^{re.escape(text)}$") if strict_exact else text
-        return self.container.locator(base_selector).filter(
+        return self._locator(base_selector).filter(
             has=self.container.locator(has_selector, has_text=has_text)
         )
 
@@ -202,6 +223,13 @@ class PlaywrightInteractionAdapter:
         locator.wait_for(state="visible", timeout=timeout)
 
     def frame_locator(self, selector: str) -> PlaywrightInteractionAdapter:
+        if self.locator_cache is not None:
+            frame = self.locator_cache.frame_locator(
+                self.container, self.frame_chain, selector
+            )
+            return PlaywrightInteractionAdapter(
+                frame, self.locator_cache, (*self.frame_chain, selector)
+            )
         frame = self.container.frame_locator(selector)
         if frame is None:
             raise ValueError(f"Frame not found: {selector}")
@@ -215,7 +243,7 @@ class PlaywrightInteractionAdapter:
         disappear_timeout: int = 30000,
     ) -> None:
 
-        loader = self.container.locator(selector)
+        loader = self._locator(selector)
         try:
             loader.wait_for(state="visible", timeout=appear_timeout)
         except PlaywrightTimeoutError:
@@ -225,8 +253,9 @@ class PlaywrightInteractionAdapter:
         loader.wait_for(state="hidden", timeout=disappear_timeout)
 
     def find_by_has_selector(self, base_selector: str, has_selector: str) -> Locator:
-
-        return self.container.locator(base_selector).filter(
+        # The has selector usually names one queue or rule, so it is not
+        # cached.
+        return self._locator(base_selector).filter(
             has=self.container.locator(has_selector)
         )
 
@@ -236,6 +265,23 @@ class PlaywrightInteractionAdapter:
         value = parent.locator(selector).get_attribute(attribute, timeout=timeout)
         return value or ""
 
+    def get_row_attributes(
+        self, row_selector: str, child_selectors: list[str], attribute: str
+    ) -> list[list[str]]:
+        """
+        Reads `attribute` from each child selector of every matching row in
+        one round trip to the page. Missing children read as "".
+        """
+        return self._locator(row_selector).evaluate_all(
+            """(rows, [selectors, attribute]) => rows.map((row) =>
+                selectors.map((selector) => {
+                    const child = row.querySelector(selector);
+                    return child ? child.getAttribute(attribute) || "" : "";
+                })
+            )""",
+            [child_selectors, attribute],
+        )
+
     def verify_locator_present(self, locator: Locator, timeout: int = 5000) -> None:
         return expect(locator).to_have_count(count=1, timeout=timeout)
 
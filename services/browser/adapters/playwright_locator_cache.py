@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Frame, FrameLocator, Locator, Page
+
+from ..models import LocatorCacheMetrics
+
+FrameChain = tuple[str, ...]
+
+
+class PlaywrightLocatorCache:
+    """
+    Per page cache of the Locator and FrameLocator objects the interaction
+    adapters build from selector strings, keyed by the frame chain (the
+    iframe selectors from the page down) and the selector.
+
+    Playwright locators are lazy and query the DOM again on every action,
+    so a cached locator stays correct while the page changes under it. The
+    cache is still dropped whenever the page's main frame navigates, so a
+    page only ever reuses locators built for the document it is on.
+    """
+
+    def __init__(self, page: Page):
+        self._page = page
+        self._locators: dict[tuple[FrameChain, str], Locator] = {}
+        self._frames: dict[FrameChain, FrameLocator] = {}
+        self.metrics = LocatorCacheMetrics()
+        page.on("framenavigated", self._on_frame_navigated)
+
+    def __len__(self) -> int:
+        return len(self._locators) + len(self._frames)
+
+    def locator(
+        self, container: Page | FrameLocator, chain: FrameChain, selector: str
+    ) -> Locator:
+        key = (chain, selector)
+        locator = self._locators.get(key)
+        if locator is None:
+            self.metrics.misses += 1
+            locator = container.locator(selector)
+            self._locators[key] = locator
+        else:
+            self.metrics.hits += 1
+        return locator
+
+    def frame_locator(
+        self, container: Page | FrameLocator, chain: FrameChain, selector: str
+    ) -> FrameLocator:
+        key = (*chain, selector)
+        frame = self._frames.get(key)
+        if frame is None:
+            self.metrics.misses += 1
+            frame = container.frame_locator(selector)
+            self._frames[key] = frame
+        else:
+            self.metrics.hits += 1
+        return frame
+
+    def clear(self) -> None:
+        if self._locators or self._frames:
+            self.metrics.invalidations += 1
+        self._locators.clear()
+        self._frames.clear()
+
+    def _on_frame_navigated(self, frame: Frame) -> None:
+        if frame == self._page.main_frame:
+            self.clear()
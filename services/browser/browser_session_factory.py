@@ -8,8 +8,11 @@ if TYPE_CHECKING:
     from services.logger.adapters import LogAdapter
     from ..settings.events import SettingUpdatedEvent
 from .models import PlaywrightConfig
+from threading import Lock
+
 from PySide6.QtCore import QObject, Slot
 from .play_wright_session_manager import PlaywrightSessionManager
+from .chromium_host import ChromiumHost
 from ..settings.enums import SETTINGSCATEGORIES
 from services.settings.models import BrowserSettings
 
@@ -22,20 +25,89 @@ class BrowserSessionFactory(QObject):
         self._settings_loaded = False
         self.browser_headless = False
         self.browser_move_delay_speed = 500
+        self.browser_max_workers = 1
+        self.browser_keep_warm = "True"
 
         self.config = PlaywrightConfig()
+        self._host: ChromiumHost | None = None
+        self._host_lock = Lock()
+        self._tenant_workers: dict[str, int] = {}
+        self._tenant_lock = Lock()
 
     def create_session(
         self, provider: PROVIDERS, config: PlaywrightConfig | None = None
     ) -> PlaywrightSessionManager:
+        """
+        Creates a session that attaches a new context to the warm Chromium
+        host. The host is launched with the factory's headless setting, so
+        `config.headless` has no effect here, and a headless change only
+        relaunches the host once no session is attached.
+
+        With browser_keep_warm off the session launches its own browser
+        instead, which closes with the session and honours `config.headless`.
+        """
         if config is None:
             config = self.config
         return PlaywrightSessionManager(
             provider_session=self.session_registry.for_provider(provider),
             logger=self.logger,
             config=config,
+            host=self.host if self.keep_warm else None,
         )
 
+    @property
+    def keep_warm(self) -> bool:
+        return str(self.browser_keep_warm) == "True"
+
+    @property
+    def host(self) -> ChromiumHost:
+        """
+        The warm Chromium process every session attaches a new context to.
+        """
+        with self._host_lock:
+            if self._host is None:
+                self._host = ChromiumHost(logger=self.logger, config=self.config)
+            return self._host
+
+    def shutdown(self) -> None:
+        if self._host is not None:
+            self._host.close()
+
+    @property
+    def max_workers(self) -> int:
+        try:
+            return max(1, int(self.browser_max_workers))
+        except (TypeError, ValueError):
+            return 1
+
+    def reserve_workers(self, tenant: str, wanted: int) -> int:
+        """
+        Reserves up to `wanted` browser contexts against the tenant's
+        max_workers cap, shared by every run for that tenant. Returns 0 when
+        the tenant is already at its cap. Pair with release_workers().
+        """
+        with self._tenant_lock:
+            in_use = self._tenant_workers.get(tenant, 0)
+            granted = max(0, min(wanted, self.max_workers - in_use))
+            if granted:
+                self._tenant_workers[tenant] = in_use + granted
+        if in_use and 0 < granted < wanted:
+            self.logger(
+                f"{self.__class__.__name__}: {tenant} has {in_use} browser contexts in use. "
+                f"Running on {granted} of the {wanted} requested.",
+                "INFO",
+                True,
+            )
+        return granted
+
+    def release_workers(self, tenant: str, count: int) -> None:
+        with self._tenant_lock:
+            in_use = self._tenant_workers.get(tenant, 0) - count
+            if in_use > 0:
+                self._tenant_workers[tenant] = in_use
+            else:
+                self._tenant_workers.pop(tenant, None)
+
     def load_settings(self, settings: BrowserSettings):
         if self._settings_loaded:
             return
@@ -52,6 +124,12 @@ class BrowserSessionFactory(QObject):
         self.config = PlaywrightConfig(
             headless=bool(self.browser_headless), slow_mo=self.browser_move_delay_speed
         )
+        if self._host is None:
+            return
+        self._host.update_config(self.config)
+        if not self.keep_warm and self._host.close_if_idle():
+            with self._host_lock:
+                self._host = None
 
     @Slot(object)
     def received_settings_change(self, event: SettingUpdatedEvent):
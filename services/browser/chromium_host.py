@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from services.logger.adapters import LogAdapter
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import replace
+from threading import Lock
+
+import requests
+from playwright.sync_api import sync_playwright
+
+from .models import BrowserHostMetrics, PlaywrightConfig
+
+
+class ChromiumHost:
+    """
+    Long-lived Chromium process with a CDP endpoint. Sessions attach a fresh
+    BrowserContext to it instead of cold-launching a browser per run or retry.
+
+    The sync Playwright API is bound to the thread that started it, so the
+    process is started with subprocess and every session connects over CDP
+    from its own thread. The process is only relaunched when it is dead or
+    stops answering, or when a config change is pending and no session is
+    attached.
+
+    The CDP port has no authentication: while the host runs, any local
+    process that finds the port can drive the logged-in browser. Chromium
+    picks the port itself and it is only read back from the private
+    profile directory and kept in memory. The browser_keep_warm setting
+    turns the host off in favour of a browser launched per run.
+    """
+
+    def __init__(self, logger: LogAdapter, config: PlaywrightConfig):
+        self.logger = logger
+        self.config = config
+        self.cdp_endpoint: str | None = None
+        self.metrics = BrowserHostMetrics()
+        self._process: subprocess.Popen | None = None
+        self._user_data_dir: str | None = None
+        self._launched_config: PlaywrightConfig | None = None
+        self._leases = 0
+        self._lock = Lock()
+
+        from utils.files import PathManager
+
+        app_data_playwright_path = PathManager.create_folder_in_app_data("playwright")
+        os.environ["PLAYWRIGHT_BROWSERS_PATH"] = app_data_playwright_path
+
+    def logging(self, msg, level="INFO", print_msg=True) -> None:
+        msg = f"{self.__class__.__name__}: {msg}"
+        self.logger(msg, level, print_msg)
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def is_healthy(self) -> bool:
+        if not self.is_alive() or not self.cdp_endpoint:
+            return False
+        try:
+            res = requests.get(f"{self.cdp_endpoint}/json/version", timeout=1)
+            return res.ok
+        except requests.RequestException:
+            return False
+
+    def update_config(self, config: PlaywrightConfig) -> None:
+        """
+        Applies a new config. A running process picks it up the next time it
+        is acquired with no sessions attached.
+        """
+        with self._lock:
+            self.config = config
+
+    def _needs_relaunch(self) -> bool:
+        if not self.is_healthy():
+            return True
+        launched = self._launched_config
+        if launched is None or launched.headless == self.config.headless:
+            return False
+        if self._leases:
+            self.logging(
+                f"Headless change waits for {self._leases} attached session(s) to close.",
+                "WARN",
+            )
+            return False
+        return True
+
+    def acquire(self) -> str:
+        """
+        Returns the CDP endpoint for a new session, launching Chromium if it is
+        not running. Safe to call from any worker thread; pair with release().
+        """
+        with self._lock:
+            if self._needs_relaunch():
+                self._launch()
+            else:
+                self.metrics.reuse_count += 1
+                self.logging(
+                    f"Reusing warm Chromium (saved ~{self.metrics.average_launch_seconds:.2f}s).",
+                    "DEBUG",
+                )
+            self._leases += 1
+            return self.cdp_endpoint
+
+    def release(self) -> None:
+        with self._lock:
+            self._leases = max(0, self._leases - 1)
+
+    def _launch(self, ready_timeout: int = 30) -> None:
+        self._cleanup_process()
+        start = time.perf_counter()
+        executable = self._resolve_executable()
+        self._user_data_dir = tempfile.mkdtemp(prefix="intrarulesbot-chromium-")
+
+        args = [
+            executable,
+            # Port 0 lets Chromium pick a free ephemeral port.
+            "--remote-debugging-port=0",
+            f"--user-data-dir={self._user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ]
+        if self.config.headless:
+            args.append("--headless=new")
+        args.append("about:blank")
+
+        self.logging("Launching Chromium.")
+        self._process = subprocess.Popen(
+            args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        self._wait_until_ready(ready_timeout)
+        self._launched_config = replace(self.config)
+
+        elapsed = time.perf_counter() - start
+        self.metrics.launch_count += 1
+        self.metrics.total_launch_seconds += elapsed
+        self.metrics.last_launch_seconds = elapsed
+        self.logging(f"Chromium is ready in {elapsed:.2f}s.")
+
+    def _resolve_executable(self) -> str:
+        with sync_playwright() as playwright:
+            return playwright.chromium.executable_path
+
+    def _read_devtools_port(self) -> int | None:
+        """
+        Reads the port Chromium picked from DevToolsActivePort in the profile
+        directory, once it has been written.
+        """
+        port_file = os.path.join(self._user_data_dir, "DevToolsActivePort")
+        try:
+            with open(port_file, encoding="utf-8") as file:
+                first_line = file.readline().strip()
+        except OSError:
+            return None
+        return int(first_line) if first_line.isdigit() else None
+
+    def _wait_until_ready(self, ready_timeout: int) -> None:
+        deadline = time.monotonic() + ready_timeout
+        while time.monotonic() < deadline:
+            if not self.is_alive():
+                raise RuntimeError("Chromium exited during start up.")
+            if self.cdp_endpoint is None:
+                port = self._read_devtools_port()
+                if port is None:
+                    time.sleep(0.2)
+                    continue
+                self.cdp_endpoint = f"http://127.0.0.1:{port}"
+            try:
+                res = requests.get(f"{self.cdp_endpoint}/json/version", timeout=1)
+                if res.ok:
+                    return
+            except requests.RequestException:
+                pass
+            time.sleep(0.2)
+        self._cleanup_process()
+        raise RuntimeError("Chromium did not expose a CDP endpoint in time.")
+
+    def _cleanup_process(self) -> None:
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+            self._process = None
+
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            self._user_data_dir = None
+        self.cdp_endpoint = None
+        self._launched_config = None
+
+    def close_if_idle(self) -> bool:
+        """
+        Closes the process when no session is attached. Returns False when
+        sessions are still using it.
+        """
+        with self._lock:
+            if self._leases:
+                return False
+            self._close()
+            return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._process is None:
+            return
+        self.logging(
+            f"Closing Chromium. Launches: {self.metrics.launch_count}, "
+            f"reused: {self.metrics.reuse_count}, "
+            f"time saved: ~{self.metrics.time_saved_seconds:.1f}s."
+        )
+        self._cleanup_process()
+        self._leases = 0
@@ -1,4 +1,11 @@
 from .playwright_session import PlaywrightSession
 from .playwright_config import PlaywrightConfig
+from .browser_host_metrics import BrowserHostMetrics
+from .locator_cache_metrics import LocatorCacheMetrics
 
-__all__ = ["PlaywrightSession", "PlaywrightConfig"]
+__all__ = [
+    "PlaywrightSession",
+    "PlaywrightConfig",
+    "BrowserHostMetrics",
+    "LocatorCacheMetrics",
+]
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BrowserHostMetrics:
+    launch_count: int = 0
+    reuse_count: int = 0
+    total_launch_seconds: float = 0.0
+    last_launch_seconds: float = 0.0
+
+    @property
+    def average_launch_seconds(self) -> float:
+        if not self.launch_count:
+            return 0.0
+        return self.total_launch_seconds / self.launch_count
+
+    @property
+    def time_saved_seconds(self) -> float:
+        return self.reuse_count * self.average_launch_seconds
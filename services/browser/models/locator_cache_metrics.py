@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class LocatorCacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / lookups
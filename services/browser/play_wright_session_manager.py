@@ -6,6 +6,7 @@ if TYPE_CHECKING:
     from services.auth.session import BaseProviderSession
     from services.logger.adapters import LogAdapter
     from .models import PlaywrightConfig
+    from .chromium_host import ChromiumHost
 
 import os
 
@@ -21,6 +22,7 @@ class PlaywrightSessionManager:
         provider_session: BaseProviderSession,
         logger: LogAdapter,
         config: PlaywrightConfig,
+        host: ChromiumHost | None = None,
     ):
         self.provider_session = provider_session
         self.logger = logger
@@ -29,6 +31,8 @@ class PlaywrightSessionManager:
         self.context = None
         self.page = None
         self.config = config
+        self.host = host
+        self._holds_lease = False
 
         from utils.files import PathManager
 
@@ -41,14 +45,20 @@ class PlaywrightSessionManager:
 
     def start(self) -> PlaywrightSession:
         self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(
-            headless=self.config.headless, slow_mo=self.config.slow_mo
-        )
+        if self.host is not None:
+            cdp_endpoint = self.host.acquire()
+            self._holds_lease = True
+            self.browser = self.playwright.chromium.connect_over_cdp(
+                cdp_endpoint, slow_mo=self.config.slow_mo
+            )
+        else:
+            self.browser = self.playwright.chromium.launch(
+                headless=self.config.headless, slow_mo=self.config.slow_mo
+            )
         self.context = self.browser.new_context()
 
-        cookies = self.provider_session.convert_jar_to_cookie_list()
-        if self.config.load_cookies and cookies:
-            self.context.add_cookies(cookies)
+        if self.config.load_cookies:
+            self.load_cookies()
 
         self.page = self.context.new_page()
 
@@ -58,6 +68,14 @@ class PlaywrightSessionManager:
             context=self.context,
         )
 
+    def load_cookies(self) -> None:
+        if not self.context:
+            return
+
+        cookies = self.provider_session.convert_jar_to_cookie_list()
+        if cookies:
+            self.context.add_cookies(cookies)
+
     def save_cookies(self) -> None:
         if not self.context:
             return
@@ -66,13 +84,19 @@ class PlaywrightSessionManager:
         self.provider_session.update_cookies_from_list(cookies)
 
     def close(self) -> None:
-        self.save_cookies()
-
-        if self.context:
-            self.context.close()
-
-        if self.browser:
-            self.browser.close()
-
-        if self.playwright:
-            self.playwright.stop()
+        try:
+            self.save_cookies()
+
+            if self.context:
+                self.context.close()
+
+            # Over CDP this only disconnects; the shared host keeps running.
+            if self.browser:
+                self.browser.close()
+
+            if self.playwright:
+                self.playwright.stop()
+        finally:
+            if self._holds_lease:
+                self._holds_lease = False
+                self.host.release()
@@ -3,7 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    from playwright.sync_api import FrameLocator
+    from playwright.sync_api import FrameLocator, Locator
+
+    from ..models import LocatorCacheMetrics
 from .interaction_port import InteractionPort
 
 
@@ -20,12 +22,16 @@ class BrowserPort(InteractionPort, Protocol):
 
     def screenshot(self, path: str) -> None: ...
 
+    def locator_cache_metrics(self) -> LocatorCacheMetrics: ...
+
     def click_and_accept_alert_if_appears(
         self,
         selector: str,
         check_alert_text: str | None = None,
         timeout: int = 3000,
         click_timeout: int = 60000,
+        success_locator: Locator | None = None,
+        success_state: str = "visible",
     ) -> bool: ...
 
     def frame_click_and_accept_alert_if_appears(
@@ -34,6 +40,8 @@ class BrowserPort(InteractionPort, Protocol):
         click_selector: str,
         check_alert_text: str | None = None,
         timeout: int = 3000,
+        success_locator: Locator | None = None,
+        success_state: str = "visible",
     ) -> bool: ...
 
     def frame_select_from_list_and_accept_alert_if_appears(
@@ -43,6 +51,8 @@ class BrowserPort(InteractionPort, Protocol):
         text_to_select: str,
         check_alert_text: str | None = None,
         timeout: int = 3000,
+        success_locator: Locator | None = None,
+        success_state: str = "visible",
     ) -> bool: ...
 
     def wait_for_page_ready(self, timeout: int = 30000) -> None: ...
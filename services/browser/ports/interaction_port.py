@@ -128,6 +128,10 @@ class InteractionPort(Protocol):
         self, parent: Locator, selector: str, attribute: str, timeout: int = 30000
     ) -> str: ...
 
+    def get_row_attributes(
+        self, row_selector: str, child_selectors: list[str], attribute: str
+    ) -> list[list[str]]: ...
+
     def verify_locator_present(self, locator: Locator, timeout: int = 5000) -> None: ...
 
     def verify_locator_not_present(
@@ -1,4 +1,5 @@
 from .json_file_service import JSONFileService
 from .spreadsheet_file_service import SpreadsheetFileService
+from .spreadsheet_stream_worker import SpreadsheetStreamWorker
 
-__all__ = ["JSONFileService", "SpreadsheetFileService"]
+__all__ = ["JSONFileService", "SpreadsheetFileService", "SpreadsheetStreamWorker"]
@@ -1,9 +1,10 @@
 from .json_file import JSONLoadResult, JSONSaveResult
-from .sheets_file import SheetsLoadResult, ImportedSheetsRow
+from .sheets_file import SheetsLoadResult, SheetsStreamResult, ImportedSheetsRow
 
 __all__ = [
     "JSONLoadResult",
     "JSONSaveResult",
     "SheetsLoadResult",
+    "SheetsStreamResult",
     "ImportedSheetsRow",
 ]
@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 
 @dataclass(frozen=True)
@@ -15,3 +17,30 @@ class SheetsLoadResult:
     file_path: Path
     rows: list[ImportedSheetsRow] = field(default_factory=list)
     message: str | None = None
+
+
+@dataclass(frozen=True)
+class SheetsStreamResult:
+    """
+    An opened sheet whose header row has been checked. `rows` is a generator
+    over the data rows that closes the file once it is exhausted. Call
+    `close` when the rows are not read to the end, since closing a generator
+    that was never started does not close the file.
+    `row_estimate` comes from the sheet dimensions and may be missing or off.
+    """
+
+    ok: bool
+    file_path: Path
+    headers: list[str] = field(default_factory=list)
+    rows: Iterator[ImportedSheetsRow] = field(default_factory=lambda: iter(()))
+    row_estimate: int | None = None
+    message: str | None = None
+    closer: Callable[[], None] | None = None
+
+    def close(self) -> None:
+        """Stops the rows generator and closes the workbook or file."""
+        close_rows = getattr(self.rows, "close", None)
+        if close_rows is not None:
+            close_rows()
+        if self.closer is not None:
+            self.closer()
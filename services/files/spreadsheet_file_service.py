@@ -1,17 +1,23 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, TextIO
 
 if TYPE_CHECKING:
+    from openpyxl import Workbook
     from ..logger.adapters import LogAdapter
 
+import csv
+from itertools import zip_longest
 from pathlib import Path
 from openpyxl import load_workbook
 from openpyxl.utils.exceptions import InvalidFileException
-from .models import SheetsLoadResult, ImportedSheetsRow
+from .models import SheetsLoadResult, SheetsStreamResult, ImportedSheetsRow
 from base import ServiceBase
 
 
 class SpreadsheetFileService(ServiceBase):
+    # Delimited text files are read with the csv module, anything else is
+    # opened as an Excel workbook.
+    DELIMITERS = {".csv": ",", ".tsv": "\t"}
 
     def __init__(self, logger: LogAdapter):
         super().__init__(logger)
@@ -19,68 +25,216 @@ class SpreadsheetFileService(ServiceBase):
     def load(
         self, file_path: Path, required_headers: set | None = None
     ) -> SheetsLoadResult:
+        return self.read_stream(self.open_stream(file_path, required_headers))
+
+    def read_stream(self, stream: SheetsStreamResult) -> SheetsLoadResult:
+        """Reads the rest of an opened stream into a SheetsLoadResult."""
+        file_path = stream.file_path
+        if not stream.ok:
+            return SheetsLoadResult(
+                ok=False, file_path=file_path, message=stream.message
+            )
 
+        try:
+            imported_rows = list(stream.rows)
+        except Exception as e:
+            return SheetsLoadResult(
+                ok=False, file_path=file_path, message=self._read_error(file_path, e)
+            )
+        finally:
+            stream.close()
+
+        message = f"File Successfully loaded {file_path}"
+        self._logging(message, "INFO")
+        return SheetsLoadResult(
+            ok=True, file_path=file_path, rows=imported_rows, message=message
+        )
+
+    def open_stream(
+        self, file_path: Path, required_headers: set | None = None
+    ) -> SheetsStreamResult:
+        """
+        Opens the sheet and checks the header row only. The data rows are
+        read lazily through the returned result's `rows` generator, so the
+        sheet is never held in memory as a whole.
+
+        .csv and .tsv files are read as delimited text, which is much faster
+        than parsing a workbook.
+        """
+        delimiter = self.DELIMITERS.get(Path(file_path).suffix.lower())
+        if delimiter:
+            return self._open_delimited_stream(file_path, required_headers, delimiter)
+
+        workbook = None
         try:
             workbook = load_workbook(file_path, read_only=True, data_only=True)
             sheet = workbook.active
+            sheet_rows = sheet.iter_rows(values_only=True)
+
+            header_row = next(sheet_rows, None)
+            if header_row is None:
+                message = "Sheet does not have any rows."
+                self._logging(message, "ERROR")
+                workbook.close()
+                return SheetsStreamResult(
+                    ok=False, file_path=file_path, message=message
+                )
 
-            rows = list(sheet.iter_rows(values_only=True))
+            headers = [str(value).strip() if value else "" for value in header_row]
 
-            if not rows:
+            message = self._missing_headers_message(headers, required_headers)
+            if message:
+                workbook.close()
+                return SheetsStreamResult(
+                    ok=False, file_path=file_path, message=message
+                )
+
+            row_estimate = sheet.max_row - 1 if sheet.max_row else None
+            return SheetsStreamResult(
+                ok=True,
+                file_path=file_path,
+                headers=headers,
+                rows=self._iter_sheet_rows(workbook, sheet_rows, headers),
+                row_estimate=row_estimate,
+                message=f"File opened {file_path}",
+                closer=workbook.close,
+            )
+        except Exception as e:
+            if workbook is not None:
+                workbook.close()
+            return SheetsStreamResult(
+                ok=False, file_path=file_path, message=self._read_error(file_path, e)
+            )
+
+    def _open_delimited_stream(
+        self, file_path: Path, required_headers: set | None, delimiter: str
+    ) -> SheetsStreamResult:
+        text_file = None
+        try:
+            row_estimate = self._count_data_lines(file_path)
+            text_file = open(file_path, newline="", encoding="utf-8-sig")
+            reader = csv.reader(text_file, delimiter=delimiter)
+
+            header_row = next(reader, None)
+            if header_row is None:
                 message = "Sheet does not have any rows."
                 self._logging(message, "ERROR")
-                return SheetsLoadResult(
-                    ok=False,
-                    file_path=file_path,
-                    message=message,
+                text_file.close()
+                return SheetsStreamResult(
+                    ok=False, file_path=file_path, message=message
                 )
 
-            headers = [str(value).strip() if value else "" for value in rows[0]]
-            imported_rows = []
-
-            if required_headers:
-                missing_headers = required_headers.difference(headers)
-                if missing_headers:
-                    message = f'Missing Required Headers: {", ".join(missing_headers)}'
-                    self._logging(message, "ERROR")
-                    return SheetsLoadResult(
-                        ok=False,
-                        file_path=file_path,
-                        message=message,
-                    )
-
-            for excel_row_number, row_values in enumerate(rows[1:], start=2):
-                row_data = {
-                    headers[index]: value
-                    for index, value in enumerate(row_values)
-                    if index < len(headers)
-                }
-                ImportedSheetsRow(row_number=excel_row_number, values=row_data)
-                imported_rows.append(
-                    ImportedSheetsRow(row_number=excel_row_number, values=row_data)
+            headers = [value.strip() for value in header_row]
+            message = self._missing_headers_message(headers, required_headers)
+            if message:
+                text_file.close()
+                return SheetsStreamResult(
+                    ok=False, file_path=file_path, message=message
                 )
-            message = f"File Successfully loaded {file_path}"
-            self._logging(message, "INFO")
-            return SheetsLoadResult(
-                ok=True, file_path=file_path, rows=imported_rows, message=message
+
+            return SheetsStreamResult(
+                ok=True,
+                file_path=file_path,
+                headers=headers,
+                rows=self._iter_delimited_rows(text_file, reader, headers),
+                row_estimate=row_estimate,
+                message=f"File opened {file_path}",
+                closer=text_file.close,
             )
-        except FileNotFoundError:
+        except Exception as e:
+            if text_file is not None:
+                text_file.close()
+            return SheetsStreamResult(
+                ok=False, file_path=file_path, message=self._read_error(file_path, e)
+            )
+
+    def _missing_headers_message(
+        self, headers: list[str], required_headers: set | None
+    ) -> str | None:
+        if not required_headers:
+            return None
+        missing_headers = required_headers.difference(headers)
+        if not missing_headers:
+            return None
+        message = f'Missing Required Headers: {", ".join(missing_headers)}'
+        self._logging(message, "ERROR")
+        return message
+
+    def _count_data_lines(self, file_path: Path) -> int:
+        """
+        Counts the lines after the header without parsing them. Quoted values
+        that span lines make this an overestimate, which is fine for sizing.
+        """
+        lines = 0
+        last_byte = b"\n"
+        with open(file_path, "rb") as binary_file:
+            while block := binary_file.read(1 << 20):
+                lines += block.count(b"\n")
+                last_byte = block[-1:]
+        if last_byte != b"\n":
+            lines += 1
+        return max(0, lines - 1)
+
+    def _iter_delimited_rows(
+        self, text_file: TextIO, reader, headers: list[str]
+    ) -> Iterator[ImportedSheetsRow]:
+        """
+        Yields the rows like the workbook reader does: empty cells and
+        missing trailing cells are None, extra cells are dropped and blank
+        lines are skipped.
+        """
+        header_count = len(headers)
+        try:
+            # Rows are numbered by the line they start on, since a quoted
+            # value can span lines.
+            row_number = reader.line_num + 1
+            for row_values in reader:
+                if not row_values:
+                    row_number = reader.line_num + 1
+                    continue
+                yield ImportedSheetsRow(
+                    row_number=row_number,
+                    values={
+                        header: value or None
+                        for header, value in zip_longest(
+                            headers, row_values[:header_count]
+                        )
+                    },
+                )
+                row_number = reader.line_num + 1
+        finally:
+            text_file.close()
+
+    def _iter_sheet_rows(
+        self, workbook: Workbook, sheet_rows: Iterator[tuple], headers: list[str]
+    ) -> Iterator[ImportedSheetsRow]:
+        header_count = len(headers)
+        try:
+            for excel_row_number, row_values in enumerate(sheet_rows, start=2):
+                yield ImportedSheetsRow(
+                    row_number=excel_row_number,
+                    values=dict(zip_longest(headers, row_values[:header_count])),
+                )
+        finally:
+            workbook.close()
+
+    def _read_error(self, file_path: Path, error: Exception) -> str:
+        if isinstance(error, FileNotFoundError):
             message = f"File not found: {file_path}"
             self._logging(message, "ERROR")
-            return SheetsLoadResult(ok=False, file_path=file_path, message=message)
-
-        except InvalidFileException as e:
+        elif isinstance(error, InvalidFileException):
             message = "Invalid Excel file"
             self._logging(message, "ERROR")
-            self._logging(f"Invalid Excel file: {e}", "DEBUG")
-            return SheetsLoadResult(ok=False, file_path=file_path, message=message)
-
-        except PermissionError:
+            self._logging(f"Invalid Excel file: {error}", "DEBUG")
+        elif isinstance(error, (csv.Error, UnicodeDecodeError)):
+            message = "Invalid CSV file"
+            self._logging(message, "ERROR")
+            self._logging(f"Invalid CSV file: {error}", "DEBUG")
+        elif isinstance(error, PermissionError):
             message = f"Permission denied while reading file: {file_path}"
             self._logging(message, "ERROR")
-            return SheetsLoadResult(ok=False, file_path=file_path, message=message)
-        except Exception as e:
+        else:
             message = "Unexpected error occurred import sheets file."
             self._logging(message, "ERROR")
-            self._logging(f"Unexpected Error: {e}", "DEBUG")
-            return SheetsLoadResult(ok=False, file_path=file_path, message=message)
+            self._logging(f"Unexpected Error: {error}", "DEBUG")
+        return message
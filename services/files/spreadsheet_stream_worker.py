@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from services.logger.adapters import LogAdapter
+    from .models import SheetsStreamResult
+
+from itertools import islice
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class SpreadsheetStreamWorker(QObject):
+    """
+    Reads an opened sheet stream one chunk at a time on its own thread.
+
+    Reading is pulled: every read_chunk call reads at most `chunk_size` rows
+    and emits them, so the caller decides how far ahead of validation and the
+    runner the file is read and memory stays bounded.
+    """
+
+    chunk_read = Signal(list)
+    finished = Signal(int)
+    failed = Signal(str)
+    closed = Signal()
+
+    def __init__(self, stream: SheetsStreamResult, chunk_size: int, logger: LogAdapter):
+        super().__init__()
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.logger = logger
+        self.rows_read = 0
+        self._closed = False
+
+    def logging(self, msg, level="INFO", print_msg=True) -> None:
+        msg = f"{self.__class__.__name__}: {msg}"
+        self.logger(msg, level, print_msg)
+
+    @Slot()
+    def read_chunk(self) -> None:
+        if self._closed:
+            return
+        try:
+            chunk = list(islice(self.stream.rows, self.chunk_size))
+        except Exception as e:
+            self.logging(f"Error reading sheet: {e}", "ERROR")
+            self.close()
+            self.failed.emit(str(e))
+            return
+
+        self.rows_read += len(chunk)
+        if chunk:
+            self.chunk_read.emit(chunk)
+        if len(chunk) < self.chunk_size:
+            self.close()
+            self.finished.emit(self.rows_read)
+
+    @Slot()
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self.stream.close()
+        self.closed.emit()
@@ -55,23 +55,103 @@ class IntraAuthService(BaseAuthService):
     ) -> AuthResult:
 
         result = self.validate()
+        profile = self.profile_registry.get_profile(creds.platform_version)
+        log_selectors = profile.selectors.login
+
+        probe_result = None
         if not force_login and result.cookies_valid:
-            return AuthResult(
-                success=True,
-                status=AUTHSTATUS.ALREADY_AUTHENTICATED,
-                message=f"{self.provider_name} is authenticated.",
+            if browser_port is None:
+                return AuthResult(
+                    success=True,
+                    status=AUTHSTATUS.ALREADY_AUTHENTICATED,
+                    message=f"{self.provider_name} is authenticated.",
+                )
+            probe_result = self.probe_session(
+                creds, browser_port, log_selectors, should_stop_cb
             )
+            if probe_result.status != AUTHSTATUS.SESSION_EXPIRED:
+                return probe_result
+            self.logging("Cached session was rejected. Falling back to login form.")
 
-        if not force_login and not self.can_attempt_login():
+        elif not force_login and not self.can_attempt_login():
             self.logging("Login cooldown active", "WARN")
             return AuthResult(
                 success=False,
                 status=AUTHSTATUS.COOLDOWN,
                 message="Login cooldown active",
             )
-        profile = self.profile_registry.get_profile(creds.platform_version)
-        log_selectors = profile.selectors.login
-        return self.login(creds, browser_port, log_selectors, should_stop_cb)
+
+        login_result = self.login(creds, browser_port, log_selectors, should_stop_cb)
+        if probe_result is not None:
+            login_result.probe_seconds = probe_result.probe_seconds
+        return login_result
+
+    def probe_session(
+        self,
+        creds: IntraLogin,
+        browser_port: BrowserPort,
+        selectors: LoginSelectors,
+        should_stop_cb,
+    ) -> AuthResult:
+        """
+        Checks the cookies already injected into the browser context with a single
+        navigation. The session is usable if the main page container renders.
+        """
+        start = time.perf_counter()
+        result = self._perform_probe(creds, browser_port, selectors, should_stop_cb)
+        result.probe_seconds = time.perf_counter() - start
+        self.logging(f"Session probe took {result.probe_seconds:.2f}s.", "DEBUG")
+        return result
+
+    def _perform_probe(
+        self,
+        creds: IntraLogin,
+        browser_port: BrowserPort,
+        selectors: LoginSelectors,
+        should_stop_cb,
+    ) -> AuthResult:
+        try:
+            self.check_shutdown(should_stop_cb)
+            browser_port.goto(f"https://{creds.tenant}.intradiem.com/")
+            self.check_shutdown(should_stop_cb)
+            browser_port.wait_for_page_ready()
+            if browser_port.is_visible(selectors.main_page_container, 5000):
+                msg = "Cached session is valid. Skipping login."
+                self.logging(msg)
+                return AuthResult(
+                    success=True, status=AUTHSTATUS.ALREADY_AUTHENTICATED, message=msg
+                )
+            return AuthResult(
+                success=False,
+                status=AUTHSTATUS.SESSION_EXPIRED,
+                message="Cached session is no longer valid.",
+            )
+        except PlaywrightError as e:
+            if should_stop_cb is not None and should_stop_cb():
+                return AuthResult(
+                    success=False,
+                    status=AUTHSTATUS.STOPPED_REQUESTED,
+                    message="Stop Requested",
+                )
+            msg = "Error Occurred while checking the session. The browser was closed"
+            self.logging(msg, "ERROR")
+            self.logging(str(e), "DEBUG")
+            return AuthResult(
+                success=False, status=AUTHSTATUS.BROWSER_ERROR, message=msg
+            )
+        except Exception as e:
+            if should_stop_cb is not None and should_stop_cb():
+                return AuthResult(
+                    success=False,
+                    status=AUTHSTATUS.STOPPED_REQUESTED,
+                    message="Stop Requested",
+                )
+            self.logging(f"Error: {str(e)}", "DEBUG")
+            return AuthResult(
+                success=False,
+                status=AUTHSTATUS.SESSION_EXPIRED,
+                message="Could not verify the cached session.",
+            )
 
     def login(
         self,
@@ -80,7 +160,9 @@ class IntraAuthService(BaseAuthService):
         selectors: LoginSelectors,
         should_stop_cb,
     ) -> AuthResult:
+        start = time.perf_counter()
         result = self._perform_login(creds, browser_port, selectors, should_stop_cb)
+        result.login_seconds = time.perf_counter() - start
         self.last_login_attempt = time.time()
 
         return result
@@ -146,7 +228,9 @@ class IntraAuthService(BaseAuthService):
         browser_port.fill(selectors.password_input, creds.password)
 
         alert = browser_port.click_and_accept_alert_if_appears(
-            selectors.submit_button, timeout=5000
+            selectors.submit_button,
+            timeout=5000,
+            success_locator=browser_port.locator(selectors.main_page_container),
         )
         if alert:
             self.logging(
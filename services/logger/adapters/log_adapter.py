@@ -1,9 +1,93 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from ..run_log import RunLogSink
+
 from base.enums import LOGLEVEL
 
 
 class LogAdapter:
-    def __init__(self, logger):
+    """
+    Callable the services log through. Lines below the logger's active level
+    are dropped here, on the calling thread, before they are formatted or
+    sent to the log worker. The message can be a callable returning the
+    text, or a %-style format string with `args`, so a disabled call never
+    builds its text.
+    """
+
+    LEVEL_PRIORITY = {
+        LOGLEVEL.DEBUG: 10,
+        LOGLEVEL.INFO: 20,
+        LOGLEVEL.WARN: 30,
+        LOGLEVEL.ERROR: 40,
+    }
+
+    def __init__(self, logger, run_log: RunLogSink | None = None):
         self.logger = logger
+        self.run_log = run_log
+
+    @property
+    def log_dir(self) -> str | None:
+        return getattr(self.logger, "log_file_path", None)
+
+    @property
+    def structured_run_logs(self) -> bool:
+        return str(getattr(self.logger, "log_structured_runs", False)) == "True"
+
+    def with_run_log(self, run_log: RunLogSink) -> LogAdapter:
+        """
+        Returns an adapter for one run that logs to the same logger and also
+        writes every line to the run's structured log.
+        """
+        return LogAdapter(self.logger, run_log)
+
+    def is_enabled_for(self, level: LOGLEVEL) -> bool:
+        # The logger's level is read on every call so a settings change
+        # applies straight away. Loggers without one log everything.
+        active_level = getattr(self.logger, "log_level", None)
+        if not active_level:
+            return True
+        # Unknown levels are logged as INFO by the log worker.
+        priority = self.LEVEL_PRIORITY.get(level, 20)
+        return priority >= self.LEVEL_PRIORITY.get(active_level, 20)
+
+    def wants(self, level: LOGLEVEL) -> bool:
+        """
+        Whether a line at this level goes anywhere. The structured run log
+        takes every level, so the step records are there at INFO too.
+        """
+        return self.run_log is not None or self.is_enabled_for(level)
+
+    @staticmethod
+    def render(
+        msg: str | Callable[[], str], args: tuple = (), source: str | None = None
+    ) -> str:
+        text = msg() if callable(msg) else msg
+        if args:
+            text = text % args
+        return f"{source}: {text}" if source else text
 
-    def __call__(self, msg: str, level: LOGLEVEL, print_msg=True) -> None:
-        self.logger.insert(msg, level, print_msg)
+    def __call__(
+        self,
+        msg: str | Callable[[], str],
+        level: LOGLEVEL = LOGLEVEL.INFO,
+        print_msg=True,
+        args: tuple = (),
+        source: str | None = None,
+        **context,
+    ) -> None:
+        """
+        Logs a line. `source` is put in front of the text as "source: ". The
+        keyword context (guid, scope, task, index, status, duration_ms) only
+        goes to the structured run log, if one is bound.
+        """
+        enabled = self.is_enabled_for(level)
+        if not enabled and self.run_log is None:
+            return
+        text = self.render(msg, args, source)
+        if enabled:
+            self.logger.insert(text, level, print_msg)
+        if self.run_log is not None:
+            self.run_log.write(level, text, context)
@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+from logging import LogRecord
+from logging.handlers import RotatingFileHandler
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that can hold its writes in the file buffer.
+
+    Inside `buffered()` records are written without the per record flush,
+    and the rollover check keeps a running size of the file instead of
+    stat-ing and seeking it for every record. The stream is flushed once
+    when the block ends.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._buffering = False
+        self._size: int | None = None
+        super().__init__(*args, **kwargs)
+
+    @contextmanager
+    def buffered(self):
+        self._buffering = True
+        try:
+            yield self
+        finally:
+            self._buffering = False
+            self._size = None
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffering:
+            super().flush()
+
+    def emit(self, record: LogRecord) -> None:
+        if not self._buffering:
+            super().emit(record)
+            return
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self._size is None:
+                self._size = self.stream.tell()
+            # Characters, not bytes, close enough for a size limit.
+            if self.maxBytes > 0 and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                self._size = 0
+            self.stream.write(msg)
+            self._size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
@@ -2,18 +2,23 @@ import logging
 import queue
 import threading
 import time
-from logging.handlers import RotatingFileHandler
+from contextlib import nullcontext
 
 from PySide6.QtCore import QMutex, QMutexLocker, QThread, Signal, Slot
 
 from base.enums import LOGLEVEL
 
+from .buffered_rotating_file_handler import BufferedRotatingFileHandler
+
 
 class LogWorker(QThread):
     """
     Worker thread responsible for managing logging operations, including writing log messages
     to a file and emitting log signals. It handles logging asynchronously and supports log rotation.
 
+    The queue is drained in batches of up to MAX_BATCH lines: each batch is written under one lock
+    with a single flush of the log file and sent out in one log_signal.
+
     Attributes:
         log_queue (queue.Queue): Queue for storing log messages before writing.
         log_file_path (str): Path where log files are stored.
@@ -25,12 +30,22 @@ class LogWorker(QThread):
         stop_event (bool): Flag to stop the logging thread.
         mutex (QMutex): Mutex to ensure thread-safe logging operations.
         logger (logging.Logger): Logger instance for handling log file writing.
+        log_handler (BufferedRotatingFileHandler | None): The rotating file handler the logs are written to.
 
     Signals:
-        log_signal (Signal[str]): Signal emitted with log messages after they are written to the log file.
+        log_signal (Signal[list]): Signal emitted with a batch of log messages after they are written to the log file.
     """
 
-    log_signal = Signal(str)
+    log_signal = Signal(list)
+
+    MAX_BATCH = 1000
+
+    LOGGING_LEVELS = {
+        LOGLEVEL.DEBUG: logging.DEBUG,
+        LOGLEVEL.INFO: logging.INFO,
+        LOGLEVEL.WARN: logging.WARNING,
+        LOGLEVEL.ERROR: logging.ERROR,
+    }
 
     def __init__(
         self,
@@ -65,6 +80,7 @@ class LogWorker(QThread):
 
         self.stop_event = False
         self.mutex = QMutex()
+        self.log_handler = None
 
         self.LOGLEVEL_PRIORITY = {
             LOGLEVEL.DEBUG: 10,
@@ -92,7 +108,7 @@ class LogWorker(QThread):
             self.log_file_max_mbs = 5
 
         if not self.logger.handlers:
-            logfile = RotatingFileHandler(
+            logfile = BufferedRotatingFileHandler(
                 complete_path,
                 maxBytes=self.log_file_max_mbs * 1024 * 1024,
                 backupCount=self.log_backup_count,
@@ -101,6 +117,7 @@ class LogWorker(QThread):
                 logging.Formatter("%(asctime)s %(levelname)s %(message)s")
             )
             self.logger.addHandler(logfile)
+            self.log_handler = logfile
 
             self.insert_log(
                 (
@@ -145,30 +162,74 @@ class LogWorker(QThread):
     def run(self) -> None:
         """
         Processes the log queue and writes log messages to the file asynchronously.
-        Emits a signal with the log message after it is written.
+        Waits for a log message, drains whatever else is queued behind it and writes
+        the batch. Emits one signal with the batch after it is written. The file is
+        flushed once more when the worker stops.
 
         Returns:
             None: This function does not return a value.
         """
         while not self.stop_event or not self.log_queue.empty():
             try:
-                current_time_str = time.asctime(time.localtime())
-                level, msg = self.log_queue.get(timeout=1)
-                with QMutexLocker(self.mutex):
-                    if level == LOGLEVEL.INFO:
-                        self.logger.info(msg)
-                    elif level == LOGLEVEL.ERROR:
-                        self.logger.error(msg)
-                    elif level == LOGLEVEL.DEBUG:
-                        self.logger.debug(msg)
-                    elif level == LOGLEVEL.WARN:
-                        self.logger.warning(msg)
-                    self.log_signal.emit(f"{current_time_str} - {level} - {msg}")
-                self.log_queue.task_done()
+                batch = [self.log_queue.get(timeout=1)]
             except queue.Empty:
                 continue
+            try:
+                while len(batch) < self.MAX_BATCH:
+                    batch.append(self.log_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            try:
+                self.write_batch(batch)
             except Exception as e:
                 print(f"Logging error: {e}")
+            finally:
+                for _ in batch:
+                    self.log_queue.task_done()
+        self.flush()
+
+    def write_batch(self, batch: list[tuple]) -> None:
+        """
+        Writes a batch of log messages under one lock and one file flush, then emits them.
+
+        Args:
+            batch (list[tuple]): (level, message) pairs in the order they were queued.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        current_time_str = time.asctime(time.localtime())
+        with QMutexLocker(self.mutex):
+            buffered = (
+                self.log_handler.buffered() if self.log_handler else nullcontext()
+            )
+            with buffered:
+                for level, msg in batch:
+                    levelno = self.LOGGING_LEVELS[level]
+                    if not self.logger.isEnabledFor(levelno):
+                        continue
+                    # The file format has no caller info, so skip the
+                    # stack walk Logger.log does to find it.
+                    self.logger.handle(
+                        self.logger.makeRecord(
+                            self.logger.name, levelno, "", 0, msg, None, None
+                        )
+                    )
+        self.log_signal.emit(
+            [f"{current_time_str} - {level} - {msg}" for level, msg in batch]
+        )
+
+    def flush(self) -> None:
+        """
+        Flushes the log file.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with QMutexLocker(self.mutex):
+            for handler in self.logger.handlers:
+                handler.flush()
 
     def stop(self) -> None:
         """
@@ -25,9 +25,10 @@ class Logger(QObject, metaclass=QSingleton):
     It interacts with a background worker thread to handle logging asynchronously.
     """
 
-    send_log = Signal(str)
+    send_log = Signal(list)
     submit_log = Signal(tuple)
     shutdown_ready = Signal(str)
+    console_max_lines_changed = Signal(int)
 
     def __init__(self):
         super().__init__()
@@ -43,8 +44,10 @@ class Logger(QObject, metaclass=QSingleton):
         self.log_file_max_mbs = None
         self.log_backup_count = None
         self.log_keep_files_days = None
+        self.log_console_max_lines = None
         self.log_level = None
         self.log_print_logs = True
+        self.log_structured_runs = "False"
 
     def start_up(self):
         if not self._settings_loaded:
@@ -88,11 +91,11 @@ class Logger(QObject, metaclass=QSingleton):
     def set_log_service_started(self, status: bool):
         self._logger_started = status
 
-    def send_logs_out(self, msg: str) -> None:
+    def send_logs_out(self, logs: list[str]) -> None:
         """
-        Emits the send_log signal with the given log message.
+        Emits the send_log signal with the given batch of log messages.
         """
-        self.send_log.emit(msg)
+        self.send_log.emit(logs)
 
     @Slot(str, str, bool)
     def insert(
@@ -118,6 +121,14 @@ class Logger(QObject, metaclass=QSingleton):
             if not hasattr(self, event.field):
                 raise ValueError(f"{event.field} not defined in class")
             setattr(self, event.field, event.value)
+            # The Logs page applies its line limit itself, the worker does
+            # not need a restart for it.
+            if event.field == "log_console_max_lines":
+                self.console_max_lines_changed.emit(int(event.value))
+                return
+            # Read by the runners when a run starts.
+            if event.field == "log_structured_runs":
+                return
             self.insert(
                 f"{self.__class__.__name__}: Logging settings changed. Restarting Logger to Apply Settings.",
                 LOGLEVEL.INFO,
@@ -0,0 +1,4 @@
+from .run_log_query import RunLogQuery
+from .run_log_sink import RunLogSink
+
+__all__ = ["RunLogQuery", "RunLogSink"]
@@ -0,0 +1,4 @@
+from .run_log_record import RunLogRecord
+from .task_failure_summary import TaskFailureSummary
+
+__all__ = ["RunLogRecord", "TaskFailureSummary"]
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class RunLogRecord:
+    run_id: str
+    level: str
+    msg: str
+    # time.monotonic() for ordering and deltas, time.time() for reading.
+    ts: float
+    time: float
+    guid: str | None = None
+    scope: str | None = None
+    task: str | None = None
+    index: int | None = None
+    status: str | None = None
+    duration_ms: float | None = None
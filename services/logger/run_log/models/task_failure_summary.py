@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class TaskFailureSummary:
+    task_key: str
+    status: str
+    count: int
+    items: int
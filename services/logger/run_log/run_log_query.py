@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+
+from ...monitor.models import StepTiming, TaskTimingSummary
+from ...monitor.timing import StepTimingRecorder
+from .models import RunLogRecord, TaskFailureSummary
+
+
+class RunLogQuery:
+    """
+    Reads a RunLogSink file back for post-mortem analysis. The step records
+    the executors log (the ones with a duration) are replayed through a
+    StepTimingRecorder for the per task latencies, the same p50/p95 the
+    run timeline export uses.
+    """
+
+    SUCCESS_STATUS = "success"
+
+    def __init__(self, records: list[RunLogRecord]):
+        self.records = records
+
+    @classmethod
+    def load(cls, path: str) -> RunLogQuery:
+        records = []
+        with open(path, encoding="utf-8") as log_file:
+            for line in log_file:
+                try:
+                    records.append(RunLogRecord(**json.loads(line)))
+                except (json.JSONDecodeError, TypeError):
+                    # A line cut off by a crash.
+                    continue
+        return cls(records)
+
+    @property
+    def run_ids(self) -> list[str]:
+        return list(dict.fromkeys(record.run_id for record in self.records))
+
+    def step_timings(self) -> list[StepTiming]:
+        return [
+            StepTiming(
+                item_guid=record.guid or "",
+                item_name="",
+                scope=record.scope or "",
+                task=record.task or "",
+                status=record.status or "",
+                started_at=record.time - record.duration_ms / 1000,
+                duration_ms=record.duration_ms,
+                index=record.index,
+            )
+            for record in self.records
+            if record.duration_ms is not None
+        ]
+
+    def task_latencies(self) -> list[TaskTimingSummary]:
+        """Returns p50/p95/max per scope/task, slowest p95 first."""
+        recorder = StepTimingRecorder("run_log")
+        for timing in self.step_timings():
+            recorder.record(timing)
+        return recorder.summarize()
+
+    def failures(self) -> list[TaskFailureSummary]:
+        """
+        Returns the failed steps grouped by scope/task and status, most
+        frequent first, with how many distinct items hit each.
+        """
+        counts: dict[tuple[str, str], int] = defaultdict(int)
+        items: dict[tuple[str, str], set[str]] = defaultdict(set)
+        for timing in self.step_timings():
+            if timing.status == self.SUCCESS_STATUS:
+                continue
+            key = (timing.task_key, timing.status)
+            counts[key] += 1
+            items[key].add(timing.item_guid)
+        summaries = [
+            TaskFailureSummary(
+                task_key=task_key,
+                status=status,
+                count=count,
+                items=len(items[(task_key, status)]),
+            )
+            for (task_key, status), count in counts.items()
+        ]
+        summaries.sort(key=lambda summary: summary.count, reverse=True)
+        return summaries
+
+    def errors(self, guid: str | None = None) -> list[RunLogRecord]:
+        """Returns the ERROR records, optionally for one rule or queue."""
+        return [
+            record
+            for record in self.records
+            if record.level == "ERROR" and (guid is None or record.guid == guid)
+        ]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import asdict
+from datetime import datetime
+from threading import Lock
+
+from .models import RunLogRecord
+
+
+class RunLogSink:
+    """
+    Structured JSONL log of one rule or queue run, written next to the text
+    log. LogAdapter.with_run_log binds a sink to an adapter so every line a
+    run logs is also written here as a RunLogRecord with the item guid,
+    scope, task and index it was logged from.
+
+    Workers in the same run share one sink, so writes are lock protected.
+    A failed write turns the sink off for the rest of the run instead of
+    failing the run.
+    """
+
+    FOLDER = "run_logs"
+
+    def __init__(self, path: str, run_id: str):
+        self.path = path
+        self.run_id = run_id
+        self._lock = Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    @classmethod
+    def create(cls, log_dir: str, run_name: str, run_id: str) -> RunLogSink:
+        folder = os.path.join(log_dir, cls.FOLDER)
+        os.makedirs(folder, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        return cls(
+            os.path.join(folder, f"{run_name}-{stamp}-{run_id[:8]}.jsonl"), run_id
+        )
+
+    def write(self, level: str, msg: str, context: dict) -> None:
+        record = RunLogRecord(
+            run_id=self.run_id,
+            level=str(level),
+            msg=msg,
+            ts=time.monotonic(),
+            time=time.time(),
+            guid=context.get("guid"),
+            scope=self._str_or_none(context.get("scope")),
+            task=self._str_or_none(context.get("task")),
+            index=context.get("index"),
+            status=self._str_or_none(context.get("status")),
+            duration_ms=context.get("duration_ms"),
+        )
+        line = json.dumps(asdict(record), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.write(line)
+            except (OSError, ValueError) as e:
+                print(f"Run log disabled, could not write {self.path}: {e}")
+                self._file.close()
+                self._file = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @staticmethod
+    def _str_or_none(value) -> str | None:
+        return None if value is None else str(value)
@@ -0,0 +1,3 @@
+from .summary_bucket import SUMMARYBUCKET
+
+__all__ = ["SUMMARYBUCKET"]
@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class SUMMARYBUCKET(StrEnum):
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    RETRYING = "retrying"
+    STOPPED = "stopped"
+    PENDING = "pending"
@@ -1,3 +1,5 @@
 from .run_summary import RunSummary
+from .step_timing import StepTiming
+from .task_timing_summary import TaskTimingSummary
 
-__all__ = ["RunSummary"]
+__all__ = ["RunSummary", "StepTiming", "TaskTimingSummary"]
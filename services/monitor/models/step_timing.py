@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class StepTiming:
+    item_guid: str
+    item_name: str
+    scope: str
+    task: str
+    status: str
+    started_at: float
+    duration_ms: float
+    index: int | None = None
+    detail_type: str | None = None
+
+    @property
+    def task_key(self) -> str:
+        if self.detail_type:
+            return f"{self.scope}/{self.task}/{self.detail_type}"
+        return f"{self.scope}/{self.task}"
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class TaskTimingSummary:
+    task_key: str
+    count: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    total_ms: float
@@ -0,0 +1,3 @@
+from .progress_coalescer import ProgressCoalescer, keep_started_at
+
+__all__ = ["ProgressCoalescer", "keep_started_at"]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Callable, Generic, TypeVar
+
+from threading import Lock
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+T = TypeVar("T")
+
+
+class ProgressCoalescer(QObject, Generic[T]):
+    """
+    Buffers progress events pushed from runner worker threads and flushes
+    them to the thread that owns the coalescer as one list, at most every
+    interval_ms. Only the latest event per key is kept between flushes.
+
+    push is called straight from the worker threads (connect it with
+    Qt.DirectConnection), so a worker emitting many events never queues a
+    signal per event onto the GUI thread.
+
+    Args:
+        key (Callable[[T], str]): Returns the guid an event belongs to.
+        merge (Callable[[T, T], T] | None): Combines the buffered event with
+            a newer one for the same key. Defaults to keeping the newer one.
+        interval_ms (int): Flush cadence, defaults to 100ms (10 Hz).
+    """
+
+    flushed = Signal(list)
+
+    def __init__(
+        self,
+        key: Callable[[T], str],
+        merge: Callable[[T, T], T] | None = None,
+        interval_ms: int = 100,
+        parent: QObject | None = None,
+    ):
+        super().__init__(parent)
+        self._key = key
+        self._merge = merge
+        self._lock = Lock()
+        self._pending: dict[str, T] = {}
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self.flush()
+
+    def push(self, event: T) -> None:
+        key = self._key(event)
+        with self._lock:
+            buffered = self._pending.get(key)
+            if buffered is not None:
+                if event.emitted_at < buffered.emitted_at:
+                    return
+                if self._merge:
+                    event = self._merge(buffered, event)
+            self._pending[key] = event
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            events = list(self._pending.values())
+            self._pending = {}
+        self.flushed.emit(events)
+
+
+def keep_started_at(buffered, event):
+    """
+    The first event for a row carries started_at and later ones leave it
+    unset. Carry it over so coalescing does not drop it from the row.
+    """
+    if event.started_at is None:
+        event.started_at = buffered.started_at
+    return event
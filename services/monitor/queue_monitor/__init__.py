@@ -1,3 +1,3 @@
-from .queue_monitor_store import QueueMonitorStore
+from .queue_monitor_store import QUEUE_SUMMARY_BUCKETS, QueueMonitorStore
 
-__all__ = ["QueueMonitorStore"]
+__all__ = ["QueueMonitorStore", "QUEUE_SUMMARY_BUCKETS"]
@@ -3,16 +3,37 @@ from __future__ import annotations
 from services.queue_runner.enums import QUEUEEXECSTATUS, QUEUERUNSTATUS
 
 from .models import QueueRunRow
+from services.monitor.enums import SUMMARYBUCKET
 from services.monitor.models import RunSummary
+from services.monitor.summary import RunSummaryCounter, StatusIndex
+
+QUEUE_SUMMARY_BUCKETS = {
+    QUEUEEXECSTATUS.SUCCESS: SUMMARYBUCKET.SUCCEEDED,
+    QUEUERUNSTATUS.SUCCESS: SUMMARYBUCKET.SUCCEEDED,
+    QUEUERUNSTATUS.FAILED: SUMMARYBUCKET.FAILED,
+    QUEUEEXECSTATUS.BROWSER_ERROR: SUMMARYBUCKET.FAILED,
+    QUEUEEXECSTATUS.NAME_EXISTS_ERROR: SUMMARYBUCKET.FAILED,
+    QUEUEEXECSTATUS.UNKNOWN_ERROR: SUMMARYBUCKET.FAILED,
+    QUEUEEXECSTATUS.TIMEOUT_ERROR: SUMMARYBUCKET.FAILED,
+    QUEUERUNSTATUS.RETRYING: SUMMARYBUCKET.RETRYING,
+    QUEUEEXECSTATUS.RUNNER_STOPPED_ERROR: SUMMARYBUCKET.STOPPED,
+    QUEUERUNSTATUS.STOPPED: SUMMARYBUCKET.STOPPED,
+    QUEUEEXECSTATUS.PENDING: SUMMARYBUCKET.PENDING,
+    QUEUERUNSTATUS.PENDING: SUMMARYBUCKET.PENDING,
+}
 
 
 class QueueMonitorStore:
     def __init__(self):
         self.rows: dict[str, QueueRunRow] = {}
         self.summary = RunSummary()
+        self.status_index = StatusIndex()
+        self._counter = RunSummaryCounter(QUEUE_SUMMARY_BUCKETS)
 
     def reset(self):
         self.rows.clear()
+        self.status_index.reset()
+        self._counter.reset()
         self.summary = RunSummary()
 
     def upsert_row(self, row: QueueRunRow) -> QueueRunRow:
@@ -25,7 +46,14 @@ class QueueMonitorStore:
             row.started_at = old_row.started_at
 
         self.rows[row.queue_guid] = row
-        self._recalculate_summary()
+        if old_row:
+            self._counter.replace(old_row.status, row.status)
+            self.status_index.replace(row.queue_guid, old_row.status, row.status)
+        else:
+            self._counter.add(row.status)
+            self.status_index.add(row.queue_guid, row.status)
+        self.summary = self._counter.summary()
+        return row
 
     def get_summary(self) -> RunSummary:
         return self.summary
@@ -33,47 +61,13 @@ class QueueMonitorStore:
     def get_rows_snapshot(self) -> list[QueueRunRow]:
         return list(self.rows.values())
 
-    def _recalculate_summary(self) -> None:
-        summary = RunSummary(total=len(self.rows))
-
-        for row in self.rows.values():
-            status_value = getattr(row.status, "value", row.status)
-
-            if status_value in (QUEUEEXECSTATUS.SUCCESS, QUEUERUNSTATUS.SUCCESS):
-                summary.succeeded += 1
-                summary.completed += 1
-            elif status_value in (
-                QUEUERUNSTATUS.FAILED,
-                QUEUEEXECSTATUS.BROWSER_ERROR,
-                QUEUEEXECSTATUS.NAME_EXISTS_ERROR,
-                QUEUEEXECSTATUS.UNKNOWN_ERROR,
-                QUEUEEXECSTATUS.TIMEOUT_ERROR,
-            ):
-                summary.failed += 1
-                summary.completed += 1
-            elif status_value in (QUEUERUNSTATUS.RETRYING):
-                summary.retrying += 1
-            elif status_value in (
-                QUEUEEXECSTATUS.RUNNER_STOPPED_ERROR,
-                QUEUERUNSTATUS.STOPPED,
-            ):
-                summary.stopped += 1
-                summary.completed += 1
-            elif status_value in (QUEUEEXECSTATUS.PENDING, QUEUERUNSTATUS.PENDING):
-                summary.pending += 1
-
-        self.summary = summary
-
     def remove_succeeded(self) -> list[str]:
-        succeed = []
-        for row in self.rows.values():
-            if (
-                row.status == QUEUEEXECSTATUS.SUCCESS
-                or row.status == QUEUERUNSTATUS.SUCCESS
-            ):
-                succeed.append(row.queue_guid)
-
+        succeed = list(
+            self.status_index.guids((QUEUEEXECSTATUS.SUCCESS, QUEUERUNSTATUS.SUCCESS))
+        )
         for guid in succeed:
-            self.rows.pop(guid)
-        self._recalculate_summary()
+            removed = self.rows.pop(guid)
+            self._counter.remove(removed.status)
+            self.status_index.remove(guid, removed.status)
+        self.summary = self._counter.summary()
         return succeed
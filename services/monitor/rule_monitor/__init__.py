@@ -1,3 +1,3 @@
-from .rule_monitor_store import RunMonitorStore
+from .rule_monitor_store import RULE_SUMMARY_BUCKETS, RunMonitorStore
 
-__all__ = ["RunMonitorStore"]
+__all__ = ["RunMonitorStore", "RULE_SUMMARY_BUCKETS"]
@@ -14,6 +14,7 @@ class RuleRunRow:
     status: RULERUNSTATUS | RULEEXECSTATUS
     scope: EXECUTORSCOPE
     task: EXECUTORTASK
+    emitted_at: int
     retry_count: int = 0
     index: int | None = None
     detail_type: str | None = None
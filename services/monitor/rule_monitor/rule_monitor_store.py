@@ -3,24 +3,56 @@ from __future__ import annotations
 from services.rule_runner.enums import RULEEXECSTATUS, RULERUNSTATUS
 
 from .models import RuleRunRow
+from services.monitor.enums import SUMMARYBUCKET
 from services.monitor.models import RunSummary
+from services.monitor.summary import RunSummaryCounter, StatusIndex
+
+RULE_SUMMARY_BUCKETS = {
+    RULEEXECSTATUS.SUCCESS: SUMMARYBUCKET.SUCCEEDED,
+    RULERUNSTATUS.SUCCESS: SUMMARYBUCKET.SUCCEEDED,
+    RULERUNSTATUS.FAILED: SUMMARYBUCKET.FAILED,
+    RULEEXECSTATUS.BROWSER_ERROR: SUMMARYBUCKET.FAILED,
+    RULEEXECSTATUS.NAME_EXISTS_ERROR: SUMMARYBUCKET.FAILED,
+    RULEEXECSTATUS.UNKNOWN_ERROR: SUMMARYBUCKET.FAILED,
+    RULEEXECSTATUS.TIMEOUT_ERROR: SUMMARYBUCKET.FAILED,
+    RULERUNSTATUS.RETRYING: SUMMARYBUCKET.RETRYING,
+    RULEEXECSTATUS.RUNNER_STOPPED_ERROR: SUMMARYBUCKET.STOPPED,
+    RULERUNSTATUS.STOPPED: SUMMARYBUCKET.STOPPED,
+    RULEEXECSTATUS.PENDING: SUMMARYBUCKET.PENDING,
+    RULERUNSTATUS.PENDING: SUMMARYBUCKET.PENDING,
+}
 
 
 class RunMonitorStore:
     def __init__(self):
         self.rows: dict[str, RuleRunRow] = {}
         self.summary = RunSummary()
+        self.status_index = StatusIndex()
+        self._counter = RunSummaryCounter(RULE_SUMMARY_BUCKETS)
 
     def reset(self):
         self.rows.clear()
+        self.status_index.reset()
+        self._counter.reset()
         self.summary = RunSummary()
 
     def upsert_row(self, row: RuleRunRow) -> RuleRunRow:
         old_row = self.rows.get(row.rule_guid, None)
+
+        if old_row and row.emitted_at < old_row.emitted_at:
+            return old_row
+
         if old_row and row.started_at is None:
             row.started_at = old_row.started_at
         self.rows[row.rule_guid] = row
-        self._recalculate_summary()
+        if old_row:
+            self._counter.replace(old_row.status, row.status)
+            self.status_index.replace(row.rule_guid, old_row.status, row.status)
+        else:
+            self._counter.add(row.status)
+            self.status_index.add(row.rule_guid, row.status)
+        self.summary = self._counter.summary()
+        return row
 
     def get_summary(self) -> RunSummary:
         return self.summary
@@ -28,47 +60,13 @@ class RunMonitorStore:
     def get_rows_snapshot(self) -> list[RuleRunRow]:
         return list(self.rows.values())
 
-    def _recalculate_summary(self) -> None:
-        summary = RunSummary(total=len(self.rows))
-
-        for row in self.rows.values():
-            status_value = getattr(row.status, "value", row.status)
-
-            if status_value in (RULEEXECSTATUS.SUCCESS, RULERUNSTATUS.SUCCESS):
-                summary.succeeded += 1
-                summary.completed += 1
-            elif status_value in (
-                RULERUNSTATUS.FAILED,
-                RULEEXECSTATUS.BROWSER_ERROR,
-                RULEEXECSTATUS.NAME_EXISTS_ERROR,
-                RULEEXECSTATUS.UNKNOWN_ERROR,
-                RULEEXECSTATUS.TIMEOUT_ERROR,
-            ):
-                summary.failed += 1
-                summary.completed += 1
-            elif status_value in (RULERUNSTATUS.RETRYING):
-                summary.retrying += 1
-            elif status_value in (
-                RULEEXECSTATUS.RUNNER_STOPPED_ERROR,
-                RULERUNSTATUS.STOPPED,
-            ):
-                summary.stopped += 1
-                summary.completed += 1
-            elif status_value in (RULEEXECSTATUS.PENDING, RULERUNSTATUS.PENDING):
-                summary.pending += 1
-
-        self.summary = summary
-
     def remove_succeeded(self) -> list[str]:
-        succeed = []
-        for row in self.rows.values():
-            if (
-                row.status == RULEEXECSTATUS.SUCCESS
-                or row.status == RULERUNSTATUS.SUCCESS
-            ):
-                succeed.append(row.rule_guid)
-
+        succeed = list(
+            self.status_index.guids((RULEEXECSTATUS.SUCCESS, RULERUNSTATUS.SUCCESS))
+        )
         for guid in succeed:
-            self.rows.pop(guid)
-        self._recalculate_summary()
+            removed = self.rows.pop(guid)
+            self._counter.remove(removed.status)
+            self.status_index.remove(guid, removed.status)
+        self.summary = self._counter.summary()
         return succeed
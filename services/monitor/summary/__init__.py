@@ -0,0 +1,4 @@
+from .run_summary_counter import RunSummaryCounter
+from .status_index import StatusIndex
+
+__all__ = ["RunSummaryCounter", "StatusIndex"]
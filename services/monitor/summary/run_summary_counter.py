@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from enum import StrEnum
+
+from collections import Counter
+
+from ..enums import SUMMARYBUCKET
+from ..models import RunSummary
+
+
+class RunSummaryCounter:
+    """
+    Keeps RunSummary counts up to date as rows are added, replaced and
+    removed, so a progress event costs the same with 10 rows or 10,000.
+
+    Args:
+        buckets (dict[str, SUMMARYBUCKET]): Which summary bucket each status
+            counts towards. Statuses not in the map only count towards total.
+    """
+
+    COMPLETED_BUCKETS = (
+        SUMMARYBUCKET.SUCCEEDED,
+        SUMMARYBUCKET.FAILED,
+        SUMMARYBUCKET.STOPPED,
+    )
+
+    def __init__(self, buckets: dict[str, SUMMARYBUCKET]):
+        self._buckets = buckets
+        self._counts: Counter[SUMMARYBUCKET] = Counter()
+        self.total = 0
+
+    def _bucket(self, status: StrEnum | str) -> SUMMARYBUCKET | None:
+        return self._buckets.get(getattr(status, "value", status))
+
+    def add(self, status: StrEnum | str) -> None:
+        self.total += 1
+        bucket = self._bucket(status)
+        if bucket:
+            self._counts[bucket] += 1
+
+    def remove(self, status: StrEnum | str) -> None:
+        self.total -= 1
+        bucket = self._bucket(status)
+        if bucket:
+            self._counts[bucket] -= 1
+
+    def replace(self, old_status: StrEnum | str, new_status: StrEnum | str) -> None:
+        old_bucket = self._bucket(old_status)
+        new_bucket = self._bucket(new_status)
+        if old_bucket == new_bucket:
+            return
+        if old_bucket:
+            self._counts[old_bucket] -= 1
+        if new_bucket:
+            self._counts[new_bucket] += 1
+
+    def reset(self) -> None:
+        self._counts.clear()
+        self.total = 0
+
+    def summary(self) -> RunSummary:
+        counts = self._counts
+        return RunSummary(
+            total=self.total,
+            completed=sum(counts[bucket] for bucket in self.COMPLETED_BUCKETS),
+            succeeded=counts[SUMMARYBUCKET.SUCCEEDED],
+            failed=counts[SUMMARYBUCKET.FAILED],
+            retrying=counts[SUMMARYBUCKET.RETRYING],
+            stopped=counts[SUMMARYBUCKET.STOPPED],
+            pending=counts[SUMMARYBUCKET.PENDING],
+        )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from enum import StrEnum
+
+from collections import defaultdict
+
+
+class StatusIndex:
+    """
+    Keeps the set of row guids currently in each status, so questions like
+    "which rows failed" are answered from the sets instead of a row scan.
+    Statuses are keyed by value, so exec and run status members that share
+    a value land in the same set.
+    """
+
+    def __init__(self):
+        self._guids: defaultdict[str, set[str]] = defaultdict(set)
+
+    @staticmethod
+    def _key(status: StrEnum | str) -> str:
+        return getattr(status, "value", status)
+
+    def add(self, guid: str, status: StrEnum | str) -> None:
+        self._guids[self._key(status)].add(guid)
+
+    def remove(self, guid: str, status: StrEnum | str) -> None:
+        self._guids[self._key(status)].discard(guid)
+
+    def replace(
+        self, guid: str, old_status: StrEnum | str, new_status: StrEnum | str
+    ) -> None:
+        old_key, new_key = self._key(old_status), self._key(new_status)
+        if old_key == new_key:
+            return
+        self._guids[old_key].discard(guid)
+        self._guids[new_key].add(guid)
+
+    def reset(self) -> None:
+        self._guids.clear()
+
+    def guids(self, statuses: Iterable[StrEnum | str]) -> set[str]:
+        found: set[str] = set()
+        for status in statuses:
+            found |= self._guids.get(self._key(status), set())
+        return found
+
+    def count(self, statuses: Iterable[StrEnum | str]) -> int:
+        keys = {self._key(status) for status in statuses}
+        return sum(len(self._guids.get(key, ())) for key in keys)
@@ -0,0 +1,3 @@
+from .step_timing_recorder import StepTimingRecorder
+
+__all__ = ["StepTimingRecorder"]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import csv
+import json
+import math
+import os
+from collections import defaultdict
+from dataclasses import asdict, fields
+from datetime import datetime
+from threading import Lock
+
+from ..models import StepTiming, TaskTimingSummary
+
+
+class StepTimingRecorder:
+    """
+    Collects the wall time of every executor step in a run. Workers in the
+    same run share one recorder, so recording is lock protected.
+    """
+
+    def __init__(self, run_name: str):
+        self.run_name = run_name
+        self.created_at = datetime.now()
+        self._timings: list[StepTiming] = []
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._timings)
+
+    def record(self, timing: StepTiming) -> None:
+        with self._lock:
+            self._timings.append(timing)
+
+    def timings(self) -> list[StepTiming]:
+        with self._lock:
+            return list(self._timings)
+
+    @staticmethod
+    def _percentile(sorted_values: list[float], percent: float) -> float:
+        if not sorted_values:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+        return sorted_values[rank - 1]
+
+    def summarize(self) -> list[TaskTimingSummary]:
+        """
+        Returns p50/p95/max per task, slowest p95 first.
+        """
+        durations: dict[str, list[float]] = defaultdict(list)
+        for timing in self.timings():
+            durations[timing.task_key].append(timing.duration_ms)
+
+        summaries = []
+        for task_key, values in durations.items():
+            values.sort()
+            summaries.append(
+                TaskTimingSummary(
+                    task_key=task_key,
+                    count=len(values),
+                    p50_ms=self._percentile(values, 50),
+                    p95_ms=self._percentile(values, 95),
+                    max_ms=values[-1],
+                    total_ms=sum(values),
+                )
+            )
+        summaries.sort(key=lambda summary: summary.p95_ms, reverse=True)
+        return summaries
+
+    def slowest_steps(self, limit: int = 10) -> list[TaskTimingSummary]:
+        return self.summarize()[:limit]
+
+    def export(self, directory: str) -> tuple[str, str] | None:
+        """
+        Writes the run timeline as JSON (timings plus summary) and CSV.
+        Returns the two file paths, or None when nothing was recorded.
+        """
+        timings = self.timings()
+        if not timings:
+            return None
+
+        folder = os.path.join(directory, "timelines")
+        os.makedirs(folder, exist_ok=True)
+        stamp = self.created_at.strftime("%Y%m%d-%H%M%S")
+        base_name = os.path.join(folder, f"{self.run_name}-{stamp}")
+        json_path = f"{base_name}.json"
+        csv_path = f"{base_name}.csv"
+
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "run": self.run_name,
+                    "created_at": self.created_at.isoformat(),
+                    "summary": [asdict(summary) for summary in self.summarize()],
+                    "timeline": [asdict(timing) for timing in timings],
+                },
+                file,
+                indent=2,
+            )
+
+        with open(csv_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(
+                file, fieldnames=[field.name for field in fields(StepTiming)]
+            )
+            writer.writeheader()
+            for timing in timings:
+                writer.writerow(asdict(timing))
+
+        return json_path, csv_path
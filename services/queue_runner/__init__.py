@@ -1,3 +1,4 @@
+from .queue_grid_index import QueueGridIndex
 from .queue_runner_service import QueueRunnerService
 
-__all__ = ["QueueRunnerService"]
+__all__ = ["QueueGridIndex", "QueueRunnerService"]
@@ -11,3 +11,4 @@ class QUEUEEXECSTATUS(StrEnum):
     RUNNER_STOPPED_ERROR = "runner_stopped_error"
     TIMEOUT_ERROR = "timeout_error"
     QUEUE_NOT_FOUND_ERROR = "not_found_error"
+    VERIFY_FAILED_ERROR = "verify_failed_error"
@@ -14,3 +14,5 @@ class QEXECUTORTASK(StrEnum):
     SUBMIT_QUEUE = "submit_queue"
     VERIFY_SUBMISSION = "verify_submission"
     DELETE_QUEUE = "delete_queue"
+    INDEX_QUEUES = "index_queues"
+    CHECK_INDEX = "check_index"
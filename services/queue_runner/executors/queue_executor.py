@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from ..models import QueueExecutionContext
 
 import threading
+import time
 
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
@@ -21,12 +22,17 @@ from base.errors import (
 from ..enums import QEXECUTORTASK, QUEUEEXECSTATUS
 from ..models import QEXECSTEPCALL, QueueExecutionResult, QueueProgressEvent
 from services.queues.enums import QUEUEACTION
+from services.monitor.models import StepTiming
 
 
 class QueueExecutor:
     """
     Queue Executor runs the tasks of navigating to the queue entry form for a provider and inputting a queue.
     If the form is already open, the executor will skip the navigation to the form and directly input the queue.
+
+    When the context has a queue grid index, the grid is scraped into it once the form is open and
+    verify actions, adds of queues that already exist and deletes of missing queues are answered from
+    the index without querying the grid row by row.
     """
 
     def __init__(self, queue_context: QueueExecutionContext):
@@ -34,6 +40,10 @@ class QueueExecutor:
         self._current_task: QEXECUTORTASK = QEXECUTORTASK.START
         self._interaction_port = None
 
+        self._index_queues_step = QEXECSTEPCALL(
+            QEXECUTORTASK.INDEX_QUEUES, self.index_queue_grid
+        )
+
         self._ensure_form_flow = [
             QEXECSTEPCALL(QEXECUTORTASK.FIND_PROVIDER_NAME, self.find_provider_name),
             QEXECSTEPCALL(QEXECUTORTASK.OPEN_PROVIDER_FORM, self.open_provider_form),
@@ -118,9 +128,21 @@ class QueueExecutor:
             self._ctx.state.queue_port = None
             return False
 
-    def logging(self, msg, level="INFO", print_msg=True) -> None:
-        msg = f"{self.__class__.__name__}: {msg}"
-        self._ctx.logger(msg, level, print_msg)
+    def logging(self, msg, level="INFO", print_msg=True, args=(), **context) -> None:
+        if not self._ctx.logger.wants(level):
+            return
+        self._ctx.logger(
+            msg,
+            level,
+            print_msg,
+            args=args,
+            source=self.__class__.__name__,
+            guid=self._ctx.queue.guid,
+            scope=self._ctx.action_type,
+            task=self._current_task,
+            index=self._ctx.queue.row_number,
+            **context,
+        )
 
     def queue_progress(
         self, task: QEXECUTORTASK, status: QUEUEEXECSTATUS, message=None
@@ -136,22 +158,60 @@ class QueueExecutor:
             )
         )
 
+    def record_step_timing(
+        self,
+        task: QEXECUTORTASK,
+        status: QUEUEEXECSTATUS,
+        started_at: float,
+        start: float,
+    ) -> None:
+        duration_ms = (time.perf_counter() - start) * 1000
+        self.logging(
+            "Step %s %s in %.0fms",
+            "DEBUG",
+            False,
+            args=(task, status, duration_ms),
+            status=status,
+            duration_ms=duration_ms,
+        )
+        if self._ctx.step_timer is None:
+            return
+        self._ctx.step_timer.record(
+            StepTiming(
+                item_guid=self._ctx.queue.guid,
+                item_name=self._ctx.queue.queue_name,
+                scope=str(self._ctx.action_type),
+                task=str(task),
+                status=str(status),
+                started_at=started_at,
+                duration_ms=duration_ms,
+                index=self._ctx.queue.row_number,
+            )
+        )
+
     def run_step(self, step: QEXECSTEPCALL):
         self._current_task = step.task
         self.queue_progress(step.task, QUEUEEXECSTATUS.RUNNING)
         if self._ctx.should_stop():
             raise StoppedRequestException("Stop Requested")
+        status = QUEUEEXECSTATUS.SUCCESS
+        started_at = time.time()
+        start = time.perf_counter()
         try:
             handler = step.handler
             handler(self._ctx)
         except Exception as e:
             print(e)
             if self._ctx.should_stop():
-                self.queue_progress(step.task, QUEUEEXECSTATUS.RUNNER_STOPPED_ERROR)
+                status = QUEUEEXECSTATUS.RUNNER_STOPPED_ERROR
+                self.queue_progress(step.task, status)
                 raise StoppedRequestException("Stop Requested") from e
 
-            self.queue_progress(step.task, QUEUEEXECSTATUS.UNKNOWN_ERROR)
+            status = QUEUEEXECSTATUS.UNKNOWN_ERROR
+            self.queue_progress(step.task, status)
             raise
+        finally:
+            self.record_step_timing(step.task, status, started_at, start)
         self.queue_progress(step.task, QUEUEEXECSTATUS.SUCCESS)
 
     def set_queue_number(self, ctx: QueueExecutionContext):
@@ -168,7 +228,12 @@ class QueueExecutor:
 
     def submit_queue(self, ctx: QueueExecutionContext):
         alert = ctx.browser_port.frame_click_and_accept_alert_if_appears(
-            self.queue_port, ctx.profile.selectors.queues.queue_add_button
+            self.queue_port,
+            ctx.profile.selectors.queues.queue_add_button,
+            success_locator=self.queue_port.locator(
+                ctx.profile.selectors.queues.queue_grid_container
+            ),
+            success_state="loaded",
         )
         self.logging(f"Submitted Queue: {ctx.queue.queue_number}", "INFO")
         if alert:
@@ -216,6 +281,8 @@ class QueueExecutor:
             self.logging(msg, "ERROR")
             raise ValueError(msg)
         self.logging("Queue number found")
+        if ctx.queue_index is not None:
+            ctx.queue_index.add(expected_name, actual_number)
 
     def delete_queue(self, ctx: QueueExecutionContext):
         message = f"Unable to find {ctx.queue.queue_name}. Queue does not exist"
@@ -262,6 +329,88 @@ class QueueExecutor:
             self.queue_port.verify_locator_not_present(name_row, 3000)
         except (PlaywrightTimeoutError, AssertionError):
             self.queue_port.verify_locator_not_present(name_row, 30_000)
+        if ctx.queue_index is not None:
+            ctx.queue_index.remove(ctx.queue.queue_name)
+
+    def index_queue_grid(self, ctx: QueueExecutionContext):
+        self.logging("Indexing the queue grid.", "INFO")
+        self.queue_port.wait_for_loading_cycle(
+            ctx.profile.selectors.queues.queue_grid_container,
+            500,
+            disappear_timeout=30000,
+        )
+        rows = self.queue_port.get_row_attributes(
+            ctx.profile.selectors.queues.queue_grid_rows,
+            [
+                ctx.profile.selectors.queues.queue_row_name_item,
+                ctx.profile.selectors.queues.queue_row_number_item,
+            ],
+            ctx.profile.selectors.queues.queue_row_attribute,
+        )
+        ctx.queue_index.load((name, number) for name, number in rows)
+        self.logging(f"Indexed {len(ctx.queue_index)} queues.", "INFO")
+
+    def _answer_from_index(self) -> QueueExecutionResult | None:
+        """
+        Answers the queue action from the grid index when the grid does not
+        need to change. Returns None when the action still has to run on the
+        form.
+        """
+        ctx = self._ctx
+        actual_number = ctx.queue_index.lookup(ctx.queue.queue_name)
+        expected_number = str(ctx.queue.queue_number)
+        expected_name = str(ctx.queue.queue_name)
+        number_matches = actual_number in (expected_number, expected_name)
+
+        result = None
+        if ctx.action_type == QUEUEACTION.VERIFY_EXISTS:
+            if number_matches:
+                result = self._build_index_result("Queue found in the queue grid.")
+            else:
+                result = self._build_error_result(
+                    status=QUEUEEXECSTATUS.VERIFY_FAILED_ERROR,
+                    message=(
+                        f"Queue save verification failed. Expected number "
+                        f"{expected_number!r} or {expected_name!r}, got {actual_number!r}"
+                    ),
+                )
+        elif ctx.action_type == QUEUEACTION.VERIFY_NOT_EXISTS:
+            if actual_number is None:
+                result = self._build_index_result("Queue not in the queue grid.")
+            else:
+                result = self._build_error_result(
+                    status=QUEUEEXECSTATUS.VERIFY_FAILED_ERROR,
+                    message="Queue delete verification failed. Queue still exists.",
+                )
+        elif ctx.action_type == QUEUEACTION.ADD and actual_number is not None:
+            if number_matches:
+                result = self._build_index_result("Queue already exists. Skipped.")
+            else:
+                result = self._build_error_result(
+                    status=QUEUEEXECSTATUS.NAME_EXISTS_ERROR,
+                    message="Queue name already exists.",
+                )
+        elif ctx.action_type == QUEUEACTION.DELETE and actual_number is None:
+            result = self._build_error_result(
+                status=QUEUEEXECSTATUS.QUEUE_NOT_FOUND_ERROR,
+                message="Queue not found.",
+            )
+
+        if result is not None:
+            self.queue_progress(QEXECUTORTASK.CHECK_INDEX, result.status)
+        return result
+
+    def _build_index_result(self, message: str) -> QueueExecutionResult:
+        self.logging(message, "INFO")
+        return QueueExecutionResult(
+            queue_guid=self._ctx.queue.guid,
+            queue_name=self._ctx.queue.queue_name,
+            queue_row=self._ctx.queue.row_number,
+            success=True,
+            task=self._current_task,
+            status=QUEUEEXECSTATUS.SUCCESS,
+            message=message,
+        )
 
     def execute(self) -> QueueExecutionResult:
         """
@@ -273,6 +422,21 @@ class QueueExecutor:
                 f"Starting {self.__class__.__name__} in thread: {threading.get_ident()}",
                 "INFO",
             )
+            action_type = self._ctx.action_type
+            queue_flow = self._queue_actions.get(action_type)
+
+            if queue_flow is None:
+                msg = f"queue_action is not a recognized value. value: {queue_flow}"
+                self.logging(msg, "ERROR")
+                raise ValueError(msg)
+
+            queue_index = self._ctx.queue_index
+            if queue_index is not None and not queue_index.needs_refresh:
+                self._current_task = QEXECUTORTASK.CHECK_INDEX
+                index_result = self._answer_from_index()
+                if index_result is not None:
+                    return index_result
+
             self._ctx.browser_port.wait_for_page_ready()
 
             if not self._is_queue_form_usable():
@@ -280,15 +444,25 @@ class QueueExecutor:
                 for step in self._ensure_form_flow:
                     self.run_step(step)
             self.logging("Provider Modal is open. Continuing", "INFO")
-            action_type = self._ctx.action_type
-            queue_flow = self._queue_actions.get(action_type)
 
-            if queue_flow is None:
-                msg = f"queue_action is not a recognized value. value: {queue_flow}"
-                self.logging(msg, "ERROR")
-                raise ValueError(msg)
-            for step in queue_flow:
-                self.run_step(step)
+            if queue_index is not None and queue_index.needs_refresh:
+                self.run_step(self._index_queues_step)
+                self._current_task = QEXECUTORTASK.CHECK_INDEX
+                index_result = self._answer_from_index()
+                if index_result is not None:
+                    return index_result
+
+            try:
+                for step in queue_flow:
+                    self.run_step(step)
+            except Exception:
+                # The grid may have changed in a way the index did not see.
+                if queue_index is not None and action_type in (
+                    QUEUEACTION.ADD,
+                    QUEUEACTION.DELETE,
+                ):
+                    queue_index.mark_stale()
+                raise
 
             return QueueExecutionResult(
                 queue_guid=self._ctx.queue.guid,
@@ -324,21 +498,21 @@ class QueueExecutor:
                     status=QUEUEEXECSTATUS.RUNNER_STOPPED_ERROR,
                     message="Stopped Requested.",
                 )
-            self.logging(str(e), "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             return self._build_error_result(
                 status=QUEUEEXECSTATUS.BROWSER_ERROR,
                 message="Browser doesnt exist.",
             )
 
         except PlaywrightTimeoutError as e:
-            self.logging(str(e), "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             return self._build_error_result(
                 status=QUEUEEXECSTATUS.TIMEOUT_ERROR,
                 message="Finding element timed out. Queue Failed.",
             )
 
         except PlaywrightError as e:
-            self.logging(str(e), "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             return self._build_error_result(
                 status=QUEUEEXECSTATUS.BROWSER_ERROR,
                 message="Browser error occurred.",
@@ -352,7 +526,7 @@ class QueueExecutor:
                     message="Stopped Requested.",
                 )
 
-            self.logging(str(e), "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             return self._build_error_result(
                 status=QUEUEEXECSTATUS.UNKNOWN_ERROR,
                 message="Error happened in Queue execution.",
@@ -6,10 +6,12 @@ from typing import TYPE_CHECKING, Callable
 if TYPE_CHECKING:
     from ...browser.ports import BrowserPort
     from ...logger.adapters import LogAdapter
+    from ...monitor.timing import StepTimingRecorder
     from ...profiles.models.browser_profile import BrowserProfile
     from ...queues.models import Queue
     from .queue_progress_event import QueueProgressEvent
     from .queue_runner_state import QueueRunnerState
+    from ..queue_grid_index import QueueGridIndex
     from ...queues.enums import QUEUEACTION
 
 
@@ -26,3 +28,5 @@ class QueueExecutionContext:
     should_stop: Callable[[], bool]
     profile: BrowserProfile
     progress_cb: Callable[[QueueProgressEvent], None]
+    step_timer: StepTimingRecorder | None = None
+    queue_index: QueueGridIndex | None = None
@@ -9,3 +9,4 @@ class QueueRunnerRequestPayload:
     provider_name: str
     provider_instance: str
     queues: list[QueueRunItem] = field(default_factory=list)
+    resumed_from: str | None = None
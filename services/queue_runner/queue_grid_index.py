@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from threading import Lock
+
+
+class QueueGridIndex:
+    """
+    In-memory copy of the provider instance's "Manage Queues" grid, queue
+    name to queue number.
+
+    It is scraped from the grid once when a worker first has the queue form
+    open and shared by every shard worker in the run. Verified adds and
+    deletes update it in place. When the grid may have changed in a way the
+    run did not verify, it is marked stale and the next queue scrapes it
+    again.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._numbers: dict[str, str] = {}
+        self._loaded = False
+        self.refresh_count = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._numbers)
+
+    @property
+    def needs_refresh(self) -> bool:
+        with self._lock:
+            return not self._loaded
+
+    def load(self, rows: Iterable[tuple[str, str]]) -> None:
+        with self._lock:
+            self._numbers = {name: number for name, number in rows if name}
+            self._loaded = True
+            self.refresh_count += 1
+
+    def mark_stale(self) -> None:
+        with self._lock:
+            self._loaded = False
+
+    def lookup(self, queue_name: str) -> str | None:
+        with self._lock:
+            return self._numbers.get(queue_name)
+
+    def add(self, queue_name: str, queue_number: str) -> None:
+        with self._lock:
+            self._numbers[queue_name] = queue_number
+
+    def remove(self, queue_name: str) -> None:
+        with self._lock:
+            self._numbers.pop(queue_name, None)
@@ -7,21 +7,33 @@ if TYPE_CHECKING:
     from ..intra.intra_provider_session import IntraProviderSession
     from ..logger.adapters import LogAdapter
     from ..base.models import JobRequest
-    from .models import QueueRunnerRequestPayload
+    from .models import QueueRunItem, QueueRunnerRequestPayload
     from ..browser import BrowserSessionFactory
     from ..profiles import ProfileRegistry
+    from ..run_journal import RunJournal, RunJournalStore
+    from ..run_journal.models import RunJournalState
 
-from PySide6.QtCore import QObject, QThread, Signal
+from dataclasses import asdict
 
+from PySide6.QtCore import Qt, QThread, Signal
+
+from ..base.runner_service_base import RunnerServiceBase
+from ..monitor.timing import StepTimingRecorder
+from ..run_journal.enums import RUNJOURNALKIND
+from ..run_journal.models import JournalItem
+
+from .enums import QUEUERUNNERLIFECYCLE
 from .queue_runner_worker import QueueRunnerWorker
+from .queue_shard_set import QueueShardSet
 
 
-class QueueRunnerService(QObject):
-    stop_run = Signal()
-    task_progress = Signal(object)
+class QueueRunnerService(RunnerServiceBase):
+    LIFECYCLE = QUEUERUNNERLIFECYCLE
+    RUN_NAME = "queue_run"
+    RUNNER_NAME = "queue_runner"
+    PROGRESS_GUID_FIELD = "queue_guid"
+
     progress_status = Signal(int, int)
-    runner_life_cyle = Signal(object)
-    shutdown_ready = Signal(str)
 
     def __init__(
         self,
@@ -30,70 +42,129 @@ class QueueRunnerService(QObject):
         browser_session_factory: BrowserSessionFactory,
         logger: LogAdapter,
         profile_registry: ProfileRegistry,
+        journal_store: RunJournalStore | None = None,
     ):
-        super().__init__()
-        self._thread = None
-        self._worker = None
-        self._session = session
-        self._auth_service = auth_service
-        self._logger = logger
-        self._browser_session_factory = browser_session_factory
-        self._profile_registry = profile_registry
-        self._shut_down_in_requested = False
-
-    def start_run(self, job: JobRequest[QueueRunnerRequestPayload]) -> None:
-        if self._thread and self._thread.isRunning():
+        super().__init__(
+            session,
+            auth_service,
+            browser_session_factory,
+            logger,
+            profile_registry,
+            journal_store,
+        )
+        self._shard_set: QueueShardSet | None = None
+
+    def start_run(
+        self, job: JobRequest[QueueRunnerRequestPayload], open_ended: bool = False
+    ) -> None:
+        """
+        Starts the run. An open ended run keeps taking rows through add_queues
+        until close_run is called, and uses every worker page since the final
+        row count is not known yet.
+        """
+        if self._threads:
             return
 
-        self._thread = QThread()
-        self._worker = QueueRunnerWorker(
-            job,
-            self._browser_session_factory,
-            self._session,
-            self._auth_service,
-            self._logger,
-            self._profile_registry,
+        queues = job.payload.queues
+        max_workers = self._browser_session_factory.max_workers
+        shard_count = self._reserve_workers(
+            job, max_workers if open_ended else len(queues)
         )
+        if not shard_count:
+            return
+        self._journal = self._start_journal(job)
+        shard_set = QueueShardSet(
+            queues, shard_count, open_ended=open_ended, journal=self._journal
+        )
+        self._shard_set = shard_set
+        if shard_count > 1:
+            self._logger(
+                f"{self.__class__.__name__}: Sharding {len(queues)} queues across {shard_count} pages.",
+                "INFO",
+            )
 
-        self._worker.moveToThread(self._thread)
+        self._running_workers = shard_count
+        self._run_started = False
+        self._step_timer = StepTimingRecorder(self.RUN_NAME)
+        run_logger = self._start_run_log(job)
+        for shard_id in range(shard_count):
+            thread = QThread()
+            worker = QueueRunnerWorker(
+                job,
+                self._browser_session_factory,
+                self._session,
+                self._auth_service,
+                run_logger,
+                self._profile_registry,
+                shard_set=shard_set,
+                shard_id=shard_id,
+                step_timer=self._step_timer,
+            )
 
-        self._thread.started.connect(self._worker.do_work)
-        self._worker.runner_life_cyle.connect(self.runner_life_cyle)
-        self._worker.done.connect(self._thread.quit)
-        self._worker.done.connect(self._worker.deleteLater)
-        self._worker.task_progress.connect(self.task_progress)
-        self._worker.progress_status.connect(self.progress_status)
-        self._thread.finished.connect(self._clean_up_thread)
-        self._thread.start()
+            worker.moveToThread(thread)
 
-    def _clean_up_thread(self):
-        if self._thread:
-            self._logger(
-                f"{self.__class__.__name__}: Queue Runner Thread finished. Cleaning up.",
-                "INFO",
+            thread.started.connect(worker.do_work)
+            worker.runner_life_cyle.connect(self._on_worker_life_cycle)
+            worker.done.connect(thread.quit)
+            worker.done.connect(worker.deleteLater)
+            worker.task_progress.connect(
+                self._progress_coalescer.push, Qt.ConnectionType.DirectConnection
             )
-            self._thread.deleteLater()
-            self._clean_up_refs()
+            worker.progress_status.connect(self.progress_status)
+            thread.finished.connect(lambda thread=thread: self._clean_up_thread(thread))
+            self._threads.append(thread)
+            self._workers.append(worker)
+
+        self._progress_coalescer.start()
+        for thread in self._threads:
+            thread.start()
+
+    def add_queues(self, queues: list[QueueRunItem]) -> bool:
+        if self._shard_set is None or not self._threads:
+            return False
+        if self._journal is not None:
+            self._journal.add_items(self._journal_items(queues))
+        return self._shard_set.extend(queues)
+
+    def close_run(self) -> None:
+        if self._shard_set is not None:
+            self._shard_set.close()
+
+    def pending_count(self) -> int:
+        return self._shard_set.pending_count if self._shard_set else 0
+
+    def last_run_journal(self) -> RunJournalState | None:
+        if self._journal_store is None:
+            return None
+        return self._journal_store.latest(RUNJOURNALKIND.QUEUES)
+
+    def _start_journal(
+        self, job: JobRequest[QueueRunnerRequestPayload]
+    ) -> RunJournal | None:
+        if self._journal_store is None:
+            return None
+        payload = job.payload
+        return self._journal_store.start(
+            RUNJOURNALKIND.QUEUES,
+            job.id,
+            self._journal_items(payload.queues),
+            meta={
+                "provider_name": payload.provider_name,
+                "provider_instance": payload.provider_instance,
+            },
+            resumed_from=payload.resumed_from,
+        )
 
-        if self._shut_down_in_requested:
-            self._shut_down_in_requested = False
-            self.shutdown_ready.emit("queue_runner")
+    def _journal_items(self, queues: list[QueueRunItem]) -> list[JournalItem]:
+        return [
+            JournalItem(item.guid, item.queue.queue_name, asdict(item.queue))
+            for item in queues
+        ]
 
     def _clean_up_refs(self):
-        self._worker = None
-        self._thread = None
-
-    def request_app_shutdown(self) -> bool:
-        if not self._thread or not self._thread.isRunning():
-            return True
-        self._logger(
-            f"{self.__class__.__name__}: Runner still active. Deferring app shutdown.",
-            "WARN",
-        )
-        self._shut_down_in_requested = True
-        self.stop_current_run()
-        return False
+        self._shard_set = None
+        super()._clean_up_refs()
 
     def stop_current_run(self):
-        if self._worker:
-            self._worker.stop()
+        self.close_run()
+        super().stop_current_run()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Deque
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..auth.auth_service import AuthService
@@ -11,17 +11,17 @@ if TYPE_CHECKING:
     from ..browser import BrowserSessionFactory
     from services.browser.models import PlaywrightSession
     from services.profiles import ProfileRegistry
+    from services.monitor.timing import StepTimingRecorder
 
 import time
-from collections import deque
 from threading import Event, get_ident
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import Signal
 
 from base.enums import INTRAVERSION
 
 from ..auth.enums import AUTHSTATUS
-from ..auth.models.auth_result import AuthResult
+from ..base.runner_worker_base import RunnerWorkerBase
 from .enums import QUEUEEXECSTATUS, QUEUERUNNERLIFECYCLE, QUEUERUNSTATUS
 from .executors import QueueExecutor
 from .models import (
@@ -32,9 +32,10 @@ from .models import (
     QueueRunnerState,
 )
 from services.queues.enums import QUEUEACTION
+from .queue_shard_set import QueueShardSet
 
 
-class QueueRunnerWorker(QObject):
+class QueueRunnerWorker(RunnerWorkerBase):
     done = Signal()
     runner_result = Signal(object)
     task_progress = Signal(object)
@@ -49,9 +50,18 @@ class QueueRunnerWorker(QObject):
         auth_service: AuthService,
         logger: LogAdapter,
         profile_registry: ProfileRegistry,
+        shard_set: QueueShardSet | None = None,
+        shard_id: int = 0,
+        step_timer: StepTimingRecorder | None = None,
     ):
         super().__init__()
-        self.q_item_queue: Deque[QueueRunItem] = deque(job.payload.queues)
+        self.shard_set = (
+            shard_set if shard_set is not None else QueueShardSet(job.payload.queues)
+        )
+        self.session_gate = self.shard_set.session_gate
+        self.shard_id = shard_id
+        self.step_timer = step_timer
+        self.q_item_queue = self.shard_set.shard(shard_id)
         self.logger = logger
         self.session = session
         self.auth_service = auth_service
@@ -63,11 +73,9 @@ class QueueRunnerWorker(QObject):
         self.driver = None
         self.driver_adapter = None
         self.current_executor: QueueExecutor | None = None
-        self.errored_queues: list[QueueRunItem] = []
-        self.success_queues: list[QueueRunItem] = []
-        self.completed_count = 0
-        self.total_count = len(self.q_item_queue)
         self._shut_down = Event()
+        # Set when this worker lost its session but the run carries on.
+        self._retired = False
 
         self.playwright_session_manager = None
         self.playwright_session: PlaywrightSession | None = None
@@ -76,15 +84,35 @@ class QueueRunnerWorker(QObject):
         self.provider_name = job.payload.provider_name
         self.provider_instance = job.payload.provider_instance
 
+    @property
+    def is_lead(self) -> bool:
+        return self.shard_id == 0
+
+    @property
+    def shares_session(self) -> bool:
+        return self.shard_set.is_sharded
+
+    @property
+    def completed_count(self) -> int:
+        return self.shard_set.completed_count
+
+    @property
+    def total_count(self) -> int:
+        return self.shard_set.total_count
+
     def should_stop(self) -> bool:
         return self._shut_down.is_set()
 
     def send_queue_progress(self, event: QueueProgressEvent):
         self.task_progress.emit(event)
 
-    def logging(self, msg, level="INFO", print_msg=True) -> None:
-        msg = f"{self.__class__.__name__}: {msg}"
-        self.logger(msg, level, print_msg)
+    def logging(self, msg, level="INFO", print_msg=True, args=()) -> None:
+        if not self.logger.wants(level):
+            return
+        name = self.__class__.__name__
+        if self.shard_set.is_sharded:
+            name = f"{name}[{self.shard_id}]"
+        self.logger(msg, level, print_msg, args=args, source=name)
 
     def do_work(self):
         self.logging(
@@ -96,61 +124,14 @@ class QueueRunnerWorker(QObject):
             self.run_queue()
 
         except Exception as e:
-            self.logging(f"{e}", "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             self.logging("Fatal Error", "ERROR")
         finally:
+            if self.is_lead:
+                self.session_gate.lead_finished()
             self.runner_life_cyle.emit(QUEUERUNNERLIFECYCLE.FINISHED)
             self.clean_up()
 
-    def _init_browser(self, load_session_cookies=False) -> None:
-        """
-        Initializes the Playwright.
-        """
-        self.playwright_session_manager = self.browser_session_factory.create_session(
-            self.session.provider_name
-        )
-        self.playwright_session = self.playwright_session_manager.start()
-
-    def _close_down_browser(self):
-        if not self.playwright_session_manager:
-            return
-        self.playwright_session_manager.close()
-        self.playwright_session_manager = None
-        self.playwright_session = None
-
-    def _rebuild_browser(self):
-        self._close_down_browser()
-        self._init_browser(load_session_cookies=False)
-
-    def _authenticate(self) -> AuthResult:
-        auth_attempts = 0
-        max_attempts = 2
-
-        while auth_attempts < max_attempts:
-            if self.should_stop():
-                return AuthResult(success=False, status=AUTHSTATUS.STOPPED_REQUESTED)
-            self.logging(
-                f"Attempting to authenticate: {auth_attempts} / {max_attempts-1}"
-            )
-            result = self.auth_service.ensure_auth(
-                self.session.provider_name,
-                self.creds,
-                self.playwright_session.browser_adapter,
-                should_stop_cb=self.should_stop,
-            )
-
-            if result.success:
-                self.logging("Received Successful Authentication.")
-                return result
-            self.logging("Received Failure Authentication.", "WARN")
-            if result.status == AUTHSTATUS.BROWSER_ERROR:
-                self._rebuild_browser()
-            auth_attempts += 1
-        self.logging(
-            "Attempted to log in 2 times. Login Failed due to an error.", "ERROR"
-        )
-        return result
-
     def _send_batch_progress(
         self,
         status: QUEUEEXECSTATUS,
@@ -158,7 +139,6 @@ class QueueRunnerWorker(QObject):
         start_time: bool = False,
         end_time: bool = False,
     ):
-        # TODO : REMOVE : TOO MANY SIGNALS - BAD
         for queue_item in self.q_item_queue:
             self.send_queue_progress(
                 QueueProgressEvent(
@@ -178,23 +158,30 @@ class QueueRunnerWorker(QObject):
         try:
             self.runner_life_cyle.emit(QUEUERUNNERLIFECYCLE.STARTED)
             # self._send_batch_progress(QUEUEEXECSTATUS.PENDING, "Queue queued.")
-            auth_result = self._authenticate()
+            auth_result = self._start_session()
             if auth_result.status == AUTHSTATUS.STOPPED_REQUESTED:
                 self.stop_clean_up()
                 return
 
             if not auth_result.success:
-                self._shut_down.set()
-                self._drain_remaining_rules(
-                    QUEUERUNSTATUS.FAILED, "Failed to Authenticate"
-                )
+                self._stop_after_auth_failure("Failed to Authenticate")
                 return
 
             state = QueueRunnerState()
-            self.total_count = len(self.q_item_queue)
             self.logging(f"Total Queues: {len(self.q_item_queue)}", "INFO")
-            self.progress_status.emit(0, self.total_count)
-            while self.q_item_queue and not self.should_stop():
+            if self.is_lead:
+                self.progress_status.emit(0, self.total_count)
+            while (
+                not self.should_stop()
+                and not self._retired
+                and self.shard_set.wait_for_items(self.shard_id, self.should_stop)
+            ):
+                refresh_result = self._refresh_session_if_requested()
+                if refresh_result is not None and not refresh_result.success:
+                    self._stop_after_auth_failure(
+                        "Failed to refresh the shared session"
+                    )
+                    return
                 self.logging(
                     f"({self.completed_count+1}/{self.total_count}) - Queue Executing"
                 )
@@ -215,6 +202,8 @@ class QueueRunnerWorker(QObject):
                             INTRAVERSION(self.creds.platform_version)
                         ),
                         progress_cb=self.send_queue_progress,
+                        step_timer=self.step_timer,
+                        queue_index=self.shard_set.queue_index,
                     )
                     self.send_queue_progress(
                         QueueProgressEvent(
@@ -234,7 +223,7 @@ class QueueRunnerWorker(QObject):
                     if self.should_stop():
                         self.stop_clean_up()
                         return
-                    self.logging(f"{e}", "DEBUG")
+                    self.logging("%s", "DEBUG", args=(e,))
                     self.logging(
                         "Failure in queue. Trying to process next queue", "ERROR"
                     )
@@ -250,7 +239,8 @@ class QueueRunnerWorker(QObject):
             self.logging("Fatal Error Occurred. Shutting Down", "ERROR")
             self.logging(f"{e}", "ERROR")
         finally:
-            self.create_rule_summary()
+            if self.shard_set.release_worker(self.shard_id):
+                self.create_rule_summary()
 
     def _send_result_progress(
         self,
@@ -301,17 +291,16 @@ class QueueRunnerWorker(QObject):
         )
         item.status = QUEUERUNSTATUS.SUCCESS
 
-        self.success_queues.append(item)
+        self.shard_set.record_success(item)
         self._send_result_progress(item, result, "Succeeded", use_exec_status=False)
-        self.completed_count += 1
         self.progress_status.emit(self.completed_count, self.total_count)
 
     def _handle_result_runner_stopped(
         self, item: QueueRunItem, result: QueueExecutionResult
     ):
         self._send_result_progress(item, result, "Stop Requested", use_exec_status=True)
-        self.errored_queues.append(item)
-        self.completed_count = self.total_count
+        self.shard_set.record_failure(item, completed=False)
+        self.shard_set.mark_all_completed()
         self.logging("Queue Executor stopped.", "WARN")
         self.stop_clean_up()
 
@@ -393,12 +382,10 @@ class QueueRunnerWorker(QObject):
         self._send_result_progress(item, result, "Retrying...", use_exec_status=False)
         self.q_item_queue.appendleft(item)
         self._rebuild_browser()
-        auth_result = self._authenticate()
+        auth_result = self._reauthenticate()
         if not auth_result.success:
-            self._handle_result_failure(item, result)
-            self._shut_down.set()
-            self._drain_remaining_rules(
-                QUEUERUNSTATUS.FAILED, "Authentication failed during retry"
+            self._stop_after_auth_failure(
+                "Authentication failed during retry", item, result
             )
             return
 
@@ -410,20 +397,21 @@ class QueueRunnerWorker(QObject):
         self._send_result_progress(
             item, result, "Failed. Not retrying.", use_exec_status=False
         )
-        self.errored_queues.append(item)
-        self.completed_count += 1
+        self.shard_set.record_failure(item)
         self.progress_status.emit(self.completed_count, self.total_count)
 
     def create_rule_summary(self) -> None:
         """
         Creates a summary of successfully executed and errored queues.
         """
-        errored_rules_msg = f"ERRORED Queues TOTAL: {len(self.errored_queues)} \n"
-        succeeded_rules_msg = f"SUCCEEDED Queues TOTAL: {len(self.success_queues)} \n"
+        errored_queues = self.shard_set.errored_queues
+        success_queues = self.shard_set.success_queues
+        errored_rules_msg = f"ERRORED Queues TOTAL: {len(errored_queues)} \n"
+        succeeded_rules_msg = f"SUCCEEDED Queues TOTAL: {len(success_queues)} \n"
         tabs = "\t" * 3
-        for error_rule in self.errored_queues:
+        for error_rule in errored_queues:
             errored_rules_msg += f"{tabs}- Row {error_rule.queue.row_number}: - {error_rule.queue.queue_name} \n"
-        for succeed_rule in self.success_queues:
+        for succeed_rule in success_queues:
             succeeded_rules_msg += f"{tabs}- Row {succeed_rule.queue.row_number}: - {succeed_rule.queue.queue_name} \n"
         self.logging(succeeded_rules_msg, "INFO")
         self.logging(errored_rules_msg, "ERROR")
@@ -433,11 +421,33 @@ class QueueRunnerWorker(QObject):
         while self.q_item_queue:
             item = self.q_item_queue.popleft()
             item.status = status
-            self.errored_queues.append(item)
+            self.shard_set.record_failure(item, completed=False)
         self.progress_status.emit(self.total_count, self.total_count)
 
         self.logging(f"Removing remaining queues from queue: {reason}", "WARN")
 
+    def _stop_after_auth_failure(
+        self,
+        reason: str,
+        item: QueueRunItem | None = None,
+        result: QueueExecutionResult | None = None,
+    ):
+        """
+        Stops this worker after it failed to authenticate. The remaining
+        queues are only failed when the shared session is gone as well,
+        otherwise they are handed to the running shards once this worker is
+        released. `item` is the queue that was being retried, if any.
+        """
+        if self._session_outlives_worker():
+            self.logging(f"{reason}. Stopping this worker only.", "WARN")
+            self._retired = True
+            return
+        self._shut_down.set()
+        if item is not None:
+            self.q_item_queue.remove(item)
+            self._handle_result_failure(item, result)
+        self._drain_remaining_rules(QUEUERUNSTATUS.FAILED, reason)
+
     def stop_clean_up(self):
         self._drain_remaining_rules(
             QUEUERUNSTATUS.STOPPED, "Queue Runner manually stopped."
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Deque, Iterable
+
+if TYPE_CHECKING:
+    from ..run_journal import RunJournal
+    from .models import QueueRunItem
+
+from collections import deque
+from threading import Condition, Lock
+
+from ..base.shared_session_gate import SharedSessionGate
+
+from .enums import QUEUERUNSTATUS
+from .queue_grid_index import QueueGridIndex
+
+
+class QueueShardSet:
+    """
+    Splits the queue rows of a run into shards dealt round-robin, one per
+    QueueRunnerWorker.
+
+    Each worker owns its shard deque and keeps its own "Manage Queues" form
+    open for the whole shard. The totals and the shared authenticated session
+    gate live here so the lead worker logs in once and the other shards reuse
+    its cookies. The queue grid index is shared here too, so every shard
+    answers existence checks from the same copy of the grid.
+
+    An open ended set keeps accepting rows through `extend` while the run is
+    going, for imports that are still being read. Workers wait for more rows
+    until `close` is called. Rows only go to shards whose worker is still
+    running, and a worker that exits hands its leftover rows to the others.
+
+    Finished and failed items are written to the run's journal when it has
+    one, so an interrupted run can be resumed.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[QueueRunItem],
+        shard_count: int = 1,
+        open_ended: bool = False,
+        journal: RunJournal | None = None,
+    ):
+        self.shard_count = max(1, shard_count)
+        self.shards: list[Deque[QueueRunItem]] = [
+            deque() for _ in range(self.shard_count)
+        ]
+        for index, item in enumerate(items):
+            self.shards[index % self.shard_count].append(item)
+
+        self._lock = Lock()
+        self.journal = journal
+        self.queue_index = QueueGridIndex()
+        self._items_added = Condition(self._lock)
+        self._closed = not open_ended
+        self.total_count = sum(len(shard) for shard in self.shards)
+        self.completed_count = 0
+        self.errored_queues: list[QueueRunItem] = []
+        self.success_queues: list[QueueRunItem] = []
+        self._live_shards = set(range(self.shard_count))
+        self.session_gate = SharedSessionGate()
+
+    @property
+    def is_sharded(self) -> bool:
+        return self.shard_count > 1
+
+    def shard(self, shard_id: int) -> Deque[QueueRunItem]:
+        return self.shards[shard_id]
+
+    @property
+    def pending_count(self) -> int:
+        return self.total_count - self.completed_count
+
+    def extend(self, items: Iterable[QueueRunItem]) -> bool:
+        """
+        Adds rows to an open ended set, each to the shortest shard that still
+        has a running worker. Returns False once the set is closed or every
+        shard worker has exited.
+        """
+        with self._lock:
+            if self._closed or not self._live_shards:
+                return False
+            for item in items:
+                self._shortest_live_shard().append(item)
+                self.total_count += 1
+            self._items_added.notify_all()
+            return True
+
+    def _shortest_live_shard(self) -> Deque[QueueRunItem]:
+        return min((self.shards[i] for i in self._live_shards), key=len)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._items_added.notify_all()
+
+    def wait_for_items(self, shard_id: int, should_stop: Callable[[], bool]) -> bool:
+        """
+        Returns True when the shard has a row to run, waiting for more rows
+        while the set is open. False means the shard is done.
+        """
+        shard = self.shards[shard_id]
+        with self._lock:
+            while not shard:
+                if self._closed or should_stop():
+                    return False
+                self._items_added.wait(timeout=0.5)
+            return True
+
+    def record_success(self, item: QueueRunItem) -> int:
+        with self._lock:
+            self.success_queues.append(item)
+            self.completed_count += 1
+            completed_count = self.completed_count
+        self._journal_status(item)
+        return completed_count
+
+    def record_failure(self, item: QueueRunItem, completed: bool = True) -> int:
+        with self._lock:
+            self.errored_queues.append(item)
+            if completed:
+                self.completed_count += 1
+            completed_count = self.completed_count
+        self._journal_status(item)
+        return completed_count
+
+    def _journal_status(self, item: QueueRunItem) -> None:
+        if self.journal is not None:
+            self.journal.record(item.guid, item.status)
+
+    def mark_all_completed(self) -> None:
+        with self._lock:
+            self.completed_count = self.total_count
+
+    def release_worker(self, shard_id: int) -> bool:
+        """
+        Marks a shard worker as finished. Rows still in its shard are moved to
+        the running shards, or failed when it was the last worker out. Returns
+        True for the last worker out.
+        """
+        failed: list[QueueRunItem] = []
+        with self._lock:
+            self._live_shards.discard(shard_id)
+            shard = self.shards[shard_id]
+            if self._live_shards:
+                while shard:
+                    self._shortest_live_shard().append(shard.popleft())
+                self._items_added.notify_all()
+            else:
+                while shard:
+                    item = shard.popleft()
+                    item.status = QUEUERUNSTATUS.FAILED
+                    self.errored_queues.append(item)
+                    self.completed_count += 1
+                    failed.append(item)
+            is_last = not self._live_shards
+        for item in failed:
+            self._journal_status(item)
+        return is_last
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Generic, TypeVar
 if TYPE_CHECKING:
     from ...models import RuleExecutionContext, RuleExecutionState
 import threading
+import time
 from ..wrappers import ExecutorWrappers
 from ...enums import EXECUTORSCOPE, EXECUTORTASK, RULEEXECSTATUS
 from ...models import EXECSTEPCALL
@@ -69,16 +70,23 @@ class BaseIterableScopeChildExecutor(BaseScopeExecutor, Generic[ItemT]):
         if self._ctx.should_stop():
             self.set_state_status(ref, RULEEXECSTATUS.RUNNER_STOPPED_ERROR)
             raise StoppedRequestException("Stop Requested")
+        status = RULEEXECSTATUS.SUCCESS
+        started_at = time.time()
+        start = time.perf_counter()
         try:
             handler = step.handler
             handler(self._ctx, self._state, item_ctx)
         except Exception as e:
             if self._ctx.should_stop():
-                self.set_state_status(ref, RULEEXECSTATUS.RUNNER_STOPPED_ERROR)
+                status = RULEEXECSTATUS.RUNNER_STOPPED_ERROR
+                self.set_state_status(ref, status)
                 raise StoppedRequestException("Stop Requested") from e
 
-            self.set_state_status(ref, RULEEXECSTATUS.UNKNOWN_ERROR)
+            status = RULEEXECSTATUS.UNKNOWN_ERROR
+            self.set_state_status(ref, status)
             raise
+        finally:
+            self.record_step_timing(ref, status, started_at, start)
         self.set_state_status(ref, RULEEXECSTATUS.SUCCESS)
 
     @ExecutorWrappers.child_raise_error
@@ -6,6 +6,8 @@ if TYPE_CHECKING:
     from ...models import RuleExecutionContext
     from ....browser.ports import InteractionPort
 
+import time
+
 from ...enums import EXECUTORSCOPE, EXECUTORTASK, RULEEXECSTATUS
 from base.errors import StoppedRequestException
 from ...models import (
@@ -15,6 +17,7 @@ from ...models import (
     RuleExecutionState,
     RuleProgressEvent,
 )
+from ....monitor.models import StepTiming
 
 
 class BaseScopeExecutor:
@@ -43,9 +46,22 @@ class BaseScopeExecutor:
 
         return self._state.interaction_port
 
-    def logging(self, msg, level="INFO", print_msg=True) -> None:
-        msg = f"{self.__class__.__name__}: {msg}"
-        self._ctx.logger(msg, level, print_msg)
+    def logging(self, msg, level="INFO", print_msg=True, args=(), **context) -> None:
+        if not self._ctx.logger.wants(level):
+            return
+        task_ref = self._state.current_task
+        self._ctx.logger(
+            msg,
+            level,
+            print_msg,
+            args=args,
+            source=self.__class__.__name__,
+            guid=self._ctx.rule.guid,
+            scope=task_ref.scope if task_ref else self._scope_id,
+            task=task_ref.task if task_ref else None,
+            index=task_ref.index if task_ref else None,
+            **context,
+        )
 
     def task_ref(
         self,
@@ -77,12 +93,57 @@ class BaseScopeExecutor:
         self._state.status = status
         self.rule_progress()
 
+    def record_step_timing(
+        self,
+        task_ref: ExecutorTaskRef,
+        status: RULEEXECSTATUS,
+        started_at: float,
+        start: float,
+    ) -> None:
+        duration_ms = (time.perf_counter() - start) * 1000
+        self._ctx.logger(
+            "Step %s %s in %.0fms",
+            "DEBUG",
+            False,
+            args=(task_ref.task, status, duration_ms),
+            source=self.__class__.__name__,
+            guid=self._ctx.rule.guid,
+            scope=task_ref.scope,
+            task=task_ref.task,
+            index=task_ref.index,
+            status=status,
+            duration_ms=duration_ms,
+        )
+        if self._ctx.step_timer is None:
+            return
+        detail_type = task_ref.detail_type
+        self._ctx.step_timer.record(
+            StepTiming(
+                item_guid=self._ctx.rule.guid,
+                item_name=self._state.rule_name,
+                scope=str(task_ref.scope),
+                task=str(task_ref.task),
+                status=str(status),
+                started_at=started_at,
+                duration_ms=duration_ms,
+                index=task_ref.index,
+                detail_type=(
+                    str(getattr(detail_type, "value", detail_type))
+                    if detail_type
+                    else None
+                ),
+            )
+        )
+
     def run_step(self, step: EXECSTEPCALL):
 
         ref = self.task_ref(step.task)
         self.set_state_status(ref, RULEEXECSTATUS.RUNNING)
         if self._ctx.should_stop():
             raise StoppedRequestException("Stop Requested")
+        status = RULEEXECSTATUS.SUCCESS
+        started_at = time.time()
+        start = time.perf_counter()
         try:
             handler = step.handler
             handler(self._ctx, self._state)
@@ -90,11 +151,15 @@ class BaseScopeExecutor:
             print(e)
 
             if self._ctx.should_stop():
-                self.set_state_status(ref, RULEEXECSTATUS.RUNNER_STOPPED_ERROR)
+                status = RULEEXECSTATUS.RUNNER_STOPPED_ERROR
+                self.set_state_status(ref, status)
                 raise StoppedRequestException("Stop Requested") from e
 
-            self.set_state_status(ref, RULEEXECSTATUS.UNKNOWN_ERROR)
+            status = RULEEXECSTATUS.UNKNOWN_ERROR
+            self.set_state_status(ref, status)
             raise
+        finally:
+            self.record_step_timing(ref, status, started_at, start)
         self.set_state_status(ref, RULEEXECSTATUS.SUCCESS)
 
     def execute(self) -> RuleExecutionResult:
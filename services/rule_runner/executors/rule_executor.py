@@ -118,7 +118,7 @@ class RuleExecutor(BaseScopeExecutor):
                     status=RULEEXECSTATUS.RUNNER_STOPPED_ERROR,
                     message="Stopped Requested.",
                 )
-            self.logging(str(e), "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             return self._build_error_result(
                 ctx=self._ctx,
                 state=self._state,
@@ -127,7 +127,7 @@ class RuleExecutor(BaseScopeExecutor):
             )
 
         except PlaywrightTimeoutError as e:
-            self.logging(str(e), "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             return self._build_error_result(
                 ctx=self._ctx,
                 state=self._state,
@@ -136,7 +136,7 @@ class RuleExecutor(BaseScopeExecutor):
             )
 
         except PlaywrightError as e:
-            self.logging(str(e), "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             return self._build_error_result(
                 ctx=self._ctx,
                 state=self._state,
@@ -154,7 +154,7 @@ class RuleExecutor(BaseScopeExecutor):
                     message="Stopped Requested.",
                 )
 
-            self.logging(str(e), "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             return self._build_error_result(
                 ctx=self._ctx,
                 state=self._state,
@@ -264,6 +264,10 @@ class RuleExecutor(BaseScopeExecutor):
                     ctx.profile.selectors.rule_form.submit_button,
                     "A Rule with this name already exists",
                     10000,
+                    success_locator=self.form_port.locator(
+                        ctx.profile.selectors.rule_form.submit_button
+                    ),
+                    success_state="hidden",
                 )
                 if alert:
                     self.rename_rule(ctx, state)
@@ -39,7 +39,7 @@ class ExecutorWrappers:
                     "Playwright operation timed out.",
                     "ERROR",
                 )
-                self.logging(f"{e}", "DEBUG")
+                self.logging("%s", "DEBUG", args=(e,))
                 raise
 
             except PlaywrightError as e:
@@ -57,21 +57,21 @@ class ExecutorWrappers:
                     )
                 ):
                     self.logging("Playwright session lost.", "ERROR")
-                    self.logging(str(e), "DEBUG")
+                    self.logging("%s", "DEBUG", args=(e,))
                     raise PlaywrightSessionLostException from e
 
                 self.logging(
                     "Playwright operation failed.",
                     "ERROR",
                 )
-                self.logging(f"{e}", "DEBUG")
+                self.logging("%s", "DEBUG", args=(e,))
                 raise
 
             except Exception as e:
                 if self._ctx.should_stop():
                     raise StoppedRequestException from e
 
-                self.logging(str(e), "DEBUG")
+                self.logging("%s", "DEBUG", args=(e,))
                 raise
 
         return wrapper
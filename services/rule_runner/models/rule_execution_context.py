@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from ...rules.models import Rule
     from ...browser.ports import BrowserPort
     from ...logger.adapters import LogAdapter
+    from ...monitor.timing import StepTimingRecorder
     from ...profiles.models.browser_profile import BrowserProfile
     from .rule_progress_event import RuleProgressEvent
 
@@ -20,3 +21,4 @@ class RuleExecutionContext:
     should_stop: Callable[[], bool]
     profile: BrowserProfile
     progress_cb: Callable[[RuleProgressEvent], None]
+    step_timer: StepTimingRecorder | None = None
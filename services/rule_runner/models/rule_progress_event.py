@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import time
 
 from ..enums.rule_execution_status import RULEEXECSTATUS
 from .executor_task_ref import ExecutorTaskRef
@@ -13,3 +14,4 @@ class RuleProgressEvent:
     message: str | None = None
     started_at: int | None = None
     finished_at: int | None = None
+    emitted_at: int = field(default_factory=time.monotonic_ns)
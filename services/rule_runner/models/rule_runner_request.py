@@ -7,3 +7,4 @@ from .rule_run_config import RuleRunnerConfig
 class RuleRunnerRequestPayload:
     config: RuleRunnerConfig
     rules: list[RuleRunItem] = field(default_factory=list)
+    resumed_from: str | None = None
@@ -3,98 +3,106 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ..auth.auth_service import AuthService
-    from ..intra.intra_provider_session import IntraProviderSession
-    from ..logger.adapters import LogAdapter
     from ..base.models import JobRequest
     from .models import RuleRunnerRequestPayload
-    from ..browser import BrowserSessionFactory
-    from ..profiles import ProfileRegistry
+    from ..run_journal import RunJournal
+    from ..run_journal.models import RunJournalState
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import Qt, QThread, Signal
 
+from ..base.runner_service_base import RunnerServiceBase
+from ..monitor.timing import StepTimingRecorder
+from ..rules import RuleSerializer
+from ..run_journal.enums import RUNJOURNALKIND
+from ..run_journal.models import JournalItem
+
+from .enums import RULERUNNERLIFECYCLE
 from .rule_runner_worker import RuleRunnerWorker
+from .rule_work_queue import RuleWorkQueue
+
 
+class RuleRunnerService(RunnerServiceBase):
+    LIFECYCLE = RULERUNNERLIFECYCLE
+    RUN_NAME = "rule_run"
+    RUNNER_NAME = "rule_runner"
+    PROGRESS_GUID_FIELD = "rule_guid"
 
-class RuleRunnerService(QObject):
     progress = Signal(int, int)
-    stop_run = Signal()
-    task_progress = Signal(object)
-
-    runner_life_cyle = Signal(object)
-    shutdown_ready = Signal(str)
-
-    def __init__(
-        self,
-        session: IntraProviderSession,
-        auth_service: AuthService,
-        browser_session_factory: BrowserSessionFactory,
-        logger: LogAdapter,
-        profile_registry: ProfileRegistry,
-    ):
-        super().__init__()
-        self._thread = None
-        self._worker = None
-        self._session = session
-        self._auth_service = auth_service
-        self._logger = logger
-        self._browser_session_factory = browser_session_factory
-        self._profile_registry = profile_registry
-        self._shut_down_in_requested = False
 
     def start_run(self, job: JobRequest[RuleRunnerRequestPayload]) -> None:
-        if self._thread and self._thread.isRunning():
+        if self._threads:
             return
 
-        self._thread = QThread()
-        self._worker = RuleRunnerWorker(
-            job,
-            self._browser_session_factory,
-            self._session,
-            self._auth_service,
-            self._logger,
-            self._profile_registry,
-        )
+        rules = job.payload.rules
+        worker_count = self._reserve_workers(job, len(rules))
+        if not worker_count:
+            return
+        self._journal = self._start_journal(job)
+        work_queue = RuleWorkQueue(rules, worker_count, journal=self._journal)
+        if worker_count > 1:
+            self._logger(
+                f"{self.__class__.__name__}: Running {len(rules)} rules across {worker_count} browser contexts.",
+                "INFO",
+            )
 
-        self._worker.moveToThread(self._thread)
+        self._running_workers = worker_count
+        self._run_started = False
+        self._step_timer = StepTimingRecorder(self.RUN_NAME)
+        run_logger = self._start_run_log(job)
+        for worker_id in range(worker_count):
+            thread = QThread()
+            worker = RuleRunnerWorker(
+                job,
+                self._browser_session_factory,
+                self._session,
+                self._auth_service,
+                run_logger,
+                self._profile_registry,
+                work_queue=work_queue,
+                worker_id=worker_id,
+                step_timer=self._step_timer,
+            )
 
-        self._thread.started.connect(self._worker.do_work)
-        self._worker.runner_life_cyle.connect(self.runner_life_cyle)
-        self._worker.done.connect(self._thread.quit)
-        self._worker.done.connect(self._worker.deleteLater)
-        self._worker.progress.connect(self.progress)
-        self._worker.task_progress.connect(self.task_progress)
-        self._thread.finished.connect(self._clean_up_thread)
-        self._thread.start()
+            worker.moveToThread(thread)
 
-    def _clean_up_thread(self):
-        if self._thread:
-            self._logger(
-                f"{self.__class__.__name__}: Rule Runner Thread finished. Cleaning up.",
-                "INFO",
+            thread.started.connect(worker.do_work)
+            worker.runner_life_cyle.connect(self._on_worker_life_cycle)
+            worker.done.connect(thread.quit)
+            worker.done.connect(worker.deleteLater)
+            worker.progress.connect(self.progress)
+            worker.task_progress.connect(
+                self._progress_coalescer.push, Qt.ConnectionType.DirectConnection
+            )
+            thread.finished.connect(lambda thread=thread: self._clean_up_thread(thread))
+            self._threads.append(thread)
+            self._workers.append(worker)
+
+        self._progress_coalescer.start()
+        for thread in self._threads:
+            thread.start()
+
+    def last_run_journal(self) -> RunJournalState | None:
+        if self._journal_store is None:
+            return None
+        return self._journal_store.latest(RUNJOURNALKIND.RULES)
+
+    def _start_journal(
+        self, job: JobRequest[RuleRunnerRequestPayload]
+    ) -> RunJournal | None:
+        if self._journal_store is None:
+            return None
+        serializer = RuleSerializer()
+        items = [
+            JournalItem(
+                item.rule_guid,
+                item.rule.rule_name,
+                serializer.to_schema_dict(item.rule),
             )
-            self._thread.deleteLater()
-            self._clean_up_refs()
-
-        if self._shut_down_in_requested:
-            self._shut_down_in_requested = False
-            self.shutdown_ready.emit("rule_runner")
-
-    def _clean_up_refs(self):
-        self._worker = None
-        self._thread = None
-
-    def request_app_shutdown(self) -> bool:
-        if not self._thread or not self._thread.isRunning():
-            return True
-        self._logger(
-            f"{self.__class__.__name__}: Runner still active. Deferring app shutdown.",
-            "WARN",
+            for item in job.payload.rules
+        ]
+        return self._journal_store.start(
+            RUNJOURNALKIND.RULES,
+            job.id,
+            items,
+            resumed_from=job.payload.resumed_from,
         )
-        self._shut_down_in_requested = True
-        self.stop_current_run()
-        return False
-
-    def stop_current_run(self):
-        if self._worker:
-            self._worker.stop()
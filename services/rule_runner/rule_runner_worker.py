@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Deque
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..auth.auth_service import AuthService
@@ -12,18 +12,17 @@ if TYPE_CHECKING:
     from ..browser import BrowserSessionFactory
     from services.browser.models import PlaywrightSession
     from services.profiles import ProfileRegistry
+    from services.monitor.timing import StepTimingRecorder
 
 import time
-from collections import deque
 from threading import Event, get_ident
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import Signal
 
 from base.enums import INTRAVERSION
-from services.auth.enums import PROVIDERS
 
 from ..auth.enums import AUTHSTATUS
-from ..auth.models.auth_result import AuthResult
+from ..base.runner_worker_base import RunnerWorkerBase
 from .enums import RULEEXECSTATUS, RULERUNSTATUS, RULERUNNERLIFECYCLE
 
 # from rulerunner.rule_worker import RuleWorker
@@ -34,9 +33,10 @@ from .models import (
     RuleProgressEvent,
     RuleRunItem,
 )
+from .rule_work_queue import RuleWorkQueue
 
 
-class RuleRunnerWorker(QObject):
+class RuleRunnerWorker(RunnerWorkerBase):
     done = Signal()
     progress = Signal(int, int)
     runner_result = Signal(object)
@@ -51,9 +51,17 @@ class RuleRunnerWorker(QObject):
         auth_service: AuthService,
         logger: LogAdapter,
         profile_registry: ProfileRegistry,
+        work_queue: RuleWorkQueue | None = None,
+        worker_id: int = 0,
+        step_timer: StepTimingRecorder | None = None,
     ):
         super().__init__()
-        self.rule_queue: Deque[RuleRunItem] = deque(job.payload.rules)
+        self.rule_queue = (
+            work_queue if work_queue is not None else RuleWorkQueue(job.payload.rules)
+        )
+        self.session_gate = self.rule_queue.session_gate
+        self.worker_id = worker_id
+        self.step_timer = step_timer
         self.logger = logger
         self.session = session
         self.auth_service = auth_service
@@ -65,26 +73,44 @@ class RuleRunnerWorker(QObject):
         self.driver = None
         self.driver_adapter = None
         self.current_executor: RuleExecutor | None = None
-        self.errored_rules: list[RuleRunItem] = []
-        self.success_rules: list[RuleRunItem] = []
-        self.completed_count = 0
-        self.total_count = len(self.rule_queue)
         self._shut_down = Event()
+        # Set when this worker lost its session but the run carries on.
+        self._retired = False
 
         self.playwright_session_manager = None
         self.playwright_session: PlaywrightSession | None = None
 
         self.profile_registry = profile_registry
 
+    @property
+    def is_lead(self) -> bool:
+        return self.worker_id == 0
+
+    @property
+    def shares_session(self) -> bool:
+        return self.rule_queue.is_shared
+
+    @property
+    def completed_count(self) -> int:
+        return self.rule_queue.completed_count
+
+    @property
+    def total_count(self) -> int:
+        return self.rule_queue.total_count
+
     def should_stop(self) -> bool:
         return self._shut_down.is_set()
 
     def send_rule_progress(self, event: RuleProgressEvent):
         self.task_progress.emit(event)
 
-    def logging(self, msg, level="INFO", print_msg=True) -> None:
-        msg = f"{self.__class__.__name__}: {msg}"
-        self.logger(msg, level, print_msg)
+    def logging(self, msg, level="INFO", print_msg=True, args=()) -> None:
+        if not self.logger.wants(level):
+            return
+        name = self.__class__.__name__
+        if self.rule_queue.is_shared:
+            name = f"{name}[{self.worker_id}]"
+        self.logger(msg, level, print_msg, args=args, source=name)
 
     def do_work(self):
         self.logging(
@@ -96,61 +122,14 @@ class RuleRunnerWorker(QObject):
             self.run_queue()
 
         except Exception as e:
-            self.logging(f"{e}", "DEBUG")
+            self.logging("%s", "DEBUG", args=(e,))
             self.logging("Fatal Error", "ERROR")
         finally:
+            if self.is_lead:
+                self.session_gate.lead_finished()
             self.runner_life_cyle.emit(RULERUNNERLIFECYCLE.FINISHED)
             self.clean_up()
 
-    def _init_browser(self, load_session_cookies=False) -> None:
-        """
-        Initializes the Selenium WebDriver through the WebDriverManager.
-        """
-        self.playwright_session_manager = self.browser_session_factory.create_session(
-            PROVIDERS.INTRA
-        )
-        self.playwright_session = self.playwright_session_manager.start()
-
-    def _close_down_browser(self):
-        if not self.playwright_session_manager:
-            return
-        self.playwright_session_manager.close()
-        self.playwright_session_manager = None
-        self.playwright_session = None
-
-    def _rebuild_browser(self):
-        self._close_down_browser()
-        self._init_browser(load_session_cookies=False)
-
-    def _authenticate(self) -> AuthResult:
-        auth_attempts = 0
-        max_attempts = 2
-
-        while auth_attempts < max_attempts:
-            if self.should_stop():
-                return AuthResult(success=False, status=AUTHSTATUS.STOPPED_REQUESTED)
-            self.logging(
-                f"Attempting to authenticate: {auth_attempts} / {max_attempts-1}"
-            )
-            result = self.auth_service.ensure_auth(
-                PROVIDERS.INTRA,
-                self.creds,
-                self.playwright_session.browser_adapter,
-                should_stop_cb=self.should_stop,
-            )
-
-            if result.success:
-                self.logging("Received Successful Authentication.")
-                return result
-            self.logging("Received Failure Authentication.", "WARN")
-            if result.status == AUTHSTATUS.BROWSER_ERROR:
-                self._rebuild_browser()
-            auth_attempts += 1
-        self.logging(
-            "Attempted to log in 2 times. Login Failed due to an error.", "ERROR"
-        )
-        return result
-
     def _send_batch_progress(
         self,
         status: RULEEXECSTATUS,
@@ -158,7 +137,7 @@ class RuleRunnerWorker(QObject):
         start_time: bool = False,
         end_time: bool = False,
     ):
-        for rule_item in self.rule_queue:
+        for rule_item in self.rule_queue.pending_items():
             self.send_rule_progress(
                 RuleProgressEvent(
                     rule_guid=rule_item.rule_guid,
@@ -175,23 +154,29 @@ class RuleRunnerWorker(QObject):
 
         try:
             self.runner_life_cyle.emit(RULERUNNERLIFECYCLE.STARTED)
-            self._send_batch_progress(RULEEXECSTATUS.PENDING, "Rule queued.")
-            auth_result = self._authenticate()
+            if self.is_lead:
+                self._send_batch_progress(RULEEXECSTATUS.PENDING, "Rule queued.")
+            auth_result = self._start_session()
             if auth_result.status == AUTHSTATUS.STOPPED_REQUESTED:
                 self.stop_clean_up()
                 return
 
             if not auth_result.success:
-                self._shut_down.set()
-                self._drain_remaining_rules(
-                    RULERUNSTATUS.FAILED, "Failed to Authenticate"
-                )
+                self._stop_after_auth_failure("Failed to Authenticate")
                 return
 
-            while self.rule_queue and not self.should_stop():
+            while not self.should_stop() and not self._retired:
+                refresh_result = self._refresh_session_if_requested()
+                if refresh_result is not None and not refresh_result.success:
+                    self._stop_after_auth_failure(
+                        "Failed to refresh the shared session"
+                    )
+                    return
                 self.progress.emit(self.completed_count, self.total_count)
                 try:
-                    item = self.rule_queue.popleft()
+                    item = self.rule_queue.pop_next()
+                    if item is None:
+                        break
                     item.status = RULERUNSTATUS.RUNNING
                     context = RuleExecutionContext(
                         tenant=self.creds.tenant,
@@ -203,6 +188,7 @@ class RuleRunnerWorker(QObject):
                             INTRAVERSION(self.creds.platform_version)
                         ),
                         progress_cb=self.send_rule_progress,
+                        step_timer=self.step_timer,
                     )
                     self.send_rule_progress(
                         RuleProgressEvent(
@@ -221,7 +207,7 @@ class RuleRunnerWorker(QObject):
                     if self.should_stop():
                         self.stop_clean_up()
                         return
-                    self.logging(f"{e}", "DEBUG")
+                    self.logging("%s", "DEBUG", args=(e,))
                     self.logging(
                         "Failure in rule. Trying to process next rule", "ERROR"
                     )
@@ -237,7 +223,12 @@ class RuleRunnerWorker(QObject):
             self.logging("Fatal Error Occurred. Shutting Down", "ERROR")
             self.logging(f"{e}", "ERROR")
         finally:
-            self.create_rule_summary()
+            if self.rule_queue.release_worker():
+                if len(self.rule_queue):
+                    self._drain_remaining_rules(
+                        RULERUNSTATUS.FAILED, "No runner workers left"
+                    )
+                self.create_rule_summary()
 
     def _send_result_progress(
         self,
@@ -264,16 +255,15 @@ class RuleRunnerWorker(QObject):
             self.logging(f"{result.rule_name} - succeeded.")
             item.status = RULERUNSTATUS.SUCCESS
             item.rule.rule_name = result.rule_name
-            self.success_rules.append(item)
+            self.rule_queue.record_success(item)
             self._send_result_progress(item, result, "Succeeded", use_exec_status=False)
-            self.completed_count += 1
         else:
             if result.status == RULEEXECSTATUS.RUNNER_STOPPED_ERROR:
                 self._send_result_progress(
                     item, result, "Stop Requested", use_exec_status=True
                 )
-                self.errored_rules.append(item)
-                self.completed_count = self.total_count
+                self.rule_queue.record_failure(item, completed=False)
+                self.rule_queue.mark_all_completed()
                 self.logging("Rule Executor stopped.", "WARN")
                 self.stop_clean_up()
                 return
@@ -283,8 +273,7 @@ class RuleRunnerWorker(QObject):
                 item.retry_count += 1
                 if result.status in (RULEEXECSTATUS.NAME_EXISTS_ERROR):
                     item.status = RULERUNSTATUS.FAILED
-                    self.errored_rules.append(item)
-                    self.completed_count += 1
+                    self.rule_queue.record_failure(item)
                     self.logging(f"{result.rule_name} - not retrying running rule.")
                     self._send_result_progress(
                         item, result, "Rule Name Exists Already.", use_exec_status=False
@@ -296,16 +285,15 @@ class RuleRunnerWorker(QObject):
 
                     self.logging(f"{result.rule_name} - retrying running rule.")
                     item.status = RULERUNSTATUS.RETRYING
-                    self.rule_queue.appendleft(item)
+                    self.rule_queue.requeue(item)
                     self._send_result_progress(
                         item, result, "Retrying...", use_exec_status=False
                     )
                     self._rebuild_browser()
-                    auth_result = self._authenticate()
+                    auth_result = self._reauthenticate()
                     if not auth_result.success:
-                        self._shut_down.set()
-                        self._drain_remaining_rules(
-                            RULERUNSTATUS.FAILED, "Authentication failed during retry"
+                        self._stop_after_auth_failure(
+                            "Authentication failed during retry"
                         )
                         return
             else:
@@ -314,21 +302,22 @@ class RuleRunnerWorker(QObject):
                 self._send_result_progress(
                     item, result, "Failed. Not retrying.", use_exec_status=False
                 )
-                self.errored_rules.append(item)
-                self.completed_count += 1
+                self.rule_queue.record_failure(item)
 
     def create_rule_summary(self) -> None:
         """
         Creates a summary of successfully executed and errored rules.
         """
-        errored_rules_msg = f"ERRORED RULES TOTAL: {len(self.errored_rules)} \n"
-        succeeded_rules_msg = f"SUCCEEDED RULES TOTAL: {len(self.success_rules)} \n"
+        errored_rules = self.rule_queue.errored_rules
+        success_rules = self.rule_queue.success_rules
+        errored_rules_msg = f"ERRORED RULES TOTAL: {len(errored_rules)} \n"
+        succeeded_rules_msg = f"SUCCEEDED RULES TOTAL: {len(success_rules)} \n"
         tabs = "\t" * 3
-        for error_rule in self.errored_rules:
+        for error_rule in errored_rules:
             errored_rules_msg += (
                 f"{tabs}- {error_rule.rule.rule_name} - {error_rule.rule_guid} \n"
             )
-        for succeed_rule in self.success_rules:
+        for succeed_rule in success_rules:
             succeeded_rules_msg += (
                 f"{tabs}- {succeed_rule.rule.rule_name} - {succeed_rule.rule_guid} \n"
             )
@@ -336,14 +325,26 @@ class RuleRunnerWorker(QObject):
         self.logging(errored_rules_msg, "ERROR")
 
     def _drain_remaining_rules(self, status: RULERUNSTATUS, reason: str):
-        while self.rule_queue:
-            self._send_batch_progress(status, reason, end_time=True)
-            item = self.rule_queue.popleft()
+        self._send_batch_progress(status, reason, end_time=True)
+        for item in self.rule_queue.drain():
             item.status = status
-            self.errored_rules.append(item)
+            self.rule_queue.record_failure(item, completed=False)
 
         self.logging(f"Removing remaining rules from queue: {reason}", "WARN")
 
+    def _stop_after_auth_failure(self, reason: str):
+        """
+        Stops this worker after it failed to authenticate. The remaining
+        rules are only failed when the shared session is gone as well,
+        otherwise the other workers keep pulling them.
+        """
+        if self._session_outlives_worker():
+            self.logging(f"{reason}. Stopping this worker only.", "WARN")
+            self._retired = True
+            return
+        self._shut_down.set()
+        self._drain_remaining_rules(RULERUNSTATUS.FAILED, reason)
+
     def stop_clean_up(self):
         self._drain_remaining_rules(
             RULERUNSTATUS.STOPPED, "Rule runner manually stopped."
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from ..run_journal import RunJournal
+    from .models import RuleRunItem
+
+from collections import deque
+from threading import Lock
+
+from ..base.shared_session_gate import SharedSessionGate
+
+
+class RuleWorkQueue:
+    """
+    Thread-safe queue of RuleRunItems shared by every RuleRunnerWorker in a run.
+
+    It also holds the run totals and the shared authenticated session gate, so
+    follower workers can wait for the lead worker to log in once and then reuse
+    its cookies instead of driving the login form themselves.
+
+    Finished, failed and requeued items are written to the run's journal when
+    it has one, so an interrupted run can be resumed.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[RuleRunItem],
+        worker_count: int = 1,
+        journal: RunJournal | None = None,
+    ):
+        self._items: deque[RuleRunItem] = deque(items)
+        self._lock = Lock()
+        self.journal = journal
+        self.worker_count = worker_count
+        self.total_count = len(self._items)
+        self.completed_count = 0
+        self.errored_rules: list[RuleRunItem] = []
+        self.success_rules: list[RuleRunItem] = []
+        self._active_workers = worker_count
+        self.session_gate = SharedSessionGate()
+
+    @property
+    def is_shared(self) -> bool:
+        return self.worker_count > 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def pop_next(self) -> RuleRunItem | None:
+        with self._lock:
+            if not self._items:
+                return None
+            return self._items.popleft()
+
+    def requeue(self, item: RuleRunItem) -> None:
+        with self._lock:
+            self._items.appendleft(item)
+        self._journal_status(item)
+
+    def pending_items(self) -> list[RuleRunItem]:
+        with self._lock:
+            return list(self._items)
+
+    def drain(self) -> list[RuleRunItem]:
+        with self._lock:
+            items = list(self._items)
+            self._items.clear()
+            return items
+
+    def record_success(self, item: RuleRunItem) -> None:
+        with self._lock:
+            self.success_rules.append(item)
+            self.completed_count += 1
+        self._journal_status(item)
+
+    def record_failure(self, item: RuleRunItem, completed: bool = True) -> None:
+        with self._lock:
+            self.errored_rules.append(item)
+            if completed:
+                self.completed_count += 1
+        self._journal_status(item)
+
+    def _journal_status(self, item: RuleRunItem) -> None:
+        if self.journal is not None:
+            self.journal.record(item.rule_guid, item.status)
+
+    def mark_all_completed(self) -> None:
+        with self._lock:
+            self.completed_count = self.total_count
+
+    def release_worker(self) -> bool:
+        """
+        Marks a worker as finished. Returns True for the last worker out.
+        """
+        with self._lock:
+            self._active_workers -= 1
+            return self._active_workers <= 0
@@ -33,3 +33,6 @@ class RuleRegistry(ServiceBase):
 
     def get_all(self) -> list[Rule]:
         return list(self.rules.values())
+
+    def get_order(self) -> list[str]:
+        return list(self.rules)
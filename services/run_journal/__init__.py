@@ -0,0 +1,4 @@
+from .run_journal import RunJournal
+from .run_journal_store import RunJournalStore
+
+__all__ = ["RunJournal", "RunJournalStore"]
@@ -0,0 +1,3 @@
+from .run_journal_kind import RUNJOURNALKIND
+
+__all__ = ["RUNJOURNALKIND"]
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class RUNJOURNALKIND(StrEnum):
+    RULES = "rules"
+    QUEUES = "queues"
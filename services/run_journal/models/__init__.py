@@ -0,0 +1,4 @@
+from .journal_item import JournalItem
+from .run_journal_state import RunJournalState
+
+__all__ = ["JournalItem", "RunJournalState"]
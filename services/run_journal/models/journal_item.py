@@ -0,0 +1,8 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class JournalItem:
+    guid: str
+    name: str
+    data: dict = field(default_factory=dict)
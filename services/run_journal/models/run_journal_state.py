@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..enums import RUNJOURNALKIND
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .journal_item import JournalItem
+
+
+@dataclass
+class RunJournalState:
+    # Rule and queue run statuses share this value for a finished item.
+    COMPLETED_STATUS = "success"
+
+    run_id: str
+    kind: RUNJOURNALKIND
+    path: Path
+    started_at: float = 0.0
+    meta: dict = field(default_factory=dict)
+    resumed_from: str | None = None
+    items: dict[str, JournalItem] = field(default_factory=dict)
+    statuses: dict[str, str] = field(default_factory=dict)
+    finished: bool = False
+
+    @property
+    def completed_count(self) -> int:
+        return sum(
+            1 for guid in self.items if self.statuses.get(guid) == self.COMPLETED_STATUS
+        )
+
+    @property
+    def remaining_items(self) -> list[JournalItem]:
+        """Items that never succeeded, in the order they were journaled."""
+        return [
+            item
+            for guid, item in self.items.items()
+            if self.statuses.get(guid) != self.COMPLETED_STATUS
+        ]
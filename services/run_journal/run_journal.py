@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from services.logger.adapters import LogAdapter
+    from .models import JournalItem
+
+import json
+import time
+from dataclasses import asdict
+from threading import Lock
+
+
+class RunJournal:
+    """
+    Append-only JSONL journal of one rule or queue run.
+
+    The run header and the items are written when the run starts, then one
+    status record per item transition. Every write is flushed, so a crash
+    loses at most the record being written and RunJournalStore.load skips a
+    torn last line. Workers in the same run share one journal, so writes are
+    lock protected. A failed write turns the journal off for the rest of the
+    run instead of failing the run.
+    """
+
+    def __init__(self, path: Path, run_id: str, logger: LogAdapter | None = None):
+        self.path = path
+        self.run_id = run_id
+        self.logger = logger
+        self._lock = Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def logging(self, msg, level="INFO", print_msg=True) -> None:
+        if self.logger is None:
+            return
+        msg = f"{self.__class__.__name__}: {msg}"
+        self.logger(msg, level, print_msg)
+
+    def write_header(
+        self,
+        kind: str,
+        meta: dict | None = None,
+        resumed_from: str | None = None,
+    ) -> None:
+        self._write(
+            [
+                {
+                    "type": "run",
+                    "run_id": self.run_id,
+                    "kind": str(kind),
+                    "started_at": time.time(),
+                    "resumed_from": resumed_from,
+                    "meta": meta or {},
+                }
+            ]
+        )
+
+    def add_items(self, items: Iterable[JournalItem]) -> None:
+        self._write([{"type": "item", **asdict(item)} for item in items])
+
+    def record(self, guid: str, status: str) -> None:
+        self._write(
+            [{"type": "status", "guid": guid, "status": str(status), "at": time.time()}]
+        )
+
+    def close(self) -> None:
+        self._write([{"type": "end", "at": time.time()}])
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write(self, records: list[dict]) -> None:
+        if not records:
+            return
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.write(
+                    "".join(
+                        json.dumps(record, default=str) + "\n" for record in records
+                    )
+                )
+                self._file.flush()
+            except (OSError, TypeError, ValueError) as e:
+                self.logging(
+                    f"Could not write run journal {self.path}: {e}. Journal disabled.",
+                    "ERROR",
+                )
+                self._file.close()
+                self._file = None
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from services.logger.adapters import LogAdapter
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from utils.files import PathManager
+
+from .enums import RUNJOURNALKIND
+from .models import JournalItem, RunJournalState
+from .run_journal import RunJournal
+
+
+class RunJournalStore:
+    """
+    Creates and reads the run journals in the app data "run_journal" folder.
+
+    One file per run, named by kind and start time so the newest journal of
+    a kind sorts last. Only the newest `keep` journals of each kind are kept.
+    """
+
+    def __init__(
+        self, logger: LogAdapter, folder: str | Path | None = None, keep: int = 20
+    ):
+        self.logger = logger
+        self._folder = Path(folder) if folder else None
+        self.keep = keep
+
+    def logging(self, msg, level="INFO", print_msg=True) -> None:
+        msg = f"{self.__class__.__name__}: {msg}"
+        self.logger(msg, level, print_msg)
+
+    @property
+    def folder(self) -> Path:
+        if self._folder is None:
+            self._folder = Path(PathManager.create_folder_in_app_data("run_journal"))
+        return self._folder
+
+    def start(
+        self,
+        kind: RUNJOURNALKIND,
+        run_id: str,
+        items: list[JournalItem],
+        meta: dict | None = None,
+        resumed_from: str | None = None,
+    ) -> RunJournal | None:
+        """
+        Opens a new journal and writes the header and items. Returns None if
+        the file cannot be created, the run then goes ahead unjournaled.
+        """
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = self.folder / f"{kind}_{stamp}_{run_id[:8]}.jsonl"
+        try:
+            journal = RunJournal(path, run_id, self.logger)
+        except OSError as e:
+            self.logging(f"Could not create run journal {path}: {e}", "ERROR")
+            return None
+
+        journal.write_header(kind, meta, resumed_from)
+        journal.add_items(items)
+        self.logging(f"Journaling {len(items)} {kind} to {path}")
+        self._prune(kind)
+        return journal
+
+    def latest(self, kind: RUNJOURNALKIND) -> RunJournalState | None:
+        paths = self._journal_paths(kind)
+        if not paths:
+            return None
+        return self.load(paths[-1])
+
+    def load(self, path: Path) -> RunJournalState | None:
+        """
+        Replays a journal file. Lines that do not parse, like a last line cut
+        off by a crash, are skipped.
+        """
+        state = None
+        try:
+            with open(path, encoding="utf-8") as journal_file:
+                for line in journal_file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    record_type = record.get("type")
+                    if record_type == "run":
+                        state = RunJournalState(
+                            run_id=record.get("run_id", ""),
+                            kind=RUNJOURNALKIND(record.get("kind")),
+                            path=Path(path),
+                            started_at=record.get("started_at", 0.0),
+                            meta=record.get("meta") or {},
+                            resumed_from=record.get("resumed_from"),
+                        )
+                    elif state is None:
+                        continue
+                    elif record_type == "item":
+                        state.items[record["guid"]] = JournalItem(
+                            guid=record["guid"],
+                            name=record.get("name", ""),
+                            data=record.get("data") or {},
+                        )
+                    elif record_type == "status":
+                        state.statuses[record["guid"]] = record.get("status", "")
+                    elif record_type == "end":
+                        state.finished = True
+        except (OSError, ValueError, KeyError) as e:
+            self.logging(f"Could not read run journal {path}: {e}", "ERROR")
+            return None
+        return state
+
+    def _journal_paths(self, kind: RUNJOURNALKIND) -> list[Path]:
+        return sorted(self.folder.glob(f"{kind}_*.jsonl"))
+
+    def _prune(self, kind: RUNJOURNALKIND) -> None:
+        for path in self._journal_paths(kind)[: -self.keep]:
+            try:
+                path.unlink()
+            except OSError as e:
+                self.logging(f"Could not remove old run journal {path}: {e}", "WARN")
@@ -6,6 +6,8 @@ from ..enums import SETTINGSCATEGORIES, SETTINGSWIDGETTYPE
 
 from ..validators.browser_validators import (
     validate_browser_headless,
+    validate_browser_keep_warm,
+    validate_browser_max_workers,
     validate_browser_move_delay_speed,
 )
 from .base_category_map import SettingsCategoryBase
@@ -38,3 +40,25 @@ class BrowserSettings(SettingsCategoryBase):
         folder_icon=False,
         verify=validate_browser_move_delay_speed,
     )
+    browser_max_workers: int = setting(
+        key="browser_max_workers",
+        default=1,
+        category=SETTINGSCATEGORIES.BROWSER,
+        widget_type=SETTINGSWIDGETTYPE.LINE_EDIT,
+        label_text="Max Browsers Per Tenant:",
+        verify_btn_text="Save",
+        secure=False,
+        folder_icon=False,
+        verify=validate_browser_max_workers,
+    )
+    browser_keep_warm: str = setting(
+        key="browser_keep_warm",
+        default="True",
+        category=SETTINGSCATEGORIES.BROWSER,
+        widget_type=SETTINGSWIDGETTYPE.COMBO_BOX,
+        label_text="Keep Browser Running Between Runs:",
+        verify_btn_text="Save",
+        secure=False,
+        combo_box=["True", "False"],
+        verify=validate_browser_keep_warm,
+    )
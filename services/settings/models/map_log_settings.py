@@ -4,12 +4,14 @@ from typing import ClassVar
 from ..enums import SETTINGSCATEGORIES, SETTINGSWIDGETTYPE
 from ..validators.log_validators import (
     validate_log_backup_count,
+    validate_log_console_max_lines,
     validate_log_file_max_mbs,
     validate_log_file_name,
     validate_log_file_path,
     validate_log_keep_files_days,
     validate_log_level,
     validate_log_print_logs,
+    validate_log_structured_runs,
 )
 from .base_category_map import SettingsCategoryBase
 from .settings_field_helper import setting
@@ -75,6 +77,17 @@ class LogSettings(SettingsCategoryBase):
         folder_icon=False,
         verify=validate_log_backup_count,
     )
+    log_console_max_lines: int = setting(
+        key="log_console_max_lines",
+        default=5000,
+        category=SETTINGSCATEGORIES.LOG,
+        widget_type=SETTINGSWIDGETTYPE.LINE_EDIT,
+        label_text="Log Page Max Lines:",
+        verify_btn_text="Save Log Page Max Lines",
+        secure=False,
+        folder_icon=False,
+        verify=validate_log_console_max_lines,
+    )
     log_level: str = setting(
         key="log_level",
         default="INFO",
@@ -102,3 +115,14 @@ class LogSettings(SettingsCategoryBase):
         combo_box=["True", "False"],
         verify=validate_log_print_logs,
     )
+    log_structured_runs: str = setting(
+        key="log_structured_runs",
+        default="False",
+        category=SETTINGSCATEGORIES.LOG,
+        widget_type=SETTINGSWIDGETTYPE.COMBO_BOX,
+        label_text="Structured Run Logs:",
+        verify_btn_text="Save Structured Run Logs",
+        secure=False,
+        combo_box=["True", "False"],
+        verify=validate_log_structured_runs,
+    )
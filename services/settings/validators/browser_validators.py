@@ -18,3 +18,13 @@ def validate_browser_move_delay_speed(field, value):
 
 def validate_browser_headless(field, value):
     return helper.settings_response(field, value, True)
+
+
+def validate_browser_max_workers(field, value):
+    success_error = helper.is_int(value) and 1 <= int(value) <= 8
+    msg = "Value must be an integer between 1 and 8."
+    return helper.settings_response(field, value, success_error, msg)
+
+
+def validate_browser_keep_warm(field, value):
+    return helper.settings_response(field, value, True)
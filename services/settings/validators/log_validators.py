@@ -31,6 +31,12 @@ def validate_log_backup_count(field, value):
     return helper.settings_response(field, value, helper.is_int(value))
 
 
+def validate_log_console_max_lines(field, value):
+    return helper.settings_response(
+        field, value, helper.is_int(value) and int(value) > 0
+    )
+
+
 def validate_log_level(field, value):
     try:
         LOGLEVEL(value)
@@ -41,3 +47,7 @@ def validate_log_level(field, value):
 
 def validate_log_print_logs(field, value):
     return helper.settings_response(field, value, True)
+
+
+def validate_log_structured_runs(field, value):
+    return helper.settings_response(field, value, value in ("True", "False"))
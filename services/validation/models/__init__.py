@@ -7,6 +7,7 @@ from .validation_schema_response import SchemaValidateResponse
 from .validation_schema_error import SchemaError
 from .validation_batch_request import ValidationBatchRequest
 from .validation_batch_response import ValidationBatchResponse
+from .schema_batch_state import SchemaBatchState
 
 __all__ = [
     "ValidationRequest",
@@ -18,4 +19,5 @@ __all__ = [
     "SchemaError",
     "ValidationBatchRequest",
     "ValidationBatchResponse",
+    "SchemaBatchState",
 ]
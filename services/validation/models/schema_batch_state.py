@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..schema_validation_shard import SchemaValidationShardSignals
+
+from dataclasses import dataclass, field
+from threading import Event
+
+
+@dataclass
+class SchemaBatchState:
+    job_id: str
+    shards_remaining: int
+    cancelled: Event = field(default_factory=Event)
+    failed: bool = False
+    signals: list[SchemaValidationShardSignals] = field(default_factory=list)
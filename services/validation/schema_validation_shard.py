@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from services.logger.adapters import LogAdapter
+    from .models import SchemaValidatePayload, SchemaValidateResponse
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class SchemaValidationShardSignals(QObject):
+    """
+    QRunnable is not a QObject, so a shard reports back through this object.
+    It is created on the service's thread, so the connected slots run there.
+    """
+
+    shard_validated = Signal(str, list)
+    shard_failed = Signal(str, str)
+    shard_done = Signal(str)
+
+
+class SchemaValidationShard(QRunnable):
+    """
+    Validates one slice of a schema batch on a QThreadPool thread. Results
+    are sent back once for the whole shard; shard_done is always emitted last
+    so the service can count finished shards, even when cancelled.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        payloads: list[SchemaValidatePayload],
+        validate_item: Callable[[SchemaValidatePayload], SchemaValidateResponse],
+        should_stop: Callable[[], bool],
+        logger: LogAdapter,
+    ):
+        super().__init__()
+        self.job_id = job_id
+        self.payloads = payloads
+        self.validate_item = validate_item
+        self.should_stop = should_stop
+        self.logger = logger
+        self.signals = SchemaValidationShardSignals()
+
+    def logging(self, msg, level="INFO", print_msg=True) -> None:
+        msg = f"{self.__class__.__name__}: {msg}"
+        self.logger(msg, level, print_msg)
+
+    def run(self):
+        try:
+            responses = []
+            for payload in self.payloads:
+                if self.should_stop():
+                    return
+                responses.append(self.validate_item(payload))
+            self.signals.shard_validated.emit(self.job_id, responses)
+        except Exception as e:
+            self.logging(f"Error validating shard: {e}", "ERROR")
+            self.signals.shard_failed.emit(self.job_id, str(e))
+        finally:
+            self.signals.shard_done.emit(self.job_id)
@@ -4,29 +4,52 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..base.models import JobRequest
-    from .models import ValidationRequest, SchemaValidatePayload
+    from .models import (
+        ValidationRequest,
+        ValidationBatchRequest,
+        SchemaValidatePayload,
+    )
     from jsonschema import ValidationError
     from services.logger.adapters import LogAdapter
     from .interfaces.schema_meta_provider import SchemaMetaProvider
 
-from PySide6.QtCore import Signal
+from math import ceil
+
+from PySide6.QtCore import QThread, QThreadPool, Signal, Slot
 
 from .base_validator import BaseValidator
 from ..base.enums import JOBSTATUS
 from ..base.models import JobRef, JobResponse
 
 from .enums import VALIDATEJOBTYPE
-from .models import SchemaValidateResponse, ValidationResponse, SchemaError
+from .models import (
+    SchemaBatchState,
+    SchemaValidateResponse,
+    ValidationBatchResponse,
+    ValidationResponse,
+    SchemaError,
+)
+from .schema_validation_shard import SchemaValidationShard
 from schemas.enums import SCHEMATYPE
 
 
 class SchemaValidationService(BaseValidator):
+    MIN_SHARD_SIZE = 25
+    MAX_SHARD_SIZE = 250
+    SHARDS_PER_THREAD = 4
+
     task_complete = Signal(object)
+    shutdown_ready = Signal(str)
 
     def __init__(self, logger: LogAdapter, schema_meta_provider: SchemaMetaProvider):
         super().__init__(logger)
+        self._logger = logger
         self.schema_meta_provider = schema_meta_provider
         self._pending_jobs = {}
+        self._batches: dict[str, SchemaBatchState] = {}
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
+        self._shut_down_in_requested = False
 
         self._schema_dispatcher = {
             SCHEMATYPE.RULES: self._validate_rules,
@@ -37,18 +60,68 @@ class SchemaValidationService(BaseValidator):
         self, job: JobRequest[ValidationRequest[SchemaValidatePayload]]
     ) -> JobResponse[ValidationResponse]:
         self._pending_jobs[job.id] = job
+        result = self._validate_item(job.payload.data)
+        self.send_validation_response(job.id, result)
+
+    def validate_batch(
+        self, job: JobRequest[ValidationBatchRequest[SchemaValidatePayload]]
+    ) -> JobResponse[ValidationBatchResponse]:
+        """
+        Splits the batch into shards and validates them on the thread pool.
+        Each finished shard is streamed back as an IN_PROGRESS task_complete
+        carrying that shard's SchemaValidateResponses, followed by one
+        COMPLETE (or ERROR) response with no data once every shard is done.
+        """
+        payloads = list(job.payload.data)
+        for payload in payloads:
+            self._get_dispatcher(payload.schema_type)
+        self._pending_jobs[job.id] = job
+
+        shard_size = self._shard_size(len(payloads))
+        shards = [
+            payloads[start : start + shard_size]
+            for start in range(0, len(payloads), shard_size)
+        ]
+        if not shards:
+            self.send_batch_complete(job.id)
+            return
+
+        state = SchemaBatchState(job_id=job.id, shards_remaining=len(shards))
+        self._batches[job.id] = state
+        for shard_payloads in shards:
+            shard = SchemaValidationShard(
+                job.id,
+                shard_payloads,
+                self._validate_item,
+                state.cancelled.is_set,
+                self._logger,
+            )
+            shard.signals.shard_validated.connect(self.send_batch_progress)
+            shard.signals.shard_failed.connect(self.send_batch_failure)
+            shard.signals.shard_done.connect(self._on_shard_done)
+            state.signals.append(shard.signals)
+            self._pool.start(shard)
 
-        payload = job.payload.data
+    def _shard_size(self, total: int) -> int:
+        shard_count = self._pool.maxThreadCount() * self.SHARDS_PER_THREAD
+        size = ceil(total / shard_count) if total else 1
+        return min(self.MAX_SHARD_SIZE, max(self.MIN_SHARD_SIZE, size))
 
-        dispatcher = self._schema_dispatcher.get(payload.schema_type, None)
+    def _get_dispatcher(self, schema_type: SCHEMATYPE):
+        dispatcher = self._schema_dispatcher.get(schema_type, None)
         if dispatcher is None:
-            msg = f"Validator for {payload.schema_type} has not been implemented."
+            msg = f"Validator for {schema_type} has not been implemented."
             self._logging(msg, "ERROR")
             raise NotImplementedError(msg)
+        return dispatcher
 
-        dispatcher(job.id, payload)
+    def _validate_item(self, payload: SchemaValidatePayload) -> SchemaValidateResponse:
+        dispatcher = self._get_dispatcher(payload.schema_type)
+        return dispatcher(payload)
 
-    def _validate_queues(self, job_id: str, payload: SchemaValidatePayload):
+    def _validate_queues(
+        self, payload: SchemaValidatePayload
+    ) -> SchemaValidateResponse:
 
         queue_guid = payload.data.get("guid")
         queue_name = payload.data.get("row_name")
@@ -57,16 +130,15 @@ class SchemaValidationService(BaseValidator):
         )
         total_errors = len(payload_errors)
         valid = total_errors == 0
-        result = SchemaValidateResponse(
+        return SchemaValidateResponse(
             guid=queue_guid,
             schema_type=payload.schema_type,
             valid=valid,
             total_errors=total_errors,
             errors=payload_errors,
         )
-        self.send_validation_response(job_id, result)
 
-    def _validate_rules(self, job_id: str, payload: SchemaValidatePayload):
+    def _validate_rules(self, payload: SchemaValidatePayload) -> SchemaValidateResponse:
         rule_name = payload.data.get("rule_name")
         rule_guid = payload.data.get("guid")
         rule_name = rule_name or "Rule has no Name"
@@ -75,14 +147,13 @@ class SchemaValidationService(BaseValidator):
         )
         total_errors = len(payload_errors)
         valid = total_errors == 0
-        result = SchemaValidateResponse(
+        return SchemaValidateResponse(
             guid=rule_guid,
             schema_type=payload.schema_type,
             valid=valid,
             total_errors=total_errors,
             errors=payload_errors,
         )
-        self.send_validation_response(job_id, result)
 
     def _validate_payload(
         self, name: str, guid: str, schema_type: SCHEMATYPE, data: object
@@ -116,6 +187,76 @@ class SchemaValidationService(BaseValidator):
         self.task_complete.emit(job_response)
         self._pending_jobs.pop(job_id)
 
+    @Slot(str, list)
+    def send_batch_progress(self, job_id: str, responses: list[SchemaValidateResponse]):
+        state = self._batches.get(job_id)
+        if not state or state.failed or job_id not in self._pending_jobs:
+            return
+        job_response = JobResponse(
+            job_ref=JobRef(job_id, task=None, status=JOBSTATUS.IN_PROGRESS),
+            payload=ValidationBatchResponse(
+                kind=VALIDATEJOBTYPE.SCHEMA, data=responses
+            ),
+        )
+        self.task_complete.emit(job_response)
+
+    def send_batch_complete(self, job_id: str):
+        job = self._pending_jobs.pop(job_id, None)
+        if not job:
+            return
+        job_response = JobResponse(
+            job_ref=JobRef(job_id, task=None, status=JOBSTATUS.COMPLETE),
+            payload=ValidationBatchResponse(kind=VALIDATEJOBTYPE.SCHEMA),
+        )
+        self.task_complete.emit(job_response)
+
+    @Slot(str, str)
+    def send_batch_failure(self, job_id: str, error: str):
+        state = self._batches.get(job_id)
+        if state:
+            state.failed = True
+            state.cancelled.set()
+        job = self._pending_jobs.pop(job_id, None)
+        if not job:
+            return
+        job_response = JobResponse(
+            job_ref=JobRef(job_id, task=None, status=JOBSTATUS.ERROR, error=error),
+            payload=ValidationBatchResponse(kind=VALIDATEJOBTYPE.SCHEMA),
+        )
+        self.task_complete.emit(job_response)
+
+    @Slot(str)
+    def _on_shard_done(self, job_id: str):
+        state = self._batches.get(job_id)
+        if not state:
+            return
+        state.shards_remaining -= 1
+        if state.shards_remaining > 0:
+            return
+
+        self._batches.pop(job_id)
+        if state.cancelled.is_set():
+            self._pending_jobs.pop(job_id, None)
+        else:
+            self.send_batch_complete(job_id)
+
+        if self._shut_down_in_requested and not self._batches:
+            self._shut_down_in_requested = False
+            self.shutdown_ready.emit("schema_validation")
+
+    def request_app_shutdown(self) -> bool:
+        if not self._batches:
+            return True
+
+        self._shut_down_in_requested = True
+        for state in self._batches.values():
+            state.cancelled.set()
+
+        self._logging(
+            "Schema batch validation still active. Deferring app shutdown.", "WARN"
+        )
+        return False
+
     def format_validation_error(self, error: ValidationError) -> tuple[str, str, str]:
         """
         Formats a JSON schema validation error into a tuple containing the field that failed,
@@ -61,6 +61,9 @@ class ValidationService(QObjectBase):
         self.shut_down_coordinator.register_service(
             "settings_validation", self.settings_validation
         )
+        self.shut_down_coordinator.register_service(
+            "schema_validation", self.schema_validation
+        )
 
         # CONNECTIONS
 
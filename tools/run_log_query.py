@@ -0,0 +1,57 @@
+"""
+Structured run log query tool.
+
+    python -m tools.run_log_query logs/run_logs/queue_run-20261018-101500-1a2b3c4d.jsonl
+    python -m tools.run_log_query <run log> --limit 20 --errors
+
+Reads a run log written with "Structured Run Logs" turned on in the log
+settings. Prints the per task latency (p50/p95/max) and the failed steps
+by task and status, and with --errors the error lines of the run.
+"""
+
+import argparse
+
+from services.logger.run_log import RunLogQuery
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.run_log_query",
+        description="Per task latency and failure breakdown of a structured run log.",
+    )
+    parser.add_argument("path", help="Run log .jsonl file.")
+    parser.add_argument("--limit", type=int, default=15, help="Rows per table.")
+    parser.add_argument("--guid", help="Only show errors for this rule/queue guid.")
+    parser.add_argument("--errors", action="store_true", help="Print error lines.")
+    args = parser.parse_args()
+
+    query = RunLogQuery.load(args.path)
+    print(
+        f"{len(query.records)} records, run {', '.join(query.run_ids) or '-'}, "
+        f"{len(query.step_timings())} steps"
+    )
+
+    print("\nSlowest tasks (by p95):")
+    for summary in query.task_latencies()[: args.limit]:
+        print(
+            f"  {summary.task_key:<45} p50 {summary.p50_ms:7.0f}ms  "
+            f"p95 {summary.p95_ms:7.0f}ms  max {summary.max_ms:7.0f}ms  "
+            f"n={summary.count}"
+        )
+
+    failures = query.failures()
+    print("\nFailed steps:" if failures else "\nNo failed steps.")
+    for summary in failures[: args.limit]:
+        print(
+            f"  {summary.task_key:<45} {summary.status:<22} "
+            f"{summary.count:>5}x  {summary.items} items"
+        )
+
+    if args.errors or args.guid:
+        print("\nErrors:")
+        for record in query.errors(args.guid)[: args.limit]:
+            print(f"  [{record.guid or '-'}] {record.task or '-'}: {record.msg}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
+from .row_ranges import RowRanges
 from .style_helper import StyleHelper
 from .widget_factory import WidgetFactory
 
-__all__ = ["WidgetFactory", "StyleHelper"]
+__all__ = ["WidgetFactory", "StyleHelper", "RowRanges"]
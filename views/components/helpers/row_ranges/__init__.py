@@ -0,0 +1,3 @@
+from .row_ranges import RowRanges
+
+__all__ = ["RowRanges"]
@@ -0,0 +1,18 @@
+from typing import Iterable
+
+
+class RowRanges:
+
+    @staticmethod
+    def contiguous(indices: Iterable[int]) -> list[tuple[int, int]]:
+        """
+        Groups row indices into sorted, inclusive (first, last) runs so a
+        model can emit one signal per run instead of one per row.
+        """
+        ranges: list[tuple[int, int]] = []
+        for index in sorted(set(indices)):
+            if ranges and index == ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], index)
+            else:
+                ranges.append((index, index))
+        return ranges
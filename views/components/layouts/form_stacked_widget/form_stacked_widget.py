@@ -1,63 +1,248 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
+    from services.rules.models import Rule
+    from services.validation.models import SchemaError
     from ....components.rules import RuleAdapter
 
 from ..stacked_widget import StackedWidget
 
 
 class StackedFormWidget(StackedWidget):
-    def __init__(self):
+    """
+    A stacked widget for rule forms that only builds the form for the current
+    rule and its neighbours.
+
+    The widget keeps the full ordered list of rules, but a form is built when
+    it comes into the window around the current rule and is torn down again
+    when it leaves it. Edits to a torn down form are kept as its validation
+    dict and written back when the form is rebuilt, so navigating away from a
+    rule does not lose anything. Rules that were never built are exported
+    with `to_dict`, which gives the same shape as RuleAdapter.to_validation_dict.
+    """
+
+    def __init__(
+        self,
+        build_form: Callable[[Rule], RuleAdapter],
+        to_dict: Callable[[Rule], dict],
+        field_converters: dict[str, Callable] | None = None,
+        window: int = 1,
+    ):
         super().__init__()
-        self.widget_map = {}
-        self.form_factories = []
-
-    def remove_all(self):
-        while self.count() > 0:
-            if len(self.form_factories) > 0:
-                del self.form_factories[0]
-            widget = self.widget(0)
-            self.removeWidget(widget)
-            widget.deleteLater()
-        self.widget_map.clear()
-        self.form_factories.clear()
-
-    def add_form(self, adapter):
-        """Add a widget to the stacked widget and map its name."""
-
-        self.addWidget(adapter.widget)
-
-        index = self.indexOf(adapter.widget)
-        self.widget_map[adapter.guid] = index
-        self.form_factories.append(adapter)
-
-    def get_form_by_index(self, index):
-        if not isinstance(index, int):
+        self.build_form = build_form
+        self.to_dict = to_dict
+        self.field_converters = field_converters or {}
+        self.window = window
+
+        self.rules: list[Rule] = []
+        self.index_by_guid: dict[str, int] = {}
+        self.forms: dict[str, RuleAdapter] = {}
+        self.form_values: dict[str, dict] = {}
+        self.form_errors: dict[str, list[SchemaError]] = {}
+        self.current_rule = -1
+
+    def set_rules(self, rules: list[Rule], current_guid: str | None = None) -> None:
+        """
+        Replaces the rules shown by the widget and shows `current_guid`, or the
+        first rule when it is not in the new list.
+        """
+        self.remove_all()
+        self.rules = list(rules)
+        self.index_by_guid = {rule.guid: index for index, rule in enumerate(rules)}
+        if self.rules:
+            self.show_rule(self.index_by_guid.get(current_guid, 0))
+
+    def apply_changes(
+        self,
+        added: list[Rule],
+        updated: list[Rule],
+        removed: list[str],
+        order: list[str],
+        current_guid: str | None = None,
+    ) -> None:
+        """
+        Patches the rule list in place. Only removed and updated rules that
+        have a built form cost widget work, plus whatever the window around
+        the current rule needs afterwards.
+        """
+        current_guid = current_guid or self.current_guid()
+        rules_by_guid = {rule.guid: rule for rule in self.rules}
+
+        for guid in removed:
+            if guid in self.forms:
+                self._tear_down_form(guid, keep_values=False)
+            rules_by_guid.pop(guid, None)
+            self.form_values.pop(guid, None)
+            self.form_errors.pop(guid, None)
+
+        for rule in updated:
+            if rule.guid in self.forms:
+                self._tear_down_form(rule.guid, keep_values=False)
+            self.form_values.pop(rule.guid, None)
+            self.form_errors.pop(rule.guid, None)
+            rules_by_guid[rule.guid] = rule
+
+        for rule in added:
+            rules_by_guid[rule.guid] = rule
+
+        self.rules = [rules_by_guid[guid] for guid in order if guid in rules_by_guid]
+        self.index_by_guid = {rule.guid: index for index, rule in enumerate(self.rules)}
+
+        if not self.rules:
+            self.current_rule = -1
             return
-        if index >= 0 and index <= self.count():
-            return self.form_factories[index]
 
-    def remove_form_by_index(self, index):
-        if not isinstance(index, int):
+        index = self.index_by_guid.get(current_guid)
+        if index is None:
+            index = min(max(self.current_rule, 0), len(self.rules) - 1)
+        self.show_rule(index)
+
+    def remove_all(self) -> None:
+        for guid in list(self.forms):
+            self._tear_down_form(guid, keep_values=False)
+        self.rules.clear()
+        self.index_by_guid.clear()
+        self.form_values.clear()
+        self.form_errors.clear()
+        self.current_rule = -1
+
+    def rule_count(self) -> int:
+        return len(self.rules)
+
+    def current_rule_index(self) -> int:
+        return self.current_rule
+
+    def current_guid(self) -> str | None:
+        return self.guid_at(self.current_rule)
+
+    def guid_at(self, index: int) -> str | None:
+        if 0 <= index < len(self.rules):
+            return self.rules[index].guid
+
+    def has_rule(self, guid: str) -> bool:
+        return guid in self.index_by_guid
+
+    def show_rule(self, index: int) -> None:
+        """
+        Shows the rule at `index`, building the forms in the window around it
+        and tearing down the ones that fell out of it.
+        """
+        if not self.rules:
             return
-        if index >= 0 and index <= self.count():
-            widget = self.widget(index)
-            self.removeWidget(widget)
-            widget.deleteLater()
-            del self.form_factories[index]
+        index = max(0, min(index, len(self.rules) - 1))
+        first = max(0, index - self.window)
+        last = min(len(self.rules) - 1, index + self.window)
+        in_window = {rule.guid for rule in self.rules[first : last + 1]}
+
+        for guid in [guid for guid in self.forms if guid not in in_window]:
+            self._tear_down_form(guid)
+        for rule in self.rules[first : last + 1]:
+            if rule.guid not in self.forms:
+                self._build_form(rule)
+
+        self.current_rule = index
+        self.setCurrentWidget(self.forms[self.rules[index].guid].widget)
+
+    def get_form_by_guid(self, guid: str) -> RuleAdapter | None:
+        return self.forms.get(guid)
 
     def get_form_factories(self) -> list[RuleAdapter]:
-        return self.form_factories
+        """Returns the built forms in rule order."""
+        return [self.forms[rule.guid] for rule in self.rules if rule.guid in self.forms]
+
+    def to_validation_dicts(self) -> list[dict]:
+        rule_dicts = []
+        for rule in self.rules:
+            form = self.forms.get(rule.guid)
+            if form:
+                rule_dicts.append(form.to_validation_dict())
+            elif rule.guid in self.form_values:
+                rule_dicts.append(self.form_values[rule.guid])
+            else:
+                rule_dicts.append(self.to_dict(rule))
+        return rule_dicts
+
+    def set_field_value(
+        self, field_path: str, value: str, skip_guid: str | None = None
+    ) -> None:
+        """
+        Sets a field on every rule that has it. Built forms are updated in
+        place; for the others the converted value is stored and applied when
+        the form is built.
+        """
+        for rule in self.rules:
+            if rule.guid == skip_guid:
+                continue
+            form = self.forms.get(rule.guid)
+            if form:
+                form.field_registry.set_value(field_path, value)
+                continue
+
+            values = self.form_values.get(rule.guid) or self.to_dict(rule)
+            if self._set_path(values, field_path, value):
+                self.form_values[rule.guid] = values
+
+    def set_errors(self, errors_by_guid: dict[str, list[SchemaError]]) -> None:
+        for guid, errors in errors_by_guid.items():
+            if guid not in self.index_by_guid:
+                continue
+            self.form_errors[guid] = errors
+            form = self.forms.get(guid)
+            if form:
+                form.highlight_errors(errors)
+
+    def _build_form(self, rule: Rule) -> None:
+        form = self.build_form(rule)
+        values = self.form_values.get(rule.guid)
+        if values:
+            for field_path, value in self._flatten(values):
+                form.field_registry.set_value(field_path, value)
+        if rule.guid in self.form_errors:
+            form.highlight_errors(self.form_errors[rule.guid])
+        self.addWidget(form.widget)
+        self.forms[rule.guid] = form
 
-    def get_widget_map(self):
-        return self.widget_map
+    def _tear_down_form(self, guid: str, keep_values: bool = True) -> None:
+        form = self.forms.pop(guid)
+        if keep_values:
+            values = form.to_validation_dict()
+            rule = self.rules[self.index_by_guid[guid]]
+            if values != self.to_dict(rule):
+                self.form_values[guid] = values
+            else:
+                self.form_values.pop(guid, None)
+        self.removeWidget(form.widget)
+        form.widget.deleteLater()
 
-    def get_widget_index_by_guid(self, guid: str) -> int:
-        return self.widget_map.get(guid, -1)
+    def _set_path(self, values: dict, field_path: str, value: str) -> bool:
+        *parents, leaf = field_path.split(".")
+        current = values
+        for token in parents:
+            try:
+                current = current[int(token) if token.isdigit() else token]
+            except (KeyError, IndexError, TypeError):
+                return False
+        if not isinstance(current, dict) or leaf not in current:
+            return False
+        converter = self.field_converters.get(leaf)
+        current[leaf] = converter(value) if converter else value
+        return True
 
-    def get_form_by_guid(self, guid: str) -> RuleAdapter:
-        index = self.get_widget_index_by_guid(guid)
-        if index > -1:
-            return self.get_form_by_index(index)
+    def _flatten(self, values, prefix: str = ""):
+        """Yields (field_path, text) pairs for every leaf of a validation dict."""
+        if isinstance(values, dict):
+            items = values.items()
+        else:
+            items = enumerate(values)
+        for key, value in items:
+            path = f"{prefix}{key}"
+            if isinstance(value, dict) or (
+                isinstance(value, list) and value and isinstance(value[0], dict)
+            ):
+                yield from self._flatten(value, f"{path}.")
+            elif isinstance(value, list):
+                yield path, ",".join(str(item) for item in value)
+            elif value is not None:
+                yield path, str(value)
@@ -0,0 +1,4 @@
+from .monitor_filter_bar import MonitorFilterBar
+from .monitor_filter_proxy_model import MonitorFilterProxyModel
+
+__all__ = ["MonitorFilterBar", "MonitorFilterProxyModel"]
@@ -0,0 +1,3 @@
+from .monitor_filter_bar import MonitorFilterBar
+
+__all__ = ["MonitorFilterBar"]
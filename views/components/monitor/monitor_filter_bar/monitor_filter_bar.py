@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from enum import StrEnum
+
+    from ..monitor_filter_proxy_model import MonitorFilterProxyModel
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QSpinBox,
+    QWidget,
+)
+
+from services.monitor.enums import SUMMARYBUCKET
+
+
+class MonitorFilterBar(QWidget):
+    """
+    Status, task, retry and name filter controls for a runner monitor table.
+    Every change is pushed straight to the MonitorFilterProxyModel.
+    """
+
+    def __init__(
+        self,
+        proxy_model: MonitorFilterProxyModel,
+        status_filters: dict[str, Iterable[StrEnum] | None],
+        tasks: Iterable[StrEnum],
+        search_placeholder: str = "Search by name",
+        parent: QWidget | None = None,
+    ):
+        super().__init__(parent)
+        self.proxy_model = proxy_model
+        self.status_filters = status_filters
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        self.status_combo = QComboBox()
+        self.status_combo.addItems(list(status_filters))
+        self.task_combo = QComboBox()
+        self.task_combo.addItem("All Tasks", None)
+        for task in tasks:
+            self.task_combo.addItem(task.name.replace("_", " ").title(), task)
+        self.retry_spin = QSpinBox()
+        self.retry_spin.setRange(0, 99)
+        self.retry_spin.setSpecialValueText("Any")
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText(search_placeholder)
+        self.search_input.setClearButtonEnabled(True)
+        self.count_label = QLabel()
+        self.count_label.setObjectName("filter-count")
+
+        layout.addWidget(QLabel("Status:"))
+        layout.addWidget(self.status_combo)
+        layout.addWidget(QLabel("Task:"))
+        layout.addWidget(self.task_combo)
+        layout.addWidget(QLabel("Min Retries:"))
+        layout.addWidget(self.retry_spin)
+        layout.addWidget(self.search_input, 1)
+        layout.addWidget(self.count_label, alignment=Qt.AlignRight)
+
+        self.status_combo.currentTextChanged.connect(self.on_status_changed)
+        self.task_combo.currentIndexChanged.connect(
+            lambda _: self.proxy_model.set_task(self.task_combo.currentData())
+        )
+        self.retry_spin.valueChanged.connect(self.proxy_model.set_min_retries)
+        self.search_input.textChanged.connect(self.proxy_model.set_search_text)
+
+        # The proxy drops its rows before the source model does, so the
+        # source signals are needed for an up to date total.
+        source_model = self.proxy_model.sourceModel()
+        for model in (self.proxy_model, source_model):
+            model.rowsInserted.connect(self.update_count)
+            model.rowsRemoved.connect(self.update_count)
+            model.modelReset.connect(self.update_count)
+        self.proxy_model.layoutChanged.connect(self.update_count)
+        self.update_count()
+
+    @staticmethod
+    def build_status_filters(
+        buckets: dict[StrEnum, SUMMARYBUCKET], *status_enums: type[StrEnum]
+    ) -> dict[str, list[StrEnum] | None]:
+        """
+        Builds the status combo entries from a store's summary bucket map.
+        Statuses without a bucket (running, in progress...) are grouped as
+        "Running".
+        """
+        bucketed = {status.value for status in buckets}
+        running = [
+            status
+            for status_enum in status_enums
+            for status in status_enum
+            if status.value not in bucketed
+        ]
+        status_filters: dict[str, list[StrEnum] | None] = {"All Statuses": None}
+        if running:
+            status_filters["Running"] = running
+        for bucket in SUMMARYBUCKET:
+            status_filters[bucket.value.title()] = [
+                status
+                for status, status_bucket in buckets.items()
+                if status_bucket == bucket
+            ]
+        return status_filters
+
+    def on_status_changed(self, label: str) -> None:
+        self.proxy_model.set_statuses(self.status_filters.get(label))
+
+    def update_count(self, *_) -> None:
+        total = self.proxy_model.sourceModel().rowCount()
+        shown = self.proxy_model.rowCount()
+        self.count_label.setText(
+            f"Showing {shown} of {total}" if shown != total else f"{total} rows"
+        )
+
+    def reset_filters(self) -> None:
+        self.status_combo.setCurrentIndex(0)
+        self.task_combo.setCurrentIndex(0)
+        self.retry_spin.setValue(0)
+        self.search_input.clear()
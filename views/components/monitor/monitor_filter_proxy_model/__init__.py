@@ -0,0 +1,3 @@
+from .monitor_filter_proxy_model import MonitorFilterProxyModel
+
+__all__ = ["MonitorFilterProxyModel"]
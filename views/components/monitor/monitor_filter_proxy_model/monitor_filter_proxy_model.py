@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from enum import StrEnum
+
+from PySide6.QtCore import QModelIndex, QSortFilterProxyModel
+
+
+class MonitorFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters a runner monitor table by status, task, retry count and name.
+
+    The source model is expected to expose its rows as `rule_rows` and the
+    row fields to search through SEARCH_FIELDS.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._statuses: frozenset[str] | None = None
+        self._task: str | None = None
+        self._min_retries = 0
+        self._search = ""
+        self.setDynamicSortFilter(True)
+
+    def set_statuses(self, statuses: Iterable[StrEnum | str] | None) -> None:
+        statuses = (
+            frozenset(getattr(status, "value", status) for status in statuses)
+            if statuses is not None
+            else None
+        )
+        if statuses == self._statuses:
+            return
+        self._statuses = statuses
+        self.invalidateFilter()
+
+    def set_task(self, task: StrEnum | str | None) -> None:
+        task = getattr(task, "value", task) or None
+        if task == self._task:
+            return
+        self._task = task
+        self.invalidateFilter()
+
+    def set_min_retries(self, min_retries: int) -> None:
+        if min_retries == self._min_retries:
+            return
+        self._min_retries = min_retries
+        self.invalidateFilter()
+
+    def set_search_text(self, text: str) -> None:
+        search = text.strip().casefold()
+        if search == self._search:
+            return
+        self._search = search
+        self.invalidateFilter()
+
+    def is_filtered(self) -> bool:
+        return bool(
+            self._statuses is not None
+            or self._task
+            or self._min_retries
+            or self._search
+        )
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self.is_filtered():
+            return True
+
+        model = self.sourceModel()
+        row = model.rule_rows[source_row]
+        if (
+            self._statuses is not None
+            and getattr(row.status, "value", row.status) not in self._statuses
+        ):
+            return False
+        if self._task and getattr(row.task, "value", row.task) != self._task:
+            return False
+        if row.retry_count < self._min_retries:
+            return False
+        if self._search:
+            return any(
+                self._search in str(getattr(row, field) or "").casefold()
+                for field in model.SEARCH_FIELDS
+            )
+        return True
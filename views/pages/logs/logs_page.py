@@ -20,6 +20,9 @@ class LogsPage(QWidgetBase):
         self.setStyleSheet(STYLES)
         # Initialize the UI for the LogsPage
         self.ui = LogsPageView()
+        if self.logger.log_console_max_lines:
+            self.ui.set_max_lines(int(self.logger.log_console_max_lines))
         self.layout.addWidget(self.ui)
         # Connect the logger's send_log signal to the UI's log display update method
         self.logger.send_log.connect(self.ui.update_log_display)
+        self.logger.console_max_lines_changed.connect(self.ui.set_max_lines)
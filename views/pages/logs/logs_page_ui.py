@@ -1,5 +1,17 @@
-from PySide6.QtWidgets import QTextEdit, QVBoxLayout, QWidget
+from collections import deque
 
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPlainTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
+
+from base.enums import LOGLEVEL
 from views.components.helpers import WidgetFactory
 from views.components.layouts import ScrollArea
 
@@ -10,19 +22,46 @@ class LogsPageView(QWidget):
     """
     A UI component that represents the Logs Page.
 
+    Log lines are kept in a ring buffer of at most `max_lines` lines and
+    appended to the display in batches on a timer, so a long chatty run
+    keeps memory flat and does not lay out the display once per line. The
+    level and text filters are applied over the buffer.
 
     Attributes:
-        log_display (QTextEdit): A text edit widget used to display log entries.
+        log_display (QPlainTextEdit): A text edit widget used to display log entries.
+        level_combo (QComboBox): Minimum level of the lines shown.
+        search_input (QLineEdit): Text the lines shown must contain.
     """
 
-    def __init__(self):
+    DEFAULT_MAX_LINES = 5000
+    FLUSH_INTERVAL_MS = 200
+
+    LEVEL_PRIORITY = {
+        LOGLEVEL.DEBUG: 10,
+        LOGLEVEL.INFO: 20,
+        LOGLEVEL.WARN: 30,
+        LOGLEVEL.ERROR: 40,
+    }
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES):
         super().__init__()
+        self.max_lines = max_lines
+        # (level priority, line) pairs, oldest first.
+        self._lines: deque[tuple[int, str]] = deque(maxlen=max_lines)
+        self._pending: list[tuple[int, str]] = []
+        self._min_priority = 0
+        self._search_text = ""
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush_pending)
+
         self.init_ui()
 
     def init_ui(self) -> None:
         """
-        Initializes the UI components of the log page, including the layout and
-        the text display for logs.
+        Initializes the UI components of the log page, including the layout,
+        the filter controls and the text display for logs.
 
         Returns:
             None: This function does not return a value.
@@ -43,9 +82,30 @@ class LogsPageView(QWidget):
             [(0.05, "#F2F3F2"), (0.50, "#DEDEDE"), (1, "#DEDEDE")],
             "#f58220",
         )
+
+        filter_bar = QWidget()
+        filter_layout = QHBoxLayout(filter_bar)
+        filter_layout.setContentsMargins(0, 0, 0, 0)
+        filter_layout.setSpacing(8)
+        self.level_combo = QComboBox()
+        self.level_combo.addItem("All Levels", 0)
+        for level, priority in self.LEVEL_PRIORITY.items():
+            self.level_combo.addItem(f"{level} and above", priority)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Filter logs")
+        self.search_input.setClearButtonEnabled(True)
+        self.count_label = QLabel()
+        filter_layout.addWidget(QLabel("Level:"))
+        filter_layout.addWidget(self.level_combo)
+        filter_layout.addWidget(self.search_input, 1)
+        filter_layout.addWidget(self.count_label, alignment=Qt.AlignRight)
+        inner_layout.addRow(filter_bar)
+
         # Text edit widget for displaying logs
-        self.log_display = QTextEdit()
-        self.log_display.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.log_display = QPlainTextEdit()
+        self.log_display.setReadOnly(True)
+        self.log_display.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.log_display.setMaximumBlockCount(self.max_lines)
         # Scroll area for the log display
         scroll_area = ScrollArea(self)
         scroll_area.setWidgetResizable(True)
@@ -54,14 +114,107 @@ class LogsPageView(QWidget):
         scroll_area.setStyleSheet(SCROLL_AREA_STYLES)
         inner_layout.addRow(scroll_area)
 
-    def update_log_display(self, log: str) -> None:
+        self.level_combo.currentIndexChanged.connect(self.on_level_changed)
+        self.search_input.textChanged.connect(self.on_search_changed)
+        self.update_count()
+
+    def update_log_display(self, logs: list[str]) -> None:
+        """
+        Queues a batch of log entries for the next batched append.
+
+        Args:
+            logs (list[str]): The log entries to be appended.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._pending.extend((self._line_priority(log), log) for log in logs)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_pending(self) -> None:
+        """
+        Moves the queued lines into the buffer and appends the ones that pass
+        the filters to the display in one insert.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._lines.extend(pending)
+        shown = [line for priority, line in pending if self._matches(priority, line)]
+        if shown:
+            scroll_bar = self.log_display.verticalScrollBar()
+            at_bottom = scroll_bar.value() == scroll_bar.maximum()
+            # The block count limit drops the oldest lines from the display.
+            self.log_display.appendPlainText("\n".join(shown[-self.max_lines :]))
+            if at_bottom:
+                scroll_bar.setValue(scroll_bar.maximum())
+        self.update_count()
+
+    def set_max_lines(self, max_lines: int) -> None:
         """
-        Appends a new log entry to the log display.
+        Changes how many lines the buffer and the display keep.
 
         Args:
-            log (str): The log entry to be appended.
+            max_lines (int): The new line limit.
 
         Returns:
             None: This function does not return a value.
         """
-        self.log_display.append(log)
+        if max_lines <= 0 or max_lines == self.max_lines:
+            return
+        self.max_lines = max_lines
+        self._lines = deque(self._lines, maxlen=max_lines)
+        self.log_display.setMaximumBlockCount(max_lines)
+        self.refilter()
+
+    def on_level_changed(self, _index: int) -> None:
+        self._min_priority = self.level_combo.currentData() or 0
+        self.refilter()
+
+    def on_search_changed(self, text: str) -> None:
+        self._search_text = text.strip().lower()
+        self.refilter()
+
+    def refilter(self) -> None:
+        """
+        Rebuilds the display from the buffer with the current filters.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.flush_pending()
+        self.log_display.setPlainText(
+            "\n".join(
+                line for priority, line in self._lines if self._matches(priority, line)
+            )
+        )
+        scroll_bar = self.log_display.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+        self.update_count()
+
+    def update_count(self) -> None:
+        total = len(self._lines)
+        if self._min_priority or self._search_text:
+            # The display only holds the lines that passed the filters.
+            document = self.log_display.document()
+            shown = document.blockCount() if not document.isEmpty() else 0
+            self.count_label.setText(f"Showing {shown} of {total}")
+        else:
+            self.count_label.setText(f"{total} lines")
+
+    def _matches(self, priority: int, line: str) -> bool:
+        if priority < self._min_priority:
+            return False
+        return not self._search_text or self._search_text in line.lower()
+
+    def _line_priority(self, log: str) -> int:
+        # Lines come from LogWorker as "<time> - <LEVEL> - <message>".
+        parts = log.split(" - ", 2)
+        if len(parts) < 3:
+            return 0
+        return self.LEVEL_PRIORITY.get(parts[1], 0)
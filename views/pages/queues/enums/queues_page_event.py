@@ -4,4 +4,5 @@ from enum import StrEnum
 class QUEUESPAGEEVENT(StrEnum):
     START_RUNNER = "start_runner"
     STOP_RUNNER = "stop_runner"
+    RESUME_RUNNER = "resume_runner"
     TOGGLE_DISPLAY_MONITOR = "toggle_display_monitor"
@@ -17,8 +17,11 @@ from PySide6.QtWidgets import (
 from services.monitor.rule_monitor.models import RuleRunRow
 from services.monitor.models import RunSummary
 from base.events import MonitorSnapShotEvent
+from services.monitor.queue_monitor import QUEUE_SUMMARY_BUCKETS
+from services.queue_runner.enums import QEXECUTORTASK, QUEUEEXECSTATUS, QUEUERUNSTATUS
 from ....components.dialogs import GradientDialog
 from ....components.helpers import WidgetFactory
+from ....components.monitor import MonitorFilterBar, MonitorFilterProxyModel
 from ....components.buttons import GradientButton
 from .monitor_table import MonitorTableModel
 from .queues_runner_monitor_styles import STYLES
@@ -47,7 +50,12 @@ class QueuesRunnerMonitor(GradientDialog):
         self.monitor_table_model = MonitorTableModel()
         self.table_view_w = QTableView()
         self.table_view_w.setFont(table_font)
-        self.table_view_w.setModel(self.monitor_table_model)
+        self.filter_proxy_model = MonitorFilterProxyModel(self)
+        self.filter_proxy_model.setSourceModel(self.monitor_table_model)
+        self.table_view_w.setModel(self.filter_proxy_model)
+        self.table_view_w.setSortingEnabled(True)
+        # Keep run order until a header is clicked.
+        self.table_view_w.sortByColumn(-1, Qt.AscendingOrder)
         # self.table_view_w.setSelectionBehavior(QTableView.SelectRows)
         self.table_view_w.show()
         self.setStyleSheet(STYLES)
@@ -136,6 +144,16 @@ class QueuesRunnerMonitor(GradientDialog):
         summary_layout.addWidget(self.pending_label)
 
         outter_layout.addRow(summary_layout)
+
+        self.filter_bar = MonitorFilterBar(
+            self.filter_proxy_model,
+            MonitorFilterBar.build_status_filters(
+                QUEUE_SUMMARY_BUCKETS, QUEUERUNSTATUS, QUEUEEXECSTATUS
+            ),
+            QEXECUTORTASK,
+            search_placeholder="Search by queue name or row",
+        )
+        outter_layout.addRow(self.filter_bar)
         # TABLE
         inner_layout.addRow(self.table_view_w)
         self.cancel_btn = QPushButton("Close")
@@ -168,8 +186,11 @@ class QueuesRunnerMonitor(GradientDialog):
     def handle_cancel_clicked(self):
         self.reject()
 
-    def handle_upsert_row(self, row: RuleRunRow):
-        self.monitor_table_model.upsert_row(row)
+    def handle_upsert_rows(self, rows: list[RuleRunRow]):
+        self.monitor_table_model.upsert_rows(rows)
+
+    def handle_remove_rows(self, guids: list[str]):
+        self.monitor_table_model.remove_rows(guids)
 
     def handle_summary_update(self, summary: RunSummary):
         self.total_label.setText(f"Total: {summary.total}")
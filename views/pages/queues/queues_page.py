@@ -15,12 +15,14 @@ from ...base.enums import MONITOREVENT
 from .enums.queues_page_event import QUEUESPAGEEVENT
 from .models.queues_page_action import QueuesPageAction
 from base.events import (
-    MonitorRowUpsertEvent,
+    MonitorRowsUpsertEvent,
+    MonitorRowsRemovedEvent,
     MonitorSummaryUpdateEvent,
     MonitorSnapShotEvent,
     UIEvent,
     QueueRunnerStateEvent,
     ProgressStatus,
+    ValidationProgressEvent,
 )
 from .queues_monitor.queues_runner_monitor import QueuesRunnerMonitor
 
@@ -30,9 +32,11 @@ class QueuesPage(QWidgetBase):
     Queues page that integrates the UI view with the logic for
     """
 
-    monitor_upsert_row = Signal(object)
+    monitor_upsert_rows = Signal(list)
+    monitor_remove_rows = Signal(list)
     monitor_summary_update = Signal(object)
     progress_bar_update = Signal(int, int)
+    validation_progress_update = Signal(int, int)
     queue_runner_state_update = Signal(object)
     monitor_snapshot_update = Signal(object)
 
@@ -54,10 +58,12 @@ class QueuesPage(QWidgetBase):
         # UI Page connections
         self.ui.queues_page_action.connect(self.handle_queue_page_action)
         self.progress_bar_update.connect(self.ui.set_progress_bar)
+        self.validation_progress_update.connect(self.ui.set_validation_progress)
         self.queue_runner_state_update.connect(self.ui.handle_queue_runner_state_update)
 
         # Monitor connections
-        self.monitor_upsert_row.connect(self.queue_runner_monitor.handle_upsert_row)
+        self.monitor_upsert_rows.connect(self.queue_runner_monitor.handle_upsert_rows)
+        self.monitor_remove_rows.connect(self.queue_runner_monitor.handle_remove_rows)
         self.monitor_summary_update.connect(
             self.queue_runner_monitor.handle_summary_update
         )
@@ -68,8 +74,10 @@ class QueuesPage(QWidgetBase):
 
     @Slot(object)
     def receive_ui_event(self, event: UIEvent):
-        if isinstance(event.payload, MonitorRowUpsertEvent):
-            self.monitor_upsert_row.emit(event.payload.row)
+        if isinstance(event.payload, MonitorRowsUpsertEvent):
+            self.monitor_upsert_rows.emit(event.payload.rows)
+        elif isinstance(event.payload, MonitorRowsRemovedEvent):
+            self.monitor_remove_rows.emit(event.payload.guids)
         elif isinstance(event.payload, MonitorSummaryUpdateEvent):
 
             self.monitor_summary_update.emit(event.payload.summary)
@@ -81,6 +89,10 @@ class QueuesPage(QWidgetBase):
             self.progress_bar_update.emit(
                 event.payload.current_value, event.payload.total
             )
+        elif isinstance(event.payload, ValidationProgressEvent):
+            self.validation_progress_update.emit(
+                event.payload.validated, event.payload.total
+            )
 
     def handle_monitor_actions(self, action: MONITOREVENT):
         if action == MONITOREVENT.MONITOR_CLEAR_ALL:
@@ -94,6 +106,7 @@ class QueuesPage(QWidgetBase):
         action_handlers = {
             QUEUESPAGEEVENT.START_RUNNER: self._handle_queue_runner_run,
             QUEUESPAGEEVENT.STOP_RUNNER: self._handle_rule_runner_stop,
+            QUEUESPAGEEVENT.RESUME_RUNNER: self._handle_queue_runner_resume,
             QUEUESPAGEEVENT.TOGGLE_DISPLAY_MONITOR: self._handle_display_monitor,
         }
 
@@ -114,6 +127,9 @@ class QueuesPage(QWidgetBase):
         )
         self.controllers.queues.handle_stop_runner()
 
+    def _handle_queue_runner_resume(self, _) -> None:
+        self.controllers.queues.resume_last_run()
+
     def _handle_display_monitor(self, _) -> None:
         if self.queue_runner_monitor and self.queue_runner_monitor.isVisible():
             self.queue_runner_monitor.close()
@@ -144,6 +144,15 @@ class QueuesPageView(QWidget):
             3,
         )
 
+        self.resume_button = GradientButton(
+            "Resume",
+            "black",
+            [(0.05, "#FEB220"), (0.50, "#f58220"), (1, "#f58220")],
+            "#f58220",
+            1,
+            3,
+        )
+
         self.monitor_button = GradientButton(
             "",
             "black",
@@ -192,6 +201,7 @@ class QueuesPageView(QWidget):
             "page_action", QUEUESPAGEEVENT.TOGGLE_DISPLAY_MONITOR
         )
         self.stop_button.setProperty("page_action", QUEUESPAGEEVENT.STOP_RUNNER)
+        self.resume_button.setProperty("page_action", QUEUESPAGEEVENT.RESUME_RUNNER)
         self.stop_button.setHidden(True)
         self.monitor_button.setProperty(
             "page_action", QUEUESPAGEEVENT.TOGGLE_DISPLAY_MONITOR
@@ -199,6 +209,7 @@ class QueuesPageView(QWidget):
         thread_layout = QHBoxLayout()
         thread_layout.addWidget(self.monitor_button)
         thread_layout.addWidget(self.run_button)
+        thread_layout.addWidget(self.resume_button)
         thread_layout.addWidget(self.stop_button)
 
         self.settings_grid_layout.addLayout(thread_layout, 3, 1)
@@ -208,6 +219,7 @@ class QueuesPageView(QWidget):
         self.run_button.clicked.connect(self.handle_action_button_click)
         self.stop_button.clicked.connect(self.handle_action_button_click)
         self.monitor_button.clicked.connect(self.handle_action_button_click)
+        self.resume_button.clicked.connect(self.handle_action_button_click)
 
     def handle_action_button_click(self):
         sender = self.sender()
@@ -227,7 +239,7 @@ class QueuesPageView(QWidget):
     def _build_action_payload(self, action: QUEUESPAGEEVENT):
         if action == QUEUESPAGEEVENT.START_RUNNER:
             return QueuesPageAction[dict[str, str]](action, self._get_form_inputs())
-        elif action == QUEUESPAGEEVENT.STOP_RUNNER:
+        elif action in (QUEUESPAGEEVENT.STOP_RUNNER, QUEUESPAGEEVENT.RESUME_RUNNER):
             return QueuesPageAction(action, None)
         elif action == QUEUESPAGEEVENT.TOGGLE_DISPLAY_MONITOR:
             return QueuesPageAction(action, None)
@@ -250,9 +262,9 @@ class QueuesPageView(QWidget):
 
         file_name, _ = QFileDialog.getOpenFileName(
             self,
-            "Open Queues Excel File",
+            "Open Queues File",
             "./",
-            "Excel Files (*.xlsx *.xls)",
+            "Queue Files (*.xlsx *.xls *.csv *.tsv);;Excel Files (*.xlsx *.xls);;CSV Files (*.csv *.tsv)",
         )
 
         self.file_loc_line_edit_field.blockSignals(True)
@@ -266,9 +278,11 @@ class QueuesPageView(QWidget):
             self.progress_bar.setHidden(False)
             self.progress_bar.setValue(0)
             self.run_button.setDisabled(True)
+            self.resume_button.setDisabled(True)
         if state == QUEUERUNNERLIFECYCLE.FINISHED:
             self.stop_button.setHidden(True)
             self.run_button.setDisabled(False)
+            self.resume_button.setDisabled(False)
             QTimer.singleShot(5000, lambda: self.progress_bar.setHidden(True))
 
     @Slot(int, int)
@@ -279,3 +293,15 @@ class QueuesPageView(QWidget):
         self.progress_bar.setHidden(False)
         self.progress_bar.setRange(0, total)
         self.progress_bar.setValue(current)
+
+    @Slot(int, int)
+    def set_validation_progress(self, validated: int, total: int) -> None:
+        """
+        Shows validation progress on the progress bar. Once validation is
+        done the bar is hidden again unless a runner has started using it.
+        """
+        self.set_progress_bar(validated, total)
+        if validated >= total:
+            QTimer.singleShot(
+                5000, lambda: self.progress_bar.setHidden(self.run_button.isEnabled())
+            )
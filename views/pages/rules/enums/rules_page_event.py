@@ -12,4 +12,5 @@ class RULESPAGEEVENT(StrEnum):
     COPY_RULE_FIELD = "copy_rule_field"
     START_RUNNER = "start_runner"
     STOP_RUNNER = "stop_runner"
+    RESUME_RUNNER = "resume_runner"
     TOGGLE_DISPLAY_MONITOR = "toggle_display_monitor"
@@ -4,8 +4,12 @@ from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from dataclasses import fields
 from datetime import datetime
 
+from ....components.helpers import RowRanges
+
 
 class MonitorTableModel(QAbstractTableModel):
+    MAX_SIGNAL_RANGES = 32
+    SEARCH_FIELDS = ("rule_name",)
 
     def __init__(self, rows: list[RuleRunRow] | None = None):
         super().__init__()
@@ -21,15 +25,12 @@ class MonitorTableModel(QAbstractTableModel):
         return len(self.rule_rows)
 
     def columnCount(self, parent=None):
-        return len(fields(RuleRunRow))
+        # emitted_at is an ordering stamp, not a display column.
+        return len(fields(RuleRunRow)) - 1
 
     def remove_selected(self, selected):
-        indexes = [i.row() for i in selected]
-        indexSet = set(indexes)
-        filtered_list = [
-            row for index, row in enumerate(self.rule_rows) if index not in indexSet
-        ]
-        self.update_data(filtered_list)
+        guids = [self.rule_rows[index.row()].rule_guid for index in selected]
+        self.remove_rows(guids)
 
     def clear_model(self):
         self.update_data([])
@@ -43,24 +44,73 @@ class MonitorTableModel(QAbstractTableModel):
 
         self.endResetModel()
 
-    def upsert_row(self, rule_row: RuleRunRow) -> None:
-        existing_index = self.row_by_guid.get(rule_row.rule_guid)
+    def upsert_rows(self, rule_rows: list[RuleRunRow]) -> None:
+        """
+        Applies a batch of row updates. Updated rows are grouped into
+        contiguous runs with one dataChanged each, falling back to a single
+        spanning range when the updates are scattered. New rows are appended
+        with a single insert.
+        """
+        changed: list[int] = []
+        new_rows: dict[str, RuleRunRow] = {}
+        for rule_row in rule_rows:
+            existing_index = self.row_by_guid.get(rule_row.rule_guid)
+            if existing_index is None:
+                new_rows[rule_row.rule_guid] = rule_row
+                continue
 
-        if existing_index is not None:
             self.rule_rows[existing_index] = rule_row
+            changed.append(existing_index)
+
+        last_column = self.columnCount() - 1
+        changed_ranges = RowRanges.contiguous(changed)
+        if len(changed_ranges) > self.MAX_SIGNAL_RANGES:
+            # Scattered updates: one spanning range is cheaper than a signal
+            # per run, the view only repaints what is visible.
+            changed_ranges = [(changed_ranges[0][0], changed_ranges[-1][1])]
+        for first, last in changed_ranges:
+            self.dataChanged.emit(
+                self.index(first, 0), self.index(last, last_column), [Qt.DisplayRole]
+            )
+
+        if not new_rows:
+            return
 
-            top_left = self.index(existing_index, 0)
-            bottom_right = self.index(existing_index, self.columnCount() - 1)
+        first_new = len(self.rule_rows)
+        self.beginInsertRows(QModelIndex(), first_new, first_new + len(new_rows) - 1)
+        for row_index, rule_row in enumerate(new_rows.values(), start=first_new):
+            self.rule_rows.append(rule_row)
+            self.row_by_guid[rule_row.rule_guid] = row_index
+        self.endInsertRows()
 
-            self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole])
+    def remove_rows(self, guids: list[str]) -> None:
+        """
+        Removes rows by guid, one beginRemoveRows per contiguous run, working
+        from the bottom up so earlier runs keep their indices. Only the rows
+        below the first removed row are re-indexed. Widely scattered
+        removals reset the model instead.
+        """
+        indices = [self.row_by_guid[guid] for guid in guids if guid in self.row_by_guid]
+        ranges = RowRanges.contiguous(indices)
+        if not ranges:
+            return
+        if len(ranges) > self.MAX_SIGNAL_RANGES:
+            removed = set(guids)
+            self.update_data(
+                [row for row in self.rule_rows if row.rule_guid not in removed]
+            )
             return
 
-        row_index = len(self.rule_rows)
+        for first, last in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for rule_row in self.rule_rows[first : last + 1]:
+                del self.row_by_guid[rule_row.rule_guid]
+            del self.rule_rows[first : last + 1]
+            self.endRemoveRows()
 
-        self.beginInsertRows(QModelIndex(), row_index, row_index)
-        self.rule_rows.append(rule_row)
-        self.row_by_guid[rule_row.rule_guid] = row_index
-        self.endInsertRows()
+        first_removed = ranges[0][0]
+        for row_index in range(first_removed, len(self.rule_rows)):
+            self.row_by_guid[self.rule_rows[row_index].rule_guid] = row_index
 
     def add_row(self, rule_row: RuleRunRow):
         row_index = self.rowCount()
@@ -15,12 +15,16 @@ from PySide6.QtWidgets import (
 )
 
 from services.monitor.rule_monitor.models import RuleRunRow
-from services.monitor.models import RunSummary
+from services.monitor.models import RunSummary, TaskTimingSummary
 from base.events import MonitorSnapShotEvent
+from services.monitor.rule_monitor import RULE_SUMMARY_BUCKETS
+from services.rule_runner.enums import EXECUTORTASK, RULEEXECSTATUS, RULERUNSTATUS
 from ....components.dialogs import GradientDialog
 from ....components.helpers import WidgetFactory
+from ....components.monitor import MonitorFilterBar, MonitorFilterProxyModel
 from ....components.buttons import GradientButton
 from .monitor_table import MonitorTableModel
+from .slowest_steps_table import SlowestStepsTableModel
 from .rule_runner_monitor_styles import STYLES
 from ....base.enums.monitor_event import MONITOREVENT
 
@@ -47,9 +51,19 @@ class RuleRunnerMonitor(GradientDialog):
         self.monitor_table_model = MonitorTableModel()
         self.table_view_w = QTableView()
         self.table_view_w.setFont(table_font)
-        self.table_view_w.setModel(self.monitor_table_model)
+        self.filter_proxy_model = MonitorFilterProxyModel(self)
+        self.filter_proxy_model.setSourceModel(self.monitor_table_model)
+        self.table_view_w.setModel(self.filter_proxy_model)
+        self.table_view_w.setSortingEnabled(True)
+        # Keep run order until a header is clicked.
+        self.table_view_w.sortByColumn(-1, Qt.AscendingOrder)
         # self.table_view_w.setSelectionBehavior(QTableView.SelectRows)
         self.table_view_w.show()
+        self.slowest_steps_model = SlowestStepsTableModel()
+        self.slowest_steps_view = QTableView()
+        self.slowest_steps_view.setModel(self.slowest_steps_model)
+        self.slowest_steps_view.setMaximumHeight(200)
+        self.slowest_steps_view.horizontalHeader().setStretchLastSection(True)
         self.setStyleSheet(STYLES)
 
         self.setAttribute(Qt.WA_StyledBackground, True)
@@ -136,8 +150,22 @@ class RuleRunnerMonitor(GradientDialog):
         summary_layout.addWidget(self.pending_label)
 
         outter_layout.addRow(summary_layout)
+
+        self.filter_bar = MonitorFilterBar(
+            self.filter_proxy_model,
+            MonitorFilterBar.build_status_filters(
+                RULE_SUMMARY_BUCKETS, RULERUNSTATUS, RULEEXECSTATUS
+            ),
+            EXECUTORTASK,
+            search_placeholder="Search by rule name",
+        )
+        outter_layout.addRow(self.filter_bar)
         # TABLE
         inner_layout.addRow(self.table_view_w)
+        self.slowest_steps_label = QLabel("Slowest Steps (last run)")
+        self.slowest_steps_label.setObjectName("slowest-steps-title")
+        inner_layout.addRow(self.slowest_steps_label)
+        inner_layout.addRow(self.slowest_steps_view)
         self.cancel_btn = QPushButton("Close")
         self.cancel_btn.setObjectName("cancel-btn")
         self.cancel_btn.setMinimumWidth(250)
@@ -168,8 +196,14 @@ class RuleRunnerMonitor(GradientDialog):
     def handle_cancel_clicked(self):
         self.reject()
 
-    def handle_upsert_row(self, row: RuleRunRow):
-        self.monitor_table_model.upsert_row(row)
+    def handle_upsert_rows(self, rows: list[RuleRunRow]):
+        self.monitor_table_model.upsert_rows(rows)
+
+    def handle_remove_rows(self, guids: list[str]):
+        self.monitor_table_model.remove_rows(guids)
+
+    def handle_step_timings(self, summaries: list[TaskTimingSummary]):
+        self.slowest_steps_model.update_data(summaries)
 
     def handle_summary_update(self, summary: RunSummary):
         self.total_label.setText(f"Total: {summary.total}")
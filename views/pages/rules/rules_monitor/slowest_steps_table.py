@@ -0,0 +1,53 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from services.monitor.models import TaskTimingSummary
+
+
+class SlowestStepsTableModel(QAbstractTableModel):
+    HEADERS = ["Step", "Runs", "p50 (s)", "p95 (s)", "Max (s)", "Total (s)"]
+
+    def __init__(self, summaries: list[TaskTimingSummary] | None = None):
+        super().__init__()
+        self.summaries: list[TaskTimingSummary] = (
+            summaries if summaries is not None else []
+        )
+
+    def rowCount(self, parent=None):
+        return len(self.summaries)
+
+    def columnCount(self, parent=None):
+        return len(self.HEADERS)
+
+    def update_data(self, summaries: list[TaskTimingSummary]):
+        self.beginResetModel()
+        self.summaries = summaries
+        self.endResetModel()
+
+    def headerData(self, section, orientation, role):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        summary = self.summaries[index.row()]
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return summary.task_key
+            elif index.column() == 1:
+                return summary.count
+            elif index.column() == 2:
+                return f"{summary.p50_ms / 1000:.2f}"
+            elif index.column() == 3:
+                return f"{summary.p95_ms / 1000:.2f}"
+            elif index.column() == 4:
+                return f"{summary.max_ms / 1000:.2f}"
+            elif index.column() == 5:
+                return f"{summary.total_ms / 1000:.2f}"
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
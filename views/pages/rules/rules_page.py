@@ -12,11 +12,14 @@ from PySide6.QtWidgets import QFileDialog
 
 from base import QWidgetBase
 from base.events import (
-    MonitorRowUpsertEvent,
+    MonitorRowsUpsertEvent,
+    MonitorRowsRemovedEvent,
     MonitorSummaryUpdateEvent,
     RulesLoadedEvent,
     RuleRunnerStateEvent,
     MonitorSnapShotEvent,
+    StepTimingsUpdateEvent,
+    ValidationProgressEvent,
 )
 from controllers.rules.enums import VALIDATIONBATCHTYPE
 from views.components.toasts.qtoast.enums import QTOASTSTATUS
@@ -37,13 +40,16 @@ class RulesPage(QWidgetBase):
     through the connected view and model components.
     """
 
-    send_rules = Signal(list)
+    send_rules = Signal(object)
     display_validation_result = Signal(object)
-    monitor_upsert_row = Signal(object)
+    monitor_upsert_rows = Signal(list)
+    monitor_remove_rows = Signal(list)
     monitor_summary_update = Signal(object)
     progress_bar_update = Signal(int, int)
+    validation_progress_update = Signal(int, int)
     rule_runner_state_update = Signal(object)
     monitor_snapshot_update = Signal(object)
+    monitor_step_timings_update = Signal(list)
 
     def __init__(self, controllers: RulesPageControllers):
         """
@@ -76,17 +82,22 @@ class RulesPage(QWidgetBase):
         # UI Page connections
         self.ui.rules_page_action.connect(self.handle_rule_page_action)
         self.progress_bar_update.connect(self.ui.set_progress_bar)
-        self.send_rules.connect(self.ui.rules_changed)
+        self.validation_progress_update.connect(self.ui.set_validation_progress)
+        self.send_rules.connect(self.ui.apply_rules_event)
         self.rule_runner_state_update.connect(self.ui.handle_rule_runner_state_update)
 
         # Monitor connections
-        self.monitor_upsert_row.connect(self.rule_runner_monitor.handle_upsert_row)
+        self.monitor_upsert_rows.connect(self.rule_runner_monitor.handle_upsert_rows)
+        self.monitor_remove_rows.connect(self.rule_runner_monitor.handle_remove_rows)
         self.monitor_summary_update.connect(
             self.rule_runner_monitor.handle_summary_update
         )
         self.monitor_snapshot_update.connect(
             self.rule_runner_monitor.update_from_snapshot
         )
+        self.monitor_step_timings_update.connect(
+            self.rule_runner_monitor.handle_step_timings
+        )
         self.rule_runner_monitor.monitor_action.connect(self.handle_monitor_actions)
 
         self.check_for_saved_rules()
@@ -102,9 +113,11 @@ class RulesPage(QWidgetBase):
     @Slot(object)
     def receive_ui_event(self, event: UIEvent):
         if isinstance(event.payload, RulesLoadedEvent):
-            self.ui.rules_changed(event.payload.rules)
-        elif isinstance(event.payload, MonitorRowUpsertEvent):
-            self.monitor_upsert_row.emit(event.payload.row)
+            self.send_rules.emit(event.payload)
+        elif isinstance(event.payload, MonitorRowsUpsertEvent):
+            self.monitor_upsert_rows.emit(event.payload.rows)
+        elif isinstance(event.payload, MonitorRowsRemovedEvent):
+            self.monitor_remove_rows.emit(event.payload.guids)
         elif isinstance(event.payload, MonitorSummaryUpdateEvent):
             self.progress_bar_update.emit(
                 event.payload.summary.completed, event.payload.summary.total
@@ -112,8 +125,14 @@ class RulesPage(QWidgetBase):
             self.monitor_summary_update.emit(event.payload.summary)
         elif isinstance(event.payload, MonitorSnapShotEvent):
             self.monitor_snapshot_update.emit(event.payload)
+        elif isinstance(event.payload, StepTimingsUpdateEvent):
+            self.monitor_step_timings_update.emit(event.payload.summaries)
         elif isinstance(event.payload, RuleRunnerStateEvent):
             self.rule_runner_state_update.emit(event.payload.state)
+        elif isinstance(event.payload, ValidationProgressEvent):
+            self.validation_progress_update.emit(
+                event.payload.validated, event.payload.total
+            )
 
     def handle_monitor_actions(self, action: MONITOREVENT):
         if action == MONITOREVENT.MONITOR_CLEAR_ALL:
@@ -137,6 +156,7 @@ class RulesPage(QWidgetBase):
             RULESPAGEEVENT.CLONE_RULE: self._handle_clone_rule,
             RULESPAGEEVENT.BOOKMARK_RULES: self._handle_bookmark_rules,
             RULESPAGEEVENT.STOP_RUNNER: self._handle_rule_runner_stop,
+            RULESPAGEEVENT.RESUME_RUNNER: self._handle_rule_runner_resume,
             RULESPAGEEVENT.TOGGLE_DISPLAY_MONITOR: self._handle_display_monitor,
         }
 
@@ -157,6 +177,9 @@ class RulesPage(QWidgetBase):
         )
         self.controllers.rules.handle_stop_runner()
 
+    def _handle_rule_runner_resume(self, _) -> None:
+        self.controllers.rules.resume_last_run()
+
     def _handle_display_monitor(self, _) -> None:
         if self.rule_runner_monitor and self.rule_runner_monitor.isVisible():
             self.rule_runner_monitor.close()
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from base.events import RulesLoadedEvent
     from controllers.rules.models import ValidationRulesResult
     from services.rules.models import Rule
     from ...components.rules import RuleAdapter
@@ -28,6 +29,8 @@ from views.components.layouts import ScrollArea, StackedFormWidget
 from ...components.dialogs import RuleSetDialog, SchemaErrorDialog
 from ...components.rules import RuleEventFilter
 from ...components.rules.adapters import RuleAdapterFactory
+from ...components.rules.adapters.field_converters import FIELD_CONVERTERS
+from services.rules import RuleSerializer
 from services.rule_runner.enums.rule_runner_lifecycle import RULERUNNERLIFECYCLE
 from .enums.rules_page_event import RULESPAGEEVENT
 from .models import RulesPageAction
@@ -168,7 +171,11 @@ class RulesPageView(QWidget):
         form_actions_btn_layout.addItem(v_spacer)
 
         # Editor - Rules
-        self.stacked_widget = StackedFormWidget()
+        self.stacked_widget = StackedFormWidget(
+            RuleAdapterFactory(self.event_filter).build,
+            RuleSerializer().to_schema_dict,
+            FIELD_CONVERTERS,
+        )
         self.stacked_widget.setObjectName("Rules-Stacked-Widget")
         self.stacked_widget.setContentsMargins(0, 0, 15, 10)
 
@@ -206,6 +213,7 @@ class RulesPageView(QWidget):
         self.start.clicked.connect(self.handle_action_button_click)
         self.stop.clicked.connect(self.handle_action_button_click)
         self.monitor.clicked.connect(self.handle_action_button_click)
+        self.resume.clicked.connect(self.handle_action_button_click)
         self.rule_set_dialog.send_form.connect(self.handle_bookmark_rules)
         self.event_filter.event_changed.connect(self.focus_changed)
 
@@ -337,6 +345,14 @@ class RulesPageView(QWidget):
             1,
             3,
         )
+        self.resume = GradientButton(
+            "Resume",
+            "black",
+            [(0.05, "#FEB220"), (0.50, "#f58220"), (1, "#f58220")],
+            "#f58220",
+            1,
+            3,
+        )
         self.monitor = GradientButton(
             "",
             "black",
@@ -348,6 +364,7 @@ class RulesPageView(QWidget):
         StyleHelper.set_tool_tip(self.stop, "Stop Runner", "")
         StyleHelper.set_tool_tip(self.start, "Start Runner", "")
         StyleHelper.set_tool_tip(self.monitor, "Monitor Runner", "")
+        StyleHelper.set_tool_tip(self.resume, "Resume Last Run", "")
         WidgetFactory.create_icon(
             self.start,
             ":/images/play.png",
@@ -383,6 +400,8 @@ class RulesPageView(QWidget):
         self.stop.setHidden(True)
         self.start.setChecked(True)
         self.start.setProperty("page_action", RULESPAGEEVENT.START_RUNNER)
+        self.resume.setFixedHeight(30)
+        self.resume.setProperty("page_action", RULESPAGEEVENT.RESUME_RUNNER)
         self.progress_bar = QProgressBar(self)
         self.progress_bar.setHidden(True)
         bottom_h_layout = QHBoxLayout()
@@ -393,6 +412,7 @@ class RulesPageView(QWidget):
         thread_controls = QHBoxLayout()
         thread_controls.addWidget(self.monitor)
         thread_controls.addWidget(self.start)
+        thread_controls.addWidget(self.resume)
         thread_controls.addWidget(self.stop)
         thread_controls.setSpacing(1)
         thread_controls.setContentsMargins(0, 0, 0, 0)
@@ -409,9 +429,11 @@ class RulesPageView(QWidget):
             self.stop.setHidden(False)
             self.progress_bar.setHidden(False)
             self.start.setDisabled(True)
+            self.resume.setDisabled(True)
         if state == RULERUNNERLIFECYCLE.FINISHED:
             self.stop.setHidden(True)
             self.start.setDisabled(False)
+            self.resume.setDisabled(False)
             QTimer.singleShot(5000, lambda: self.progress_bar.setHidden(True))
 
     @Slot(int, int)
@@ -423,14 +445,25 @@ class RulesPageView(QWidget):
         self.progress_bar.setRange(0, total)
         self.progress_bar.setValue(current)
 
+    @Slot(int, int)
+    def set_validation_progress(self, validated: int, total: int) -> None:
+        """
+        Shows validation progress on the progress bar. Once validation is
+        done the bar is hidden again unless a runner has started using it.
+        """
+        self.set_progress_bar(validated, total)
+        if validated >= total:
+            QTimer.singleShot(
+                5000, lambda: self.progress_bar.setHidden(self.start.isEnabled())
+            )
+
     @Slot(object)
     def update_form_validation(self, errors_result: ValidationRulesResult):
         all_errors = []
         for guid, errors in errors_result.errors_by_rule.items():
-            form = self.stacked_widget.get_form_by_guid(guid)
-            if form:
+            if self.stacked_widget.has_rule(guid):
                 all_errors.extend(errors)
-                form.highlight_errors(errors)
+        self.stacked_widget.set_errors(errors_result.errors_by_rule)
 
         self._form_errors = all_errors
         if all_errors:
@@ -477,16 +510,13 @@ class RulesPageView(QWidget):
             return RulesPageAction[str](action, guid)
 
         if action == RULESPAGEEVENT.CLONE_RULE:
-            form = self.stacked_widget.get_form_by_index(
-                self.stacked_widget.currentIndex()
-            )
-            return RulesPageAction[str](action, form.guid)
+            return RulesPageAction[str](action, self.stacked_widget.current_guid())
 
         if action == RULESPAGEEVENT.BOOKMARK_RULES:
             self.rule_set_dialog.show()
             return
 
-        if action == RULESPAGEEVENT.STOP_RUNNER:
+        if action in (RULESPAGEEVENT.STOP_RUNNER, RULESPAGEEVENT.RESUME_RUNNER):
             return RulesPageAction[None](action, None)
 
         if action == RULESPAGEEVENT.TOGGLE_DISPLAY_MONITOR:
@@ -520,17 +550,16 @@ class RulesPageView(QWidget):
             return
 
         to_copy_adapter = self.stacked_widget.get_form_by_guid(self._event_guid)
+        if to_copy_adapter is None:
+            return
         value = to_copy_adapter.field_registry.get_text_value(self._event_path)
 
-        rule_adapters = self.stacked_widget.get_form_factories()
-        for adapter in rule_adapters:
-            if adapter.guid == self._event_guid:
-                continue
-            adapter.field_registry.set_text_value(self._event_path, value)
+        self.stacked_widget.set_field_value(
+            self._event_path, value, skip_guid=self._event_guid
+        )
 
     def extract_forms_to_dict(self):
-        rule_forms = self.get_forms()
-        return {"rules": [form.to_validation_dict() for form in rule_forms]}
+        return {"rules": self.stacked_widget.to_validation_dicts()}
 
     def delete_all_forms(self) -> None:
         """Deletes all rule forms from the UI."""
@@ -545,11 +574,34 @@ class RulesPageView(QWidget):
         Updates the UI when the rules are changed.
         """
         self.stacked_widget.remove_all()
-        if not len(rules) - 1 > self.current_rule_index:
-            self.current_rule_index = 0
         self.set_up_rules(rules)
         self.rules_form_updated.emit()
 
+    @Slot(object)
+    def apply_rules_event(self, event: RulesLoadedEvent) -> None:
+        """
+        Applies a rules change from the controller. Resets rebuild the editor,
+        anything else only touches the forms of the rules that changed.
+        """
+        if event.reset:
+            self.rules_changed(event.added)
+            return
+
+        self.stacked_widget.apply_changes(
+            event.added,
+            event.updated,
+            event.removed,
+            event.order,
+            current_guid=self.previous_guid,
+        )
+        if self.stacked_widget.rule_count():
+            self.stacked_widget.remove_by_name("No-Rules-Widget")
+        elif self.stacked_widget.get_widget_by_name("No-Rules-Widget") is None:
+            self.setup_no_rules_widget()
+        self.update_navigation_buttons()
+        self.set_disable_action_btns()
+        self.rules_form_updated.emit()
+
     def set_hidden_errors_dialog_btn(self, state: bool) -> None:
         """
         Sets the visibility of the error dialog button.
@@ -558,7 +610,8 @@ class RulesPageView(QWidget):
 
     def get_forms(self) -> List[RuleAdapter]:
         """
-        Retrieves the list of form objects currently displayed in the UI.
+        Retrieves the form objects currently built by the stacked widget. Only
+        the forms around the current rule are built at any time.
         """
         return self.stacked_widget.get_form_factories()
 
@@ -568,14 +621,11 @@ class RulesPageView(QWidget):
 
     def on_delete_rule(self) -> str:
         """Handles the deletion of a rule from the UI."""
-        if self.stacked_widget.get_form_factories():
-            current_index = self.stacked_widget.currentIndex()
-            rule_form = self.stacked_widget.get_form_by_index(current_index)
+        guid = self.stacked_widget.current_guid()
+        if guid:
+            current_index = self.stacked_widget.current_rule_index()
             if current_index > 0:
-                previous_form = self.stacked_widget.get_form_by_index(current_index - 1)
-                self.previous_guid = previous_form.guid
-            guid = rule_form.guid
-            self.delete_all_forms()
+                self.previous_guid = self.stacked_widget.guid_at(current_index - 1)
         return guid
 
     def set_disable_action_btns(self) -> None:
@@ -594,7 +644,7 @@ class RulesPageView(QWidget):
             self.bookmark,
         ]
         for btn in actions_buttons:
-            if self.stacked_widget.get_form_factories():
+            if self.stacked_widget.rule_count():
                 btn.setDisabled(False)
 
             else:
@@ -606,17 +656,10 @@ class RulesPageView(QWidget):
         """
         if rules:
             self.stacked_widget.remove_by_name("No-Rules-Widget")
-            rule_factory = RuleAdapterFactory(self.event_filter)
-            for rule in rules:
-                adapter = rule_factory.build(rule)
-                self.stacked_widget.add_form(adapter)
-            if self.previous_guid:
-                index = self.stacked_widget.get_widget_index_by_guid(self.previous_guid)
-                if index > -1:
-                    self.stacked_widget.setCurrentIndex(index)
+            # Forms are built lazily around the current rule.
+            self.stacked_widget.set_rules(rules, self.previous_guid)
             self.update_navigation_buttons()
-        else:
-
+        elif self.stacked_widget.get_widget_by_name("No-Rules-Widget") is None:
             self.setup_no_rules_widget()
         self.set_disable_action_btns()
 
@@ -639,14 +682,13 @@ class RulesPageView(QWidget):
     def update_navigation_buttons(self) -> None:
         """Updates the state of the navigation buttons (previous/next)."""
 
-        self.current_rule_index = self.stacked_widget.currentIndex()
+        self.current_rule_index = max(self.stacked_widget.current_rule_index(), 0)
+        rule_count = self.stacked_widget.rule_count()
         self.prev_button.setDisabled(self.current_rule_index == 0)
-        self.next_button.setDisabled(
-            self.current_rule_index >= self.stacked_widget.count() - 1
-        )
-        if self.stacked_widget.count() > 0:
+        self.next_button.setDisabled(self.current_rule_index >= rule_count - 1)
+        if rule_count > 0:
             self.nav_label.setText(
-                f"Rule: {self.stacked_widget.currentIndex() +1} / {self.stacked_widget.count()}"
+                f"Rule: {self.current_rule_index + 1} / {rule_count}"
             )
         else:
             self.nav_label.setText("")
@@ -655,21 +697,17 @@ class RulesPageView(QWidget):
         """Navigates to the previous rule in the UI."""
         if self.current_rule_index > 0:
             self.current_rule_index -= 1
-            self.stacked_widget.setCurrentIndex(self.current_rule_index)
-            self.previous_guid = self.stacked_widget.get_form_by_index(
-                self.current_rule_index
-            ).guid
+            self.stacked_widget.show_rule(self.current_rule_index)
+            self.previous_guid = self.stacked_widget.current_guid()
 
         self.update_navigation_buttons()
 
     def show_next_rule(self) -> None:
         """Navigates to the next rule in the UI."""
-        if self.current_rule_index < self.stacked_widget.count() - 1:
+        if self.current_rule_index < self.stacked_widget.rule_count() - 1:
             self.current_rule_index += 1
-            self.stacked_widget.setCurrentIndex(self.current_rule_index)
-            self.previous_guid = self.stacked_widget.get_form_by_index(
-                self.current_rule_index
-            ).guid
+            self.stacked_widget.show_rule(self.current_rule_index)
+            self.previous_guid = self.stacked_widget.current_guid()
 
             self.prev_button.setDisabled(False)
         self.update_navigation_buttons()